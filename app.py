@@ -1,269 +1,78 @@
 """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                 ║
-║          app.py - Streamlit Arayüzü + Tarama Motoru                         ║
+║          app.py - Streamlit Arayüzü (tarama motoru: tarama.py)               ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
-import yfinance as yf
 import pandas as pd
-import numpy as np
 import streamlit as st
-import plotly.graph_objects as go
 import plotly.express as px
+import os
 import time
 import warnings
 from datetime import datetime
 
-warnings.filterwarnings('ignore')
-
-# ─────────────────────────────────────────────────────────────────────────────
-# BIST HİSSE LİSTESİ
-# ─────────────────────────────────────────────────────────────────────────────
-
-BIST_LISTESI = [
-    "AKBNK.IS", "GARAN.IS", "HALKB.IS", "ISCTR.IS", "VAKBN.IS", "YKBNK.IS",
-    "QNBFB.IS", "TSKB.IS", "ALBRK.IS", "KLNMA.IS",
-    "KCHOL.IS", "SAHOL.IS", "SISE.IS", "KOZAA.IS", "KOZAL.IS", "TUPRS.IS",
-    "EREGL.IS", "ARCLK.IS", "BIMAS.IS", "MIGROS.IS", "TCELL.IS",
-    "THYAO.IS", "PGSUS.IS", "ULKER.IS", "AEFES.IS",
-    "ENKAI.IS", "AYGAZ.IS", "DOHOL.IS", "PETKM.IS", "GUBRF.IS", "EKGYO.IS",
-    "TOASO.IS", "FROTO.IS", "OTKAR.IS", "TTRAK.IS",
-    "ASELS.IS", "LOGO.IS", "NETAS.IS", "KAREL.IS", "ARENA.IS",
-    "ISGYO.IS", "TRGYO.IS", "ALGYO.IS",
-    "ECILC.IS", "DEVA.IS", "ECZYT.IS",
-    "KRDMD.IS", "CIMSA.IS", "AKCNS.IS", "BOLUC.IS",
-    "TTKOM.IS", "VESBE.IS", "BRISA.IS",
-    "TRKCM.IS", "SODA.IS", "BAGFS.IS",
-    "HEKTS.IS", "BIZIM.IS", "TAVHL.IS",
-    "AKSEN.IS", "ZOREN.IS", "CLEBI.IS",
-    "AGESA.IS", "AKSA.IS", "SOKM.IS", "MAVI.IS",
-]
-BIST_LISTESI = list(set(BIST_LISTESI))
+from veri import YahooSaglayici, CSVSaglayici
+from onbellek import OnbellekliSaglayici
+from puanlama import (
+    etiketler_ekle, disa_aktarim_tablosu, goruntu_metinleri, karsilastirma_kolonu,
+    kural_imzasi, profil_karsilastirmasi, puan_tablosu_stili, TABLO_KOLONLARI,
+)
+from profiller import (
+    PROFIL_DOSYASI, TEMEL_BILESENLER, VARSAYILAN_PROFIL_ADI, PuanProfili,
+    profilleri_yukle,
+)
+from tarama import BIST_LISTESI, evren_yukle, tara_akisi, sonuclari_birlestir
+from sonuc_onbellegi import TaramaOnbellegi, TaramaKesildi
+from olcum import NEDENLER, TaramaOlcumu
+from zaman_dilimi import ZAMAN_DILIMLERI, dilim_kolonlari
+from kesitsel import ENDEKS, RG_VADESI, kesitsel_kolonlari, sektor_ozeti
+from gecmis import VARSAYILAN_YOL as VARSAYILAN_GECMIS, TaramaGecmisi, liste_imzasi
+from artimli import VARSAYILAN_DIZIN as VARSAYILAN_DURUM_DIZINI, GostergeDurumu, durum_yolu
+from grafikler import (
+    AL_SAYFA_BOYUTU, TABLO_SAYFA_BOYUTLARI, bilesen_grafigi, isi_haritasi, sayfala,
+)
 
+warnings.filterwarnings('ignore')
 
-# ─────────────────────────────────────────────────────────────────────────────
-# GÖSTERGE HESAPLAMA FONKSİYONLARI
-# ─────────────────────────────────────────────────────────────────────────────
 
-def hesapla_rsi(fiyatlar: pd.Series, periyot: int = 14) -> float:
-    delta = fiyatlar.diff()
-    kazan = delta.clip(lower=0)
-    kayip = -delta.clip(upper=0)
-    ort_kazan = kazan.ewm(com=periyot - 1, adjust=False).mean()
-    ort_kayip = kayip.ewm(com=periyot - 1, adjust=False).mean()
-    rs = ort_kazan / ort_kayip
-    rsi = 100 - (100 / (1 + rs))
-    return rsi.iloc[-1]
-
-
-def hesapla_macd(fiyatlar: pd.Series, hizli=12, yavas=26, sinyal=9):
-    ema_hizli = fiyatlar.ewm(span=hizli, adjust=False).mean()
-    ema_yavas = fiyatlar.ewm(span=yavas, adjust=False).mean()
-    macd_serisi = ema_hizli - ema_yavas
-    sinyal_serisi = macd_serisi.ewm(span=sinyal, adjust=False).mean()
-    histogram = macd_serisi - sinyal_serisi
-    return (
-        macd_serisi.iloc[-1],
-        sinyal_serisi.iloc[-1],
-        histogram.iloc[-1],
-        histogram.iloc[-2] if len(histogram) > 1 else 0
+@st.cache_resource
+def paylasimli_onbellek() -> TaramaOnbellegi:
+    # Süreç genelinde tek örnek: tüm oturumlar aynı sonuç önbelleğini paylaşır
+    return TaramaOnbellegi(
+        max_kayit=int(os.environ.get("TARAMA_ONBELLEK_KAYIT", 32)),
+        max_bellek_mb=float(os.environ.get("TARAMA_ONBELLEK_MB", 256)),
     )
 
 
-def hesapla_atr(df: pd.DataFrame, periyot: int = 14) -> float:
-    yuksek = df['High']
-    dusuk = df['Low']
-    kapanis = df['Close']
-    tr1 = yuksek - dusuk
-    tr2 = abs(yuksek - kapanis.shift())
-    tr3 = abs(dusuk - kapanis.shift())
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = true_range.ewm(span=periyot, adjust=False).mean()
-    return atr.iloc[-1]
+@st.cache_resource
+def tarama_gecmisi() -> TaramaGecmisi:
+    return TaramaGecmisi(os.environ.get("TARAMA_GECMISI", VARSAYILAN_GECMIS))
 
 
-def hesapla_ma(fiyatlar: pd.Series, periyot: int) -> float:
-    if len(fiyatlar) < periyot:
-        return np.nan
-    return fiyatlar.rolling(window=periyot).mean().iloc[-1]
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# PUANLAMA FONKSİYONLARI
-# ─────────────────────────────────────────────────────────────────────────────
+@st.cache_resource
+def puan_profilleri() -> dict[str, PuanProfili]:
+    return profilleri_yukle(os.environ.get("PUAN_PROFILLERI", PROFIL_DOSYASI))
 
-def puan_pddd(pddd):
-    if pddd is None or (isinstance(pddd, float) and np.isnan(pddd)) or pddd <= 0:
-        return 0, "Veri yok"
-    ref = 2.0
-    if pddd < 1.0:   return 15, f"Çok Ucuz ({pddd:.2f})"
-    elif pddd < 1.5: return 12, f"Ucuz ({pddd:.2f})"
-    elif pddd < ref: return 8,  f"Makul ({pddd:.2f})"
-    elif pddd < ref * 3: return 3, f"Pahalı ({pddd:.2f})"
-    else:            return 0,  f"Çok Pahalı ({pddd:.2f})"
-
-
-def puan_fk(fk):
-    if fk is None or (isinstance(fk, float) and np.isnan(fk)) or fk <= 0:
-        return 0, "Zarar / Veri yok"
-    ref = 18.0
-    if fk < 10:      return 15, f"Çok Ucuz ({fk:.1f}x)"
-    elif fk < 15:    return 12, f"Ucuz ({fk:.1f}x)"
-    elif fk < ref:   return 8,  f"Makul ({fk:.1f}x)"
-    elif fk < ref*2: return 3,  f"Pahalı ({fk:.1f}x)"
-    else:            return 0,  f"Çok Pahalı ({fk:.1f}x)"
-
-
-def puan_kar_buyumesi(buyume):
-    if buyume is None or (isinstance(buyume, float) and np.isnan(buyume)):
-        return 3, "Veri yok"
-    if buyume > 50:  return 10, f"Güçlü Büyüme (%{buyume:.0f})"
-    elif buyume > 20: return 8, f"İyi Büyüme (%{buyume:.0f})"
-    elif buyume > 0:  return 5, f"Zayıf Büyüme (%{buyume:.0f})"
-    else:             return 0, f"Küçülme (%{buyume:.0f})"
-
-
-def puan_trend(fiyat, ma50, ma200):
-    if np.isnan(ma50) or np.isnan(ma200):
-        return 0, "MA verisi yok", False
-    f_ma50  = fiyat > ma50
-    f_ma200 = fiyat > ma200
-    ma50_ma200 = ma50 > ma200
-    if f_ma50 and f_ma200 and ma50_ma200:
-        return 15, "Güçlü Trend ↑ (Golden)", True
-    elif f_ma50 and f_ma200:
-        return 10, "Pozitif Trend ↑", True
-    elif f_ma200 and not f_ma50:
-        return 5, "Zayıf / Konsolidasyon", True
-    else:
-        return 0, "Düşüş Trendi ↓ (ELENDİ)", False
-
-
-def puan_rsi(rsi):
-    if np.isnan(rsi): return 5, "Veri yok"
-    if rsi < 30:      return 3,  f"Aşırı Satım ({rsi:.1f})"
-    elif rsi < 50:    return 7,  f"Nötr ({rsi:.1f})"
-    elif rsi < 65:    return 15, f"İdeal Bölge ✓ ({rsi:.1f})"
-    elif rsi < 70:    return 10, f"Güçlü ({rsi:.1f})"
-    elif rsi < 80:    return 3,  f"Aşırı Alım ({rsi:.1f})"
-    else:             return 0,  f"Tehlikeli ({rsi:.1f})"
-
-
-def puan_macd(macd, sinyal, histogram, onceki_hist):
-    if any(np.isnan(v) for v in [macd, sinyal, histogram, onceki_hist]):
-        return 5, "Veri yok"
-    pozitif  = macd > sinyal
-    hist_poz = histogram > 0
-    hist_art = histogram > onceki_hist
-    if pozitif and hist_poz and hist_art: return 15, "Güçlü Momentum ✓ ↑"
-    elif pozitif and hist_poz:            return 10, "Pozitif (zayıflıyor)"
-    elif pozitif:                         return 7,  "Üstte ama dikkat"
-    elif hist_art:                        return 5,  "Dönüş Sinyali?"
-    else:                                 return 0,  "Negatif Momentum ↓"
-
-
-def puan_hacim(h5, h20):
-    if h20 == 0 or np.isnan(h5) or np.isnan(h20): return 3, "Veri yok"
-    oran = h5 / h20
-    if oran > 2.0:   return 10, f"Çok Yüksek ({oran:.1f}x)"
-    elif oran > 1.5: return 8,  f"Yüksek ({oran:.1f}x)"
-    elif oran > 1.0: return 6,  f"Ortalama Üstü ({oran:.1f}x)"
-    elif oran > 0.7: return 3,  f"Normal ({oran:.1f}x)"
-    else:            return 0,  f"Düşük ({oran:.1f}x)"
-
-
-def puan_atr(atr, fiyat):
-    if fiyat <= 0 or np.isnan(atr) or np.isnan(fiyat): return 2, "Veri yok"
-    vlt = (atr / fiyat) * 100
-    if vlt < 1:      return 0, f"Hareketsiz (%{vlt:.1f})"
-    elif vlt < 2:    return 2, f"Düşük (%{vlt:.1f})"
-    elif vlt < 5:    return 5, f"İdeal ✓ (%{vlt:.1f})"
-    elif vlt < 8:    return 3, f"Yüksek (%{vlt:.1f})"
-    else:            return 1, f"Çok Yüksek (%{vlt:.1f})"
 
+def puan_dagilimi(profil: PuanProfili) -> str:
+    """Profilin grup ve bileşen maksimumları (kenar çubuğu özeti)."""
+    satirlar = []
+    for grup, baslik, bilesenler in [("temel", "Temel Analiz", TEMEL_BILESENLER),
+                                     ("teknik", "Teknik Analiz", profil.teknik_bilesenler)]:
+        satirlar.append(f"**{baslik} ({profil.grup_maks[grup]} puan)**")
+        satirlar += [f"- {profil.adlar[b]} → {profil.maks[b]}p"
+                     + (" *(Zorunlu)*" if profil.kapili(b) else "") for b in bilesenler]
+        satirlar.append("")
+    return "\n".join(satirlar)
 
-# ─────────────────────────────────────────────────────────────────────────────
-# ANA ANALİZ FONKSİYONU
-# ─────────────────────────────────────────────────────────────────────────────
 
-def hisse_analiz_et(ticker: str) -> dict | None:
-    try:
-        hisse = yf.Ticker(ticker)
-        df = hisse.history(period="1y", interval="1d")
-
-        if df is None or len(df) < 50:
-            return None
-
-        kapanis = df['Close']
-        son_fiyat = kapanis.iloc[-1]
-        if son_fiyat <= 0:
-            return None
-
-        ma50  = hesapla_ma(kapanis, 50)
-        ma200 = hesapla_ma(kapanis, 200)
-        rsi   = hesapla_rsi(kapanis)
-        macd_val, sinyal_val, hist_val, onceki_hist = hesapla_macd(kapanis)
-        atr_val = hesapla_atr(df)
-
-        hacim = df['Volume']
-        h5  = hacim.tail(5).mean()
-        h20 = hacim.tail(20).mean()
-
-        # Temel veriler
-        try:
-            info = hisse.info
-            pddd   = info.get('priceToBook', np.nan)
-            fk     = info.get('trailingPE', np.nan)
-            sektor = info.get('sector', 'Bilinmiyor')
-            buyume = info.get('earningsQuarterlyGrowth', np.nan)
-            if buyume is not None and not (isinstance(buyume, float) and np.isnan(buyume)):
-                buyume = float(buyume) * 100
-            else:
-                yillik = info.get('earningsGrowth', np.nan)
-                buyume = float(yillik) * 100 if yillik and not (isinstance(yillik, float) and np.isnan(yillik)) else np.nan
-        except Exception:
-            pddd, fk, sektor, buyume = np.nan, np.nan, "Bilinmiyor", np.nan
-
-        # Puanlar
-        p_pddd, a_pddd   = puan_pddd(pddd)
-        p_fk,   a_fk     = puan_fk(fk)
-        p_kar,  a_kar    = puan_kar_buyumesi(buyume)
-        p_trend, a_trend, trend_gecti = puan_trend(son_fiyat, ma50, ma200)
-        p_rsi,  a_rsi    = puan_rsi(rsi)
-        p_macd, a_macd   = puan_macd(macd_val, sinyal_val, hist_val, onceki_hist)
-        p_hacim,a_hacim  = puan_hacim(h5, h20)
-        p_atr,  a_atr    = puan_atr(atr_val, son_fiyat)
-
-        temel   = p_pddd + p_fk + p_kar
-        teknik  = (p_trend + p_rsi + p_macd + p_hacim + p_atr) if trend_gecti else 0
-        toplam  = temel + teknik
-
-        return {
-            "Ticker": ticker.replace(".IS", ""),
-            "Fiyat": round(son_fiyat, 2),
-            "MA50":  round(ma50, 2)  if not np.isnan(ma50)  else None,
-            "MA200": round(ma200, 2) if not np.isnan(ma200) else None,
-            "RSI":   round(rsi, 1),
-            "PD/DD": round(float(pddd), 2) if pddd and not (isinstance(pddd, float) and np.isnan(pddd)) else None,
-            "F/K":   round(float(fk), 1)   if fk   and not (isinstance(fk, float)   and np.isnan(fk))   else None,
-            "Sektör": sektor,
-            "Trend Geçti": "✅ Evet" if trend_gecti else "❌ Hayır",
-            "P_PDDD": p_pddd, "A_PDDD": a_pddd,
-            "P_FK":   p_fk,   "A_FK":   a_fk,
-            "P_Kar":  p_kar,  "A_Kar":  a_kar,
-            "P_Trend":p_trend,"A_Trend":a_trend,
-            "P_RSI":  p_rsi,  "A_RSI":  a_rsi,
-            "P_MACD": p_macd, "A_MACD": a_macd,
-            "P_Hacim":p_hacim,"A_Hacim":a_hacim,
-            "P_ATR":  p_atr,  "A_ATR":  a_atr,
-            "Temel":  temel,
-            "Teknik": teknik,
-            "Toplam": toplam,
-        }
-
-    except Exception:
-        return None
+@st.cache_resource
+def gosterge_durumu(kaynak_kimligi: str) -> tuple[GostergeDurumu, str]:
+    # Kaynak başına tek örnek: gün içi yeniden taramalar yalnızca son barı işler
+    yol = durum_yolu(kaynak_kimligi, dizin=os.environ.get("GOSTERGE_DURUMU", VARSAYILAN_DURUM_DIZINI))
+    return GostergeDurumu.yukle(yol), str(yol)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -306,9 +115,6 @@ st.markdown("""
 
 # ── Başlık ────────────────────────────────────────────────────────────────────
 st.markdown('<p class="main-title">📈 BIST Swing Trade Scanner</p>', unsafe_allow_html=True)
-st.caption(f"1 Aylık Vade · 100 Puan Sistemi · Temel %40 + Teknik %60 · {datetime.now().strftime('%d.%m.%Y')}")
-st.divider()
-
 # ── Kenar Çubuğu (Ayarlar) ────────────────────────────────────────────────────
 with st.sidebar:
     st.header("⚙️ Tarama Ayarları")
@@ -319,12 +125,42 @@ with st.sidebar:
         help="Bu puanın üzerindeki hisseler AL listesine girer."
     )
 
+    profiller = puan_profilleri()
+    profil_adi = st.selectbox(
+        "🎯 Puan Profili", list(profiller),
+        index=list(profiller).index(VARSAYILAN_PROFIL_ADI),
+        format_func=lambda ad: profiller[ad].baslik,
+        help="\n\n".join(f"**{p.baslik}:** {p.aciklama}" for p in profiller.values()),
+    )
+    profil = profiller[profil_adi]
+    karsilastirma_adlari = st.multiselect(
+        "Yan yana karşılaştır", [ad for ad in profiller if ad != profil_adi],
+        format_func=lambda ad: profiller[ad].baslik,
+        help="Seçilen profiller aynı taramada ek bir geçişle puanlanır."
+    )
+    karsilastirma = [profiller[ad] for ad in karsilastirma_adlari]
+    zaman_dilimleri = st.multiselect(
+        "⏱️ Ek zaman dilimleri", list(ZAMAN_DILIMLERI),
+        format_func=lambda d: ZAMAN_DILIMLERI[d]["baslik"],
+        help="Haftalık ve aylık barlar indirilen günlük veriden örneklenir; saatlik barlar "
+             "tüm liste için tek istekle gelir. Toplam puan günlük dilime göredir."
+    )
+    rg_profili = any("RG" in p.bantlar for p in [profil, *karsilastirma])
+    kesitsel = st.checkbox(
+        "🏭 Göreli güç ve sektör sırası", value=rg_profili, disabled=rg_profili,
+        help=f"Son {RG_VADESI} barda {ENDEKS.removesuffix('.IS')}'e ve sektör medyanına göre "
+             "göreli güç ile sektör içi puan yüzdeliği. Endeks aynı fiyat isteğine eklenir. "
+             "Göreli güç puanlayan profillerde her zaman açıktır."
+    ) or rg_profili
+
     st.markdown("---")
     st.subheader("📋 Hisse Listesi")
     liste_secimi = st.radio(
         "Hangi listeyi tara?",
-        ["Hazır Liste (Hızlı)", "Özel Liste"],
-        help="Özel liste seçersen aşağıya kendi hisselerini girebilirsin."
+        ["Hazır Liste (Hızlı)", "Tüm BIST Evreni", "Özel Liste"],
+        help="Tüm evren bist_evren.csv'deki ~550 hisseyi tek istekte indirip vektörel "
+             "olarak tarar. "
+             "Özel liste seçersen aşağıya kendi hisselerini girebilirsin."
     )
 
     if liste_secimi == "Özel Liste":
@@ -336,68 +172,286 @@ with st.sidebar:
         secili_liste = [t.strip().upper() + ".IS" for t in ozel_input.split(",") if t.strip()]
         if not secili_liste:
             st.warning("En az bir hisse kodu gir.")
+    elif liste_secimi == "Tüm BIST Evreni":
+        secili_liste = evren_yukle()
     else:
         secili_liste = BIST_LISTESI
 
     st.markdown(f"**Taranacak hisse:** `{len(secili_liste)}`")
+    tam_analiz = st.multiselect(
+        "Her zaman tam analiz et",
+        sorted(secili_liste),
+        help="Eşiğe ulaşamayacak hisselerin temel verisi çekilmez (budanır). "
+             "Buradakiler yine de tam analiz edilir."
+    )
+    st.markdown("---")
+
+    st.subheader("🗄️ Veri Kaynağı")
+    kaynak_secimi = st.radio(
+        "Fiyat ve temel veri nereden gelsin?",
+        ["Yahoo Finance", "Yerel CSV (Çevrimdışı)"],
+        help="Yerel CSV: her hisse için <TICKER>.csv ve isteğe bağlı temel.csv içeren dizin."
+    )
+    if kaynak_secimi == "Yerel CSV (Çevrimdışı)":
+        csv_dizini = st.text_input("Fixture dizini", value="veri_fixture")
+        saglayici = CSVSaglayici(csv_dizini)
+        kaynak_kimligi = f"csv:{csv_dizini}"
+    else:
+        saglayici = YahooSaglayici()
+        kaynak_kimligi = "yahoo"
+
+    onbellek_kullan = st.checkbox(
+        "Yerel önbellek (fiyat + temel)", value=True,
+        help="Fiyat geçmişi ve temel veriler kaynak başına diskte tutulur; sonraki taramalarda "
+             "yalnızca yeni barlar ve süresi dolan temel alanlar indirilir."
+    )
+    tazelik_dk = 15
+    if onbellek_kullan:
+        tazelik_dk = st.number_input("Tazelik süresi (dakika)", min_value=0, value=15, step=5)
+        saglayici = OnbellekliSaglayici(saglayici, tazelik=pd.Timedelta(minutes=tazelik_dk))
+        if st.button("🗑️ Listenin önbelleğini temizle",
+                     help="Bölünme / düzeltme sonrası seçili hisselerin geçmişini baştan indirir."):
+            saglayici.gecersiz_kil(secili_liste)
+            st.success(f"{len(secili_liste)} hissenin önbelleği temizlendi.")
+
+    zorla_yenile = st.checkbox(
+        "Paylaşılan sonucu atla",
+        help="Diğer oturumların son tarama sonucunu kullanmak yerine yeniden tarar."
+    )
+    with st.expander("Paylaşılan sonuç önbelleği"):
+        st.json(paylasimli_onbellek().ozet())
     st.markdown("---")
 
     st.subheader("📊 Puan Dağılımı")
-    st.markdown("""
-    **Temel Analiz (40 puan)**
-    - PD/DD → 15p
-    - F/K   → 15p
-    - Kar Büyümesi → 10p
-
-    **Teknik Analiz (60 puan)**
-    - Trend (MA50/200) → 15p *(Zorunlu)*
-    - RSI → 15p
-    - MACD → 15p
-    - Hacim → 10p
-    - ATR → 5p
-    """)
+    st.caption(profil.aciklama)
+    st.markdown(puan_dagilimi(profil))
+
+st.caption(f"1 Aylık Vade · 100 Puan Sistemi · {profil.baslik}: Temel %{profil.grup_maks['temel']} "
+           f"+ Teknik %{profil.grup_maks['teknik']} · {datetime.now().strftime('%d.%m.%Y')}")
+st.divider()
 
 # ── Tarama Butonu ─────────────────────────────────────────────────────────────
-col_btn, col_info = st.columns([1, 3])
+col_btn, col_dur, col_info = st.columns([1, 1, 3])
 with col_btn:
     tara_btn = st.button("🚀 Taramayı Başlat", type="primary", use_container_width=True)
 
+with col_dur:
+    # Herhangi bir tıklama süren çalıştırmayı keser; kısmi sonuç session_state'te kalır
+    st.button("⏹ Durdur", use_container_width=True,
+              help="Süren taramayı durdurur; o ana kadar puanlanan hisseler korunur.")
+
 with col_info:
-    st.info("⏱ Her hisse yaklaşık 0.3 saniye sürer. Hazır liste ~20 saniyede tamamlanır.")
+    st.info("⏱ Fiyatlar tek istekte indirilir; temel veriler paralel çekilip bir günlük "
+            "önbelleğe alınır. Sonuçlar puanlandıkça listelenir.")
 
 # ── Tarama ────────────────────────────────────────────────────────────────────
-if tara_btn:
+# Sonuçlar session_state'te tutulur: yalnızca filtreyi değiştiren widget'lar
+# yeniden taramaya yol açmaz. Liste, kaynak, veri günü ya da puan kuralları
+# (profil ve karşılaştırılan profiller dahil) değişince (veya buton basılınca)
+# yeniden taranır. Eşiği değiştirmek mevcut sonucu süzer; budama eşiğinin
+# altına düşürmek budanan hisselerin temel verisini ister, bu yüzden otomatik
+# değil yalnızca butonla yeniden taranır (o zamana dek uyarı gösterilir).
+temel_anahtar = (
+    tuple(sorted(secili_liste)),
+    kaynak_kimligi,
+    onbellek_kullan,
+    datetime.now().date().isoformat(),
+    kural_imzasi(profil),
+    tuple((p.ad, p.imza) for p in karsilastirma),
+    tuple(zaman_dilimleri),
+    kesitsel,
+    tuple(sorted(tam_analiz)),
+)
+onceki_tarama = st.session_state.get("tarama")
+budama_esigi = min_puan
+if onceki_tarama is not None and onceki_tarama["anahtar"][:-1] == temel_anahtar:
+    onceki_esik = onceki_tarama["anahtar"][-1]
+    budanan_var = "Budandı" in onceki_tarama["df"] and bool(onceki_tarama["df"]["Budandı"].any())
+    if onceki_esik <= min_puan or not (tara_btn and budanan_var):
+        budama_esigi = onceki_esik
+tarama_anahtari = (*temel_anahtar, budama_esigi)
+girdiler_degisti = onceki_tarama is not None and onceki_tarama["anahtar"] != tarama_anahtari
+
+if tara_btn or (girdiler_degisti and secili_liste):
     if not secili_liste:
         st.error("Lütfen önce hisse listesi seç veya özel liste gir.")
         st.stop()
 
     st.divider()
-    
+
     # Progress bar
     progress_bar  = st.progress(0, text="Tarama başlıyor...")
-    durum_yazisi  = st.empty()
-    
-    sonuclar = []
 
-    for i, ticker in enumerate(secili_liste):
-        yuzde = (i + 1) / len(secili_liste)
-        progress_bar.progress(yuzde, text=f"Analiz ediliyor: **{ticker}** ({i+1}/{len(secili_liste)})")
-        durum_yazisi.caption(f"🔍 {ticker} işleniyor...")
-
-        sonuc = hisse_analiz_et(ticker)
-        if sonuc:
-            sonuclar.append(sonuc)
-
-        time.sleep(0.3)
+    def ilerleme(oran, mesaj):
+        progress_bar.progress(oran, text=mesaj)
+
+    def beklerken():
+        progress_bar.progress(0.0, text="⏳ Aynı tarama başka bir oturumda sürüyor, sonucu bekleniyor...")
+
+    canli_ozet = st.empty()
+    canli_tablo = st.empty()
+
+    def tarama_yap():
+        olcum = TaramaOlcumu()
+        parcalar = []
+        # İlk parçadan önce durdurulursa eski sonuç yerine boş kısmi sonuç kalır
+        # (aksi halde girdiler_degisti taramayı hemen yeniden başlatırdı)
+        st.session_state["tarama"] = {"anahtar": tarama_anahtari, "df": pd.DataFrame(),
+                                      "olcum": olcum, "zaman": datetime.now(), "tamam": False}
+        artimli, durum_dosyasi = gosterge_durumu(kaynak_kimligi)
+        for parca in tara_akisi(secili_liste, saglayici, ilerleme=ilerleme, min_puan=budama_esigi,
+                                tam_liste=tam_analiz, olcum=olcum, durum=artimli,
+                                profil=profil, karsilastirma=karsilastirma,
+                                zaman_dilimleri=zaman_dilimleri, kesitsel=kesitsel,
+                                temel_onbellegi=onbellek_kullan):
+            parcalar.append(parca)
+            kismi = sonuclari_birlestir(parcalar)
+            # Durdur'a basılırsa yeniden çalıştırmada bu kısmi sonuç gösterilir
+            st.session_state["tarama"] = {"anahtar": tarama_anahtari, "df": kismi, "olcum": olcum,
+                                          "zaman": datetime.now(), "tamam": False}
+            canli_ozet.markdown(
+                f"**Canlı sonuçlar:** `{len(kismi)}` hisse puanlandı · "
+                f"⭐ AL adayı ({min_puan}+): `{int((kismi['Toplam'] >= min_puan).sum())}`"
+            )
+            canli_tablo.dataframe(goruntu_metinleri(kismi[TABLO_KOLONLARI]), hide_index=True,
+                                  use_container_width=True, height=300)
+        df = sonuclari_birlestir(parcalar)
+        artimli.kaydet(durum_dosyasi)
+        # Yalnızca tamamlanan taramalar geçmişe yazılır (paylaşılan sonuç bir kez)
+        if not df.empty:
+            tarama_gecmisi().ekle(df, liste_imzasi(secili_liste), kaynak_kimligi,
+                                  kural_imzasi(profil), budama_esigi)
+        return df, olcum
+
+    # Aynı liste + veri günü için süreç genelinde tek tarama
+    try:
+        (df, olcum), durum = paylasimli_onbellek().getir(
+            tarama_anahtari,
+            tarama_yap,
+            ttl=tazelik_dk * 60,
+            zorla=zorla_yenile,
+            beklerken=beklerken,
+        )
+    except TaramaKesildi:
+        progress_bar.empty()
+        st.warning("Beklenen tarama başlatan oturumda durduruldu. Yeniden başlatmak için butona bas.")
+    else:
+        st.session_state["tarama"] = {"anahtar": tarama_anahtari, "df": df, "olcum": olcum,
+                                      "zaman": datetime.now(), "tamam": True}
+        canli_ozet.empty()
+        canli_tablo.empty()
+        progress_bar.progress(1.0, text={
+            "tarandi":  "✅ Tarama tamamlandı!",
+            "bekledi":  "✅ Başka bir oturumun taraması tamamlandı, sonuç paylaşıldı.",
+            "onbellek": "✅ Güncel paylaşılan sonuç kullanıldı (yeni bar gelmedi).",
+        }[durum])
+
+
+def sayfa_sec(tablo: pd.DataFrame, boyut: int, anahtar: str) -> pd.DataFrame:
+    """Tablonun seçili sayfasını döndürür; tek sayfalık tablolarda seçici gösterilmez."""
+    _, sayfa_sayisi = sayfala(tablo, 1, boyut)
+    if sayfa_sayisi == 1:
+        return tablo
+    # Liste kısalınca eski sayfa numarası sınır dışında kalmasın
+    st.session_state[anahtar] = min(st.session_state.get(anahtar, 1), sayfa_sayisi)
+    sayfa = st.number_input(f"Sayfa (1-{sayfa_sayisi}, toplam {len(tablo)} satır)",
+                            min_value=1, max_value=sayfa_sayisi, step=1, key=anahtar)
+    return sayfala(tablo, sayfa, boyut)[0]
+
+
+def gecmis_paneli(imza: str, df: pd.DataFrame, min_puan: int):
+    """Aynı listenin önceki taramalarına göre puan seyri, AL giriş/çıkışları ve sıra değişimi."""
+    gecmis = tarama_gecmisi()
+    taramalar = gecmis.taramalar(imza)
+    if len(taramalar) < 2:
+        st.caption(f"Bu liste için {len(taramalar)} tarama kayıtlı; değişimler ikinci "
+                   f"taramadan sonra görünür.")
+        return
+
+    g1, g2 = st.columns([3, 1])
+    izlenen = g1.multiselect("İzlenen hisseler", df["Ticker"].astype(str).tolist(),
+                             default=df["Ticker"].astype(str).head(5).tolist())
+    son = g2.number_input("Son kaç tarama", min_value=2, max_value=len(taramalar),
+                          value=min(30, len(taramalar)))
+
+    seyir = gecmis.hisse_gecmisi(izlenen, imza, son)
+    if not seyir.empty:
+        fig = px.line(seyir, x="zaman", y="toplam", color="ticker", markers=True,
+                      labels={"zaman": "Tarama", "toplam": "Toplam Puan", "ticker": "Hisse"})
+        fig.add_hline(y=min_puan, line_dash="dash", line_color="#92FE9D")
+        fig.update_layout(
+            paper_bgcolor="rgba(0,0,0,0)",
+            plot_bgcolor="rgba(0,0,0,0)",
+            font=dict(color="white"),
+            height=300,
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    c1, c2 = st.columns(2)
+    with c1:
+        st.markdown(f"**AL listesine giren / çıkan ({min_puan}+)**")
+        st.dataframe(
+            gecmis.al_degisimleri(min_puan, imza, son).rename(columns={
+                "zaman": "Tarama", "ticker": "Ticker", "toplam": "Toplam",
+                "onceki": "Önceki", "sira": "Sıra", "degisim": "Değişim",
+            }),
+            hide_index=True, use_container_width=True, height=300,
+        )
+    with c2:
+        st.markdown("**Son iki tarama arası sıra değişimi**")
+        st.dataframe(
+            gecmis.sira_degisimleri(imza).rename(columns={
+                "ticker": "Ticker", "sira": "Sıra", "onceki_sira": "Önceki Sıra",
+                "sira_degisimi": "Sıra ±", "toplam": "Toplam", "puan_degisimi": "Puan ±",
+            }),
+            hide_index=True, use_container_width=True, height=300,
+        )
 
-    progress_bar.progress(1.0, text="✅ Tarama tamamlandı!")
-    durum_yazisi.empty()
 
-    if not sonuclar:
-        st.error("Hiçbir hisseden veri çekilemedi. İnternet bağlantını kontrol et.")
+def tanilama_paneli(olcum: TaramaOlcumu, cizim_suresi: float):
+    """Kenar çubuğunda aşama süreleri, eleme nedenleri ve JSONL indirme."""
+    cizim = {"cizim": cizim_suresi}
+    with st.sidebar:
+        with st.expander("🩺 Tarama Tanılama"):
+            st.dataframe(olcum.asama_tablosu(cizim), hide_index=True, use_container_width=True)
+            nedenler = olcum.neden_sayilari()
+            if nedenler:
+                st.markdown("\n".join(f"- {NEDENLER[n]}: `{s}`" for n, s in nedenler.most_common()))
+            st.dataframe(olcum.hisse_tablosu(), hide_index=True, use_container_width=True, height=250)
+            st.download_button(
+                "⬇️ Ölçümleri indir (JSONL)",
+                data=olcum.jsonl(cizim).encode("utf-8"),
+                file_name=f"bist_olcum_{olcum.kimlik}.jsonl",
+                mime="application/jsonl",
+            )
+
+
+tarama_sonucu = st.session_state.get("tarama")
+if tarama_sonucu is not None:
+    cizim_baslangici = time.perf_counter()
+    df = tarama_sonucu["df"]
+    if not tarama_sonucu.get("tamam", True):
+        st.warning(f"⏹ Tarama durduruldu: {len(df)} hisselik kısmi sonuç gösteriliyor. "
+                   f"Tamamlamak için 'Taramayı Başlat'a bas.")
+    if df.empty:
+        if tarama_sonucu.get("tamam", True):
+            st.error("Hiçbir hisseden veri çekilemedi. İnternet bağlantını kontrol et.")
+        tanilama_paneli(tarama_sonucu["olcum"], time.perf_counter() - cizim_baslangici)
         st.stop()
 
-    df = pd.DataFrame(sonuclar).sort_values("Toplam", ascending=False).reset_index(drop=True)
+    st.caption(f"🕒 Son tarama: {tarama_sonucu['zaman'].strftime('%H:%M:%S')} · "
+               f"Eşiği yükseltmek yeniden tarama gerektirmez; yenilemek için butona bas.")
+    budanan_sayisi = int(df["Budandı"].sum())
+    if budanan_sayisi:
+        budama = tarama_sonucu["anahtar"][-1]
+        st.caption(f"✂️ {budanan_sayisi} hisse temel verisi çekilmeden budandı: teknik puan "
+                   f"+ {profil.temel_ust_sinir} < {budama}. Temel ve Toplam "
+                   f"puanları boş bırakılır; ortalama, dağılım ve geçmiş sıralarına girmez.")
+        if min_puan < budama:
+            st.warning(f"⚠️ Eşik budama eşiğinin ({budama}) altında: budanan "
+                       f"{budanan_sayisi} hisse {min_puan}+ listesine girebilir ama temel verileri "
+                       f"çekilmedi. Eksiksiz liste için 'Taramayı Başlat'a bas.")
+
     al_listesi = df[df["Toplam"] >= min_puan]
 
     # ── Özet Metrikler ────────────────────────────────────────────────────────
@@ -406,10 +460,17 @@ if tara_btn:
 
     m1, m2, m3, m4, m5 = st.columns(5)
     m1.metric("Taranan Hisse",   len(df))
-    m2.metric("Trend Filtresi Geçen", (df["Trend Geçti"] == "✅ Evet").sum())
+    m2.metric("Trend Filtresi Geçen", int(df["Trend Geçti"].sum()))
     m3.metric(f"AL Listesi ({min_puan}+)", len(al_listesi))
-    m4.metric("Ortalama Puan",   f"{df['Toplam'].mean():.1f}")
-    m5.metric("En Yüksek Puan",  f"{df['Toplam'].max():.0f}")
+    # Budananların Toplam'ı NA: ortalama ve en yüksek yalnızca puanlananlardan
+    m4.metric("Ortalama Puan",   f"{df['Toplam'].astype(float).mean():.1f}")
+    m5.metric("En Yüksek Puan",  f"{df['Toplam'].astype(float).max():.0f}")
+    if "Uyum" in df:
+        dilimler = [ZAMAN_DILIMLERI[k.removeprefix("Uyum_")]["baslik"]
+                    for k in dilim_kolonlari(df) if k.startswith("Uyum_")]
+        st.caption(f"⏱️ Günlük + {', '.join(dilimler)} trend kapısı birlikte geçen: "
+                   f"`{int(df['Uyum'].sum())}` hisse, AL listesinde "
+                   f"`{int(al_listesi['Uyum'].sum())}`.")
 
     # ── AL Listesi ────────────────────────────────────────────────────────────
     st.divider()
@@ -418,80 +479,69 @@ if tara_btn:
     if al_listesi.empty:
         st.warning(f"Şu an {min_puan} puan ve üzeri hisse bulunamadı. Eşiği düşürmeyi dene.")
     else:
-        for _, row in al_listesi.iterrows():
-            with st.expander(
-                f"📈  {row['Ticker']}  |  {row['Fiyat']:.2f} TL  |  🏆 {row['Toplam']:.0f} / 100 puan  |  {row['Sektör']}",
-                expanded=False
-            ):
-                c1, c2 = st.columns(2)
-
-                with c1:
-                    st.markdown("**🔵 Temel Analiz**")
-                    st.markdown(f"- PD/DD `{row['P_PDDD']}/15` → {row['A_PDDD']}")
-                    st.markdown(f"- F/K `{row['P_FK']}/15` → {row['A_FK']}")
-                    st.markdown(f"- Kar Büyümesi `{row['P_Kar']}/10` → {row['A_Kar']}")
-                    st.markdown(f"**Temel Toplam: `{row['Temel']}/40`**")
-
-                with c2:
-                    st.markdown("**🟢 Teknik Analiz**")
-                    st.markdown(f"- Trend `{row['P_Trend']}/15` → {row['A_Trend']}")
-                    st.markdown(f"- RSI `{row['P_RSI']}/15` → {row['A_RSI']}")
-                    st.markdown(f"- MACD `{row['P_MACD']}/15` → {row['A_MACD']}")
-                    st.markdown(f"- Hacim `{row['P_Hacim']}/10` → {row['A_Hacim']}")
-                    st.markdown(f"- ATR `{row['P_ATR']}/5` → {row['A_ATR']}")
-                    st.markdown(f"**Teknik Toplam: `{row['Teknik']}/60`**")
-
-                # Puan görseli
-                puan_data = {
-                    "Kategori": ["PD/DD", "F/K", "Kar Büyümesi", "Trend", "RSI", "MACD", "Hacim", "ATR"],
-                    "Puan":     [row['P_PDDD'], row['P_FK'], row['P_Kar'],
-                                 row['P_Trend'], row['P_RSI'], row['P_MACD'],
-                                 row['P_Hacim'], row['P_ATR']],
-                    "Maks":     [15, 15, 10, 15, 15, 15, 10, 5],
-                }
-                fig = go.Figure()
-                fig.add_trace(go.Bar(
-                    x=puan_data["Kategori"],
-                    y=puan_data["Maks"],
-                    name="Maksimum",
-                    marker_color="rgba(255,255,255,0.1)",
-                ))
-                fig.add_trace(go.Bar(
-                    x=puan_data["Kategori"],
-                    y=puan_data["Puan"],
-                    name="Alınan Puan",
-                    marker_color=["#00C9FF" if p/m > 0.6 else "#FFD700" if p/m > 0.3 else "#FF6B6B"
-                                  for p, m in zip(puan_data["Puan"], puan_data["Maks"])],
-                ))
-                fig.update_layout(
-                    barmode="overlay",
-                    height=250,
-                    margin=dict(l=0, r=0, t=20, b=0),
-                    showlegend=False,
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    font=dict(color="white"),
+        gorunum = st.radio("Görünüm", ["🗺️ Puan Haritası", "🔍 Hisse Detayı"],
+                           horizontal=True, label_visibility="collapsed")
+        if gorunum == "🗺️ Puan Haritası":
+            # Tüm AL satırları tek figürde, sayfa başına sabit sayıda
+            dilim = sayfa_sec(al_listesi, AL_SAYFA_BOYUTU, "al_sayfa")
+            st.plotly_chart(isi_haritasi(dilim, profil), use_container_width=True)
+        else:
+            # Yalnızca seçilen hisse etiketlenir ve çizilir
+            fiyatlar = dict(zip(al_listesi["Ticker"], al_listesi["Fiyat"]))
+            puanlar = dict(zip(al_listesi["Ticker"], al_listesi["Toplam"]))
+            secilen = st.selectbox(
+                "Hisse", al_listesi["Ticker"],
+                format_func=lambda t: f"📈  {t}  |  {fiyatlar[t]:.2f} TL  |  🏆 {puanlar[t]:.0f} / 100 puan",
+            )
+            row = etiketler_ekle(al_listesi[al_listesi["Ticker"] == secilen], profil).iloc[0]
+            st.caption(f"Sektör: {row['Sektör']}")
+            c1, c2 = st.columns(2)
+            for kolon, baslik, grup, bilesenler in [
+                (c1, "🔵 Temel Analiz", "temel", TEMEL_BILESENLER),
+                (c2, "🟢 Teknik Analiz", "teknik", profil.teknik_bilesenler),
+            ]:
+                kolon.markdown(
+                    f"**{baslik}**\n\n"
+                    + "".join(f"- {profil.adlar[b]} `{row[f'P_{b}']}/{profil.maks[b]}` → {row[f'A_{b}']}\n"
+                              for b in bilesenler)
+                    + f"\n**{grup.capitalize()} Toplam: `{row[grup.capitalize()]}/{profil.grup_maks[grup]}`**"
                 )
-                st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(bilesen_grafigi(row, profil), use_container_width=True)
+
+    # ── Profil Karşılaştırması ───────────────────────────────────────────────
+    if karsilastirma:
+        st.divider()
+        st.subheader("⚖️ Profil Karşılaştırması")
+        sayilar = st.columns(1 + len(karsilastirma))
+        for kolon, p in zip(sayilar, [profil, *karsilastirma]):
+            toplam = df["Toplam"] if p is profil else df[karsilastirma_kolonu(p)]
+            kolon.metric(f"{p.baslik} · AL ({min_puan}+)", int((toplam >= min_puan).sum()))
+        st.dataframe(
+            sayfa_sec(profil_karsilastirmasi(df, profil, karsilastirma),
+                      TABLO_SAYFA_BOYUTLARI[0], "profil_sayfa"),
+            hide_index=True, use_container_width=True,
+        )
+
+    # ── Sektörler ────────────────────────────────────────────────────────────
+    sektorler = sektor_ozeti(df, min_puan) if "Getiri" in df else pd.DataFrame()
+    if not sektorler.empty:
+        st.divider()
+        st.subheader("🏭 Sektörler")
+        st.caption(f"Getiri son {RG_VADESI} bar; RG {ENDEKS.removesuffix('.IS')}'e göre göreli "
+                   f"güç. Sektörü bilinmeyen (budanan dahil) hisseler dahil değildir.")
+        st.dataframe(sektorler.round(2), hide_index=True, use_container_width=True)
 
     # ── Tüm Hisseler Tablosu ─────────────────────────────────────────────────
     st.divider()
     st.subheader("📋 Tüm Hisseler — Sıralı Tablo")
 
-    gosterilecek = df[[
-        "Ticker", "Fiyat", "RSI", "PD/DD", "F/K",
-        "Trend Geçti", "Temel", "Teknik", "Toplam", "Sektör"
-    ]].copy()
-
-    def renk_puan(val):
-        if isinstance(val, (int, float)):
-            if val >= 70: return "background-color: #1a4a1a; color: #7fff7f"
-            elif val >= 50: return "background-color: #3a3a00; color: #ffff88"
-            else: return "background-color: #3a0000; color: #ff9999"
-        return ""
+    # Renklendirme yalnızca gösterilen sayfaya uygulanır
+    boyut = st.selectbox("Sayfa başına satır", TABLO_SAYFA_BOYUTLARI, key="tablo_boyut")
+    gosterilecek = sayfa_sec(df[TABLO_KOLONLARI + dilim_kolonlari(df) + kesitsel_kolonlari(df)],
+                             boyut, "tablo_sayfa")
 
     st.dataframe(
-        gosterilecek.style.applymap(renk_puan, subset=["Toplam"]),
+        puan_tablosu_stili(gosterilecek),
         use_container_width=True,
         height=500,
     )
@@ -501,7 +551,7 @@ if tara_btn:
     st.subheader("📉 Puan Dağılımı")
 
     fig2 = px.histogram(
-        df, x="Toplam", nbins=20,
+        df.dropna(subset=["Toplam"]).astype({"Toplam": float}), x="Toplam", nbins=20,
         color_discrete_sequence=["#00C9FF"],
         labels={"Toplam": "Toplam Puan", "count": "Hisse Sayısı"},
     )
@@ -515,9 +565,14 @@ if tara_btn:
     )
     st.plotly_chart(fig2, use_container_width=True)
 
+    # ── Tarama Geçmişi ────────────────────────────────────────────────────────
+    st.divider()
+    st.subheader("🕰️ Tarama Geçmişi")
+    gecmis_paneli(liste_imzasi(tarama_sonucu["anahtar"][0]), df, min_puan)
+
     # ── CSV İndir ────────────────────────────────────────────────────────────
     st.divider()
-    csv = df.to_csv(index=False, encoding="utf-8-sig").encode("utf-8-sig")
+    csv = disa_aktarim_tablosu(df, profil).to_csv(index=False, encoding="utf-8-sig").encode("utf-8-sig")
     st.download_button(
         label="⬇️ Sonuçları CSV İndir",
         data=csv,
@@ -526,12 +581,22 @@ if tara_btn:
         use_container_width=False,
     )
 
+    tanilama_paneli(tarama_sonucu["olcum"], time.perf_counter() - cizim_baslangici)
+
 else:
     # ── Karşılama Ekranı ──────────────────────────────────────────────────────
-    st.markdown("""
+    varsayilan = puan_profilleri()[VARSAYILAN_PROFIL_ADI]
+    # st.markdown girintiyi kırpar: üretilen satırlar da aynı girintide olmalı
+    puan_satirlari = "\n    ".join(
+        f"| **{varsayilan.adlar[b]}** | **{varsayilan.maks[b]}** | **Zorunlu filtre — {varsayilan.aciklamalar[b]}** |"
+        if varsayilan.kapili(b) else
+        f"| {varsayilan.adlar[b]} | {varsayilan.maks[b]} | {varsayilan.aciklamalar[b]} |"
+        for b in varsayilan.bilesenler
+    )
+    st.markdown(f"""
     ### 👋 Nasıl Kullanılır?
 
-    1. Sol menüden **AL eşiğini** ayarla (varsayılan: 70)
+    1. Sol menüden **AL eşiğini** ve **puan profilini** ayarla (varsayılan: 70, {varsayilan.baslik})
     2. **Hazır listeyi** kullan ya da kendi hisselerini gir
     3. **"Taramayı Başlat"** butonuna bas
     4. Sonuçları incele, CSV olarak indir
@@ -542,14 +607,9 @@ else:
 
     | Kategori | Maks Puan | Temel Mantık |
     |---|---|---|
-    | PD/DD | 15 | Defter değerine göre ucuzluk |
-    | F/K | 15 | Kazanca göre ucuzluk |
-    | Kar Büyümesi | 10 | Çeyreksel/yıllık kar artışı |
-    | **Trend (MA50/200)** | **15** | **Zorunlu filtre — altındaysa teknik = 0** |
-    | RSI | 15 | 50-65 arası ideal swing bölgesi |
-    | MACD | 15 | Pozitif ve artan histogram |
-    | Hacim | 10 | Son 5G / 20G ortalaması karşılaştırması |
-    | ATR | 5 | %2-5 arası ideal volatilite |
+    {puan_satirlari}
+
+    Diğer profiller (`puan_profilleri.json`) aynı bileşenleri farklı bant ve puanlarla kullanır.
 
     > ⚠️ **Uyarı:** Bu araç yatırım tavsiyesi değildir. Profesyonel danışmanlık alın.
     """)
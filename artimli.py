@@ -0,0 +1,336 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          artimli.py - Artımlı Gösterge Durumu (Gün İçi Yeniden Tarama)       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Her hisse için son bardan bir önceki bara kadar kesinleşmiş birikimler
+tutulur: EWM ortalama/ağırlıkları (MACD, RSI, ATR), önceki kapanış, MA50 /
+MA200 kayan toplamları ve kapanış / hacim halka tamponları. Son bar (gün
+içinde değişen bar) her okumada bu durumun üzerine tek adımda uygulanır;
+yeni gün gelince önceki bar kesinleşir. Her iki durumda da iş hisse başına
+sabittir.
+
+Adımlar pandas'ın `ewm(adjust=False)` ve `rolling().mean()` çekirdeklerini
+(Kahan dengelemesi dahil) birebir izler; sonuçlar `hesapla_gostergeler` ile
+bit düzeyinde aynıdır. Durumun son kesin barı panelde değişmişse (düzeltme) ya
+da panelin başlangıcı kaymışsa (ör. period="1y" her gün bir bar ilerler) o hisse
+panelden baştan kurulur. Daha eski barlardaki düzeltmeler (ör. temettü/bölünme
+ayarlaması) iş sabit kalsın diye karşılaştırılmaz; durum dosyası silinerek
+sıfırlanır.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from veri import ALANLAR, panel_tickerlari
+from gostergeler import (
+    GOSTERGE_KOLONLARI, gercek_aralik, hesapla_gostergeler, saga_yasla, son_ortalama,
+)
+
+VARSAYILAN_DIZIN = Path(".onbellek") / "gosterge_durumu"
+
+# gostergeler.py ile aynı parametreler (com = (span - 1) / 2)
+EWM_COM = {
+    "ema_hizli": (12 - 1) / 2,
+    "ema_yavas": (26 - 1) / 2,
+    "sinyal":    (9 - 1) / 2,
+    "kazan":     14 - 1,
+    "kayip":     14 - 1,
+    "atr":       (14 - 1) / 2,
+}
+MA_PENCERELERI = (50, 200)
+HACIM_PENCERELERI = (5, 20)
+KAPANIS_TAMPONU = max(MA_PENCERELERI)
+HACIM_TAMPONU = max(HACIM_PENCERELERI)
+
+# Kesin durumu bundan fazla bar geride kalan hisseler baştan kurulur
+ARTIM_SINIRI = 5
+
+_BOS_TARIH = np.iinfo(np.int64).min
+
+# Alan → (dtype, başlangıç değeri)
+_ALANLAR = {
+    "n":         (np.int64, 0),
+    "ilk":       (np.int64, _BOS_TARIH),
+    "son_tarih": (np.int64, _BOS_TARIH),
+    **{a: (np.float64, np.nan) for a in ALANLAR},
+    **{k: (np.float64, np.nan) for k in EWM_COM},
+    **{f"{k}_w": (np.float64, 1.0) for k in EWM_COM},
+    **{f"ma{w}_{k}": (np.float64, 0.0) for w in MA_PENCERELERI
+       for k in ("toplam", "ekle", "cikar")},
+    **{f"ma{w}_{k}": (np.int64, 0) for w in MA_PENCERELERI
+       for k in ("n", "negatif", "ayni")},
+    **{f"ma{w}_onceki": (np.float64, np.nan) for w in MA_PENCERELERI},
+}
+
+_IMZA = hashlib.sha1(json.dumps(
+    [sorted(_ALANLAR), EWM_COM, MA_PENCERELERI, HACIM_PENCERELERI]
+).encode()).hexdigest()[:12]
+
+
+def durum_yolu(kaynak_kimligi: str, interval: str = "1d",
+               dizin: str | Path = VARSAYILAN_DIZIN) -> Path:
+    kimlik = hashlib.sha1(kaynak_kimligi.encode()).hexdigest()[:12]
+    return Path(dizin) / f"{kimlik}_{interval}.npz"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TEK ADIMLAR (pandas çekirdeklerinin karşılığı)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _ewm_adim(ort, agirlik, x, com):
+    """`ewm(com, adjust=False).mean()` tek adım → (ortalama, ağırlık)."""
+    alfa = 1. / (1. + com)
+    gozlem = x == x
+    var = ort == ort
+    agirlik = np.where(var, agirlik * (1. - alfa), agirlik)
+    with np.errstate(invalid="ignore"):
+        birlesik = np.where(ort != x, (agirlik * ort + alfa * x) / (agirlik + alfa), ort)
+    yeni = np.where(gozlem, np.where(var, birlesik, x), ort)
+    return yeni, np.where(gozlem & var, 1., agirlik)
+
+
+def _kahan(toplam, dengeleme, x, gecerli):
+    y = x - dengeleme
+    t = toplam + y
+    return np.where(gecerli, t, toplam), np.where(gecerli, t - toplam - y, dengeleme)
+
+
+def _ma_adim(d: dict, w: int, cikan, giren) -> dict:
+    """`rolling(w).mean()` tek adım: önce pencereden çıkan, sonra giren değer."""
+    toplam, n, neg = d[f"ma{w}_toplam"], d[f"ma{w}_n"], d[f"ma{w}_negatif"]
+    g = cikan == cikan
+    toplam, cikar = _kahan(toplam, d[f"ma{w}_cikar"], -cikan, g)
+    n, neg = n - g, neg - (g & np.signbit(cikan))
+    g = giren == giren
+    toplam, ekle = _kahan(toplam, d[f"ma{w}_ekle"], giren, g)
+    n, neg = n + g, neg + (g & np.signbit(giren))
+    onceki = d[f"ma{w}_onceki"]
+    ayni = np.where(g, np.where(giren == onceki, d[f"ma{w}_ayni"] + 1, 1), d[f"ma{w}_ayni"])
+    return {f"ma{w}_toplam": toplam, f"ma{w}_ekle": ekle, f"ma{w}_cikar": cikar,
+            f"ma{w}_n": n, f"ma{w}_negatif": neg, f"ma{w}_ayni": ayni,
+            f"ma{w}_onceki": np.where(g, giren, onceki)}
+
+
+def _ma_degeri(d: dict, w: int) -> np.ndarray:
+    toplam, n, neg = d[f"ma{w}_toplam"], d[f"ma{w}_n"], d[f"ma{w}_negatif"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sonuc = toplam / n
+    sonuc = np.where(d[f"ma{w}_ayni"] >= n, d[f"ma{w}_onceki"],
+                     np.where((neg == 0) & (sonuc < 0), 0.0,
+                              np.where((neg == n) & (sonuc > 0), 0.0, sonuc)))
+    return np.where((n >= w) & (n > 0), sonuc, np.nan)
+
+
+def _esit(a, b):
+    return (a == b) | (np.isnan(a) & np.isnan(b))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# DURUM
+# ─────────────────────────────────────────────────────────────────────────────
+
+class GostergeDurumu:
+    """Hisse başına kesinleşmiş gösterge birikimleri (iş parçacığı güvenli)."""
+
+    def __init__(self):
+        self.tickers = []
+        self._sira = {}
+        self.d = {ad: np.empty(0, dtype=tip) for ad, (tip, _) in _ALANLAR.items()}
+        self.kapanis_tampon = np.empty((KAPANIS_TAMPONU, 0))
+        self.hacim_tampon = np.empty((HACIM_TAMPONU, 0))
+        self._kilit = threading.Lock()
+
+    # ── Kalıcılık ────────────────────────────────────────────────────────────
+
+    def kaydet(self, yol: str | Path):
+        yol = Path(yol)
+        yol.parent.mkdir(parents=True, exist_ok=True)
+        gecici = yol.with_suffix(".tmp.npz")
+        with self._kilit:
+            np.savez(gecici, _imza=np.array(_IMZA), _tickers=np.array(self.tickers, dtype=str),
+                     _kapanis_tampon=self.kapanis_tampon, _hacim_tampon=self.hacim_tampon,
+                     **self.d)
+        gecici.replace(yol)
+
+    @classmethod
+    def yukle(cls, yol: str | Path) -> "GostergeDurumu":
+        """Kayıtlı durumu okur; dosya yoksa ya da parametreler değiştiyse boş durum."""
+        durum = cls()
+        yol = Path(yol)
+        if not yol.exists():
+            return durum
+        with np.load(yol) as f:
+            if str(f["_imza"]) != _IMZA:
+                return durum
+            durum.tickers = f["_tickers"].tolist()
+            durum._sira = {t: i for i, t in enumerate(durum.tickers)}
+            durum.kapanis_tampon = f["_kapanis_tampon"]
+            durum.hacim_tampon = f["_hacim_tampon"]
+            durum.d = {ad: f[ad] for ad in _ALANLAR}
+        return durum
+
+    # ── Yardımcılar ──────────────────────────────────────────────────────────
+
+    def _indeksle(self, tickers: list[str]) -> np.ndarray:
+        yeniler = [t for t in dict.fromkeys(tickers) if t not in self._sira]
+        if yeniler:
+            for t in yeniler:
+                self._sira[t] = len(self.tickers)
+                self.tickers.append(t)
+            k = len(yeniler)
+            self.d = {ad: np.concatenate([self.d[ad], np.full(k, bas, dtype=tip)])
+                      for ad, (tip, bas) in _ALANLAR.items()}
+            self.kapanis_tampon = np.hstack([self.kapanis_tampon, np.full((KAPANIS_TAMPONU, k), np.nan)])
+            self.hacim_tampon = np.hstack([self.hacim_tampon, np.full((HACIM_TAMPONU, k), np.nan)])
+        return np.array([self._sira[t] for t in tickers], dtype=np.int64)
+
+    def _sifirla(self, s: np.ndarray):
+        for ad, (_, bas) in _ALANLAR.items():
+            self.d[ad][s] = bas
+        self.kapanis_tampon[:, s] = np.nan
+        self.hacim_tampon[:, s] = np.nan
+
+    def _adim(self, s: np.ndarray, bar: dict) -> dict:
+        """Kesin durumun üzerine `bar` eklenince oluşacak alanlar (yazmadan)."""
+        d = {ad: self.d[ad][s] for ad in _ALANLAR}
+        n, onceki = d["n"], d["Close"]
+        kapanis, yuksek, dusuk = bar["Close"], bar["High"], bar["Low"]
+
+        y = {"n": n + 1, **{a: bar[a] for a in ALANLAR}}
+        delta = kapanis - onceki
+        girdiler = {
+            "ema_hizli": kapanis,
+            "ema_yavas": kapanis,
+            "kazan":     np.clip(delta, 0, None),
+            "kayip":     -np.clip(delta, None, 0),
+            "atr":       gercek_aralik(yuksek, dusuk, onceki),
+        }
+        for ad, x in girdiler.items():
+            y[ad], y[f"{ad}_w"] = _ewm_adim(d[ad], d[f"{ad}_w"], x, EWM_COM[ad])
+        y["sinyal"], y["sinyal_w"] = _ewm_adim(d["sinyal"], d["sinyal_w"],
+                                               y["ema_hizli"] - y["ema_yavas"], EWM_COM["sinyal"])
+        for w in MA_PENCERELERI:
+            cikan = np.where(n >= w, self.kapanis_tampon[(n - w) % KAPANIS_TAMPONU, s], np.nan)
+            y.update(_ma_adim(d, w, cikan, kapanis))
+        return y
+
+    def _ilerlet(self, s: np.ndarray, bar: dict, tarih: np.ndarray):
+        """`bar`ı kesinleştirir."""
+        n = self.d["n"][s]
+        y = self._adim(s, bar)
+        for ad, deger in y.items():
+            self.d[ad][s] = deger
+        self.d["son_tarih"][s] = tarih
+        self.d["ilk"][s] = np.where(n == 0, tarih, self.d["ilk"][s])
+        self.kapanis_tampon[n % KAPANIS_TAMPONU, s] = bar["Close"]
+        self.hacim_tampon[n % HACIM_TAMPONU, s] = bar["Volume"]
+
+    def _ciktilar(self, s: np.ndarray, bar: dict, bar_sayisi: np.ndarray,
+                  satir_sayisi: int) -> dict:
+        """Kesin durum + son bar → `matrislerden_gostergeler` sütunları."""
+        d = {ad: self.d[ad][s] for ad in ("n", "ema_hizli", "ema_yavas", "sinyal")}
+        y = self._adim(s, bar)
+        macd = y["ema_hizli"] - y["ema_yavas"]
+        onceki_hist = (d["ema_hizli"] - d["ema_yavas"]) - d["sinyal"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rs = y["kazan"] / y["kayip"]
+            rsi = 100 - (100 / (1 + rs))
+
+        # Son HACIM_TAMPONU bar, eskiden yeniye (sağa yaslı matrisin son satırları)
+        k = d["n"][None, :] - np.arange(HACIM_TAMPONU - 2, -1, -1)[:, None]
+        hacim = np.where(k >= 1, self.hacim_tampon[(k - 1) % HACIM_TAMPONU, s[None, :]], np.nan)
+        hacim = np.vstack([hacim, bar["Volume"][None, :]])[-satir_sayisi:]
+
+        return {
+            "Bar":        bar_sayisi,
+            "Fiyat":      bar["Close"],
+            "MA50":       _ma_degeri(y, 50),
+            "MA200":      _ma_degeri(y, 200),
+            "RSI":        rsi,
+            "MACD":       macd,
+            "Sinyal":     y["sinyal"],
+            "Histogram":  macd - y["sinyal"],
+            "OncekiHist": np.where(bar_sayisi > 1, onceki_hist, 0.0),
+            "ATR":        y["atr"],
+            "H5":         son_ortalama(hacim, 5),
+            "H20":        son_ortalama(hacim, 20),
+        }
+
+    # ── Güncelleme ───────────────────────────────────────────────────────────
+
+    def guncelle(self, panel: pd.DataFrame, tickers: list[str] | None = None) -> pd.DataFrame:
+        """
+        `hesapla_gostergeler(panel, tickers)` ile aynı tablo. Durum panelle
+        tutarlıysa yalnızca son bar(lar) işlenir; değilse hisse baştan kurulur.
+        """
+        tickers = list(tickers if tickers is not None else panel_tickerlari(panel))
+        satir_sayisi = len(panel)
+        if not tickers or satir_sayisi == 0:
+            return pd.DataFrame(columns=GOSTERGE_KOLONLARI, index=pd.Index([], name="Ticker"))
+
+        alanlar = {a: panel[a].reindex(columns=tickers).to_numpy(dtype=float) for a in ALANLAR}
+        gecerli = ~np.isnan(alanlar["Close"])
+        # Kapanışı olmayan ama başka alanı dolu satırlar `saga_yasla` dolgusuna
+        # düşer ve ATR / hacim ortalamasını etkiler; bu hisseler tam matris
+        # yolundan hesaplanır (durumları sıfırlanır)
+        eksik_kapanis = np.zeros(len(tickers), dtype=bool)
+        for a in ALANLAR:
+            eksik_kapanis |= (~gecerli & ~np.isnan(alanlar[a])).any(axis=0)
+        birikim = np.cumsum(gecerli, axis=0)
+        bar_sayisi = birikim[-1]
+        tarihler = panel.index.asi8
+        kolon = np.arange(len(tickers))
+
+        def satir(k):
+            """Her sütunun k. barının satırı (k >= 1)."""
+            return (birikim >= k[None, :]).argmax(axis=0)
+
+        with self._kilit:
+            s = self._indeksle(tickers)
+            n = self.d["n"][s]
+            r = satir(np.maximum(n, 1))
+            tutarli = (~eksik_kapanis & (n >= 1) & (n <= bar_sayisi - 1)
+                       & (bar_sayisi - 1 - n <= ARTIM_SINIRI)
+                       & (self.d["son_tarih"][s] == tarihler[r])
+                       & (self.d["ilk"][s] == tarihler[satir(np.ones_like(n))]))
+            for a in ALANLAR:
+                tutarli &= _esit(self.d[a][s], alanlar[a][r, kolon])
+
+            # Tutarlı hisseler: eksik kesin barlar (gün değişince genelde bir tane)
+            for adim in range(1, int((bar_sayisi - 1 - n)[tutarli].max(initial=0)) + 1):
+                sec = tutarli & (n + adim <= bar_sayisi - 1)
+                r = satir(n + adim)[sec]
+                self._ilerlet(s[sec], {a: alanlar[a][r, kolon[sec]] for a in ALANLAR},
+                              tarihler[r])
+
+            # Diğerleri: sağa yaslı geçmişten son bar hariç baştan
+            yeniden = np.flatnonzero(~tutarli & (bar_sayisi > 1) & ~eksik_kapanis)
+            self._sifirla(s[~tutarli])
+            if len(yeniden):
+                g = gecerli[:, yeniden]
+                m = {a: saga_yasla(alanlar[a][:, yeniden], g) for a in ALANLAR}
+                tarih_m = saga_yasla(np.broadcast_to(tarihler[:, None], g.shape).copy(), g)
+                ilk_satir = satir_sayisi - bar_sayisi[yeniden]
+                for i in range(int(ilk_satir.min()), satir_sayisi - 1):
+                    sec = i >= ilk_satir
+                    self._ilerlet(s[yeniden[sec]], {a: m[a][i, sec] for a in ALANLAR},
+                                  tarih_m[i, sec])
+
+            # Son bar: durumu değiştirmeden uygulanır
+            var = bar_sayisi > 0
+            r = satir(np.maximum(bar_sayisi, 1))
+            son = {a: np.where(var, alanlar[a][r, kolon], np.nan) for a in ALANLAR}
+            ciktilar = self._ciktilar(s, son, bar_sayisi, satir_sayisi)
+
+        sonuc = pd.DataFrame(ciktilar, index=pd.Index(tickers, name="Ticker"))[GOSTERGE_KOLONLARI]
+        if eksik_kapanis.any():
+            tam = hesapla_gostergeler(panel, [t for t, e in zip(tickers, eksik_kapanis) if e])
+            sonuc.loc[tam.index] = tam
+        return sonuc
@@ -0,0 +1,357 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          benchmark.py - Sentetik Veriyle Tekrarlanabilir Hız Ölçümü          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Ağ bağlantısı olmadan, sabit tohumla üretilen BIST benzeri günlük OHLCV ve
+temel verilerle her aşamayı ölçer: göstergeler (`hesapla_*` ve artımlı
+durumla gün içi son bar güncellemesi, haftalık / aylık örnekleme), kesitsel
+göreli güç ve sektör sırası, puanlama (`puan_*`; tüm profiller yan
+yana dahil), sonuç tablosu kurulumu, tablo renklendirme ve arayüzün gönderdiği
+sayfalar (tablo sayfası, AL ısı haritası). Tek hisselik referans yol ile
+vektörel yolun sonuçları her puan profili için karşılaştırılır (eşlik).
+Sonuçlar JSON satırları olarak dosyaya eklenir; `--karsilastir` önceki sürümle
+oranları gösterir.
+
+    python benchmark.py --boyut 65 500 5000 --gun 260
+    python benchmark.py --boyut 500 --karsilastir benchmark_sonuclari.jsonl
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from veri import VeriSaglayici, hisse_verisi, panel_olustur
+from temel import temel_tablosu
+from gostergeler import GOSTERGE_KOLONLARI, hesapla_gostergeler, tekil_gostergeler
+from artimli import GostergeDurumu
+from puanlama import (
+    SONUC_KOLONLARI, TABLO_KOLONLARI, disa_aktarim_tablosu, karsilastirma_kolonu,
+    puan_tablosu_stili, puanla,
+)
+from profiller import profilleri_yukle
+from zaman_dilimi import TOPLAMA, ZAMAN_DILIMLERI, dilim_panelleri, dilim_tablosu, yeniden_ornekle
+from kesitsel import RG_VADESI, goreli_guc, sektor_kolonlari_ekle, sektor_ozeti
+from tarama import hisse_analiz_et
+from grafikler import AL_SAYFA_BOYUTU, TABLO_SAYFA_BOYUTLARI, bilesen_grafigi, isi_haritasi
+
+VARSAYILAN_DOSYA = "benchmark_sonuclari.jsonl"
+AL_ESIGI = 50   # arayüzdeki en düşük eşik; en uzun AL listesi
+SEKTORLER = ["Bankacılık", "Holding", "Sanayi", "Enerji", "Perakende", "Teknoloji",
+             "Gayrimenkul", "Ulaştırma", "Kimya", "Gıda"]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SENTETİK VERİ
+# ─────────────────────────────────────────────────────────────────────────────
+
+def sentetik_veri(hisse_sayisi: int, gun: int = 260, tohum: int = 42) -> tuple[pd.DataFrame, dict]:
+    """
+    BIST benzeri panel ve info sözlükleri üretir: kalın kuyruklu getiriler,
+    1-500 TL fiyatlar, lognormal hacim, %10 yeni halka arz (kısa geçmiş),
+    işlem durdurma boşlukları ve eksik temel alanları.
+    """
+    rng = np.random.default_rng(tohum)
+    tarihler = pd.bdate_range(end="2025-12-31", periods=gun)
+    hisseler, temel = {}, {}
+    for i in range(hisse_sayisi):
+        ticker = f"S{i:04d}.IS"
+        n = int(rng.integers(20, gun)) if rng.random() < 0.10 else gun
+        getiri = rng.standard_t(4, n) * rng.uniform(0.012, 0.035) / np.sqrt(2) + rng.normal(0, 0.001)
+        kapanis = np.round(np.exp(np.log(rng.uniform(1, 500)) + np.cumsum(getiri)), 2)
+        acilis = np.round(kapanis * (1 + rng.normal(0, 0.006, n)), 2)
+        yayilim = np.abs(rng.normal(0, 0.012, n))
+        df = pd.DataFrame({
+            "Open":   acilis,
+            "High":   np.round(np.maximum(acilis, kapanis) * (1 + yayilim), 2),
+            "Low":    np.round(np.minimum(acilis, kapanis) * (1 - yayilim), 2),
+            "Close":  kapanis,
+            "Volume": np.round(rng.lognormal(np.log(rng.uniform(1e5, 5e7)), 0.6, n)),
+        }, index=tarihler[-n:])
+        if rng.random() < 0.02:
+            df = df.drop(df.index[rng.choice(n, size=min(5, n // 10), replace=False)])
+        hisseler[ticker] = df
+        temel[ticker] = {
+            "priceToBook":             rng.lognormal(0.4, 0.7) if rng.random() > 0.1 else None,
+            "trailingPE":              rng.normal(15, 12) if rng.random() > 0.2 else None,
+            "earningsQuarterlyGrowth": rng.normal(0.2, 0.5) if rng.random() > 0.3 else None,
+            "earningsGrowth":          rng.normal(0.15, 0.3) if rng.random() > 0.5 else None,
+            "sector":                  SEKTORLER[i % len(SEKTORLER)] if rng.random() > 0.05 else None,
+        }
+    return panel_olustur(hisseler), temel
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ÖLÇÜM
+# ─────────────────────────────────────────────────────────────────────────────
+
+def olc(fonksiyon, tekrar: int) -> tuple[list[float], object]:
+    sureler, sonuc = [], None
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        sonuc = fonksiyon()
+        sureler.append(time.perf_counter() - baslangic)
+    return sureler, sonuc
+
+
+def tekil_gosterge_tablosu(panel: pd.DataFrame, tickers: list[str]) -> pd.DataFrame:
+    """Referans yol: her hisse için `hesapla_*` fonksiyonları."""
+    satirlar = {}
+    for t in tickers:
+        df = hisse_verisi(panel, t)
+        if df is not None and len(df):
+            satirlar[t] = tekil_gostergeler(df)
+    return pd.DataFrame.from_dict(satirlar, orient="index")[GOSTERGE_KOLONLARI]
+
+
+def tekil_dilim_gostergeleri(panel: pd.DataFrame, tickers: list[str], kural: str) -> pd.DataFrame:
+    """Referans yol: her hisse kendi günlük barlarından örneklenip `hesapla_*` ile."""
+    satirlar = {}
+    for t in tickers:
+        df = hisse_verisi(panel, t)
+        if df is not None and len(df):
+            satirlar[t] = tekil_gostergeler(df.resample(kural).agg(TOPLAMA).dropna(subset=["Close"]))
+    return pd.DataFrame.from_dict(satirlar, orient="index")[GOSTERGE_KOLONLARI]
+
+
+def tekil_getiri(panel: pd.DataFrame, tickers: list[str], vade: int = RG_VADESI) -> pd.Series:
+    """Referans yol: her hissenin kendi kapanışlarından son `vade` bar getirisi (%)."""
+    getiri = {}
+    for t in tickers:
+        df = hisse_verisi(panel, t)
+        c = df["Close"].dropna().to_numpy() if df is not None else np.array([])
+        getiri[t] = (c[-1] / c[-1 - vade] - 1) * 100 if len(c) > vade else np.nan
+    return pd.Series(getiri, dtype=float)
+
+
+def tekil_puanlama(gostergeler: pd.DataFrame, temel: dict, profil=None) -> pd.DataFrame:
+    """Referans yol: her hisse için skaler kurallar (hisse_analiz_et)."""
+    saglayici = VeriSaglayici()
+    satirlar = [hisse_analiz_et(t, info=temel.get(t) or {}, gosterge=g, saglayici=saglayici,
+                                profil=profil)
+                for t, g in gostergeler.iterrows()]
+    return pd.DataFrame([s for s in satirlar if s is not None])
+
+
+def _kurulu_durum(panel: pd.DataFrame) -> GostergeDurumu:
+    durum = GostergeDurumu()
+    durum.guncelle(panel)
+    return durum
+
+
+def gosterge_esligi(referans: pd.DataFrame, vektorel: pd.DataFrame) -> dict:
+    v = vektorel.reindex(referans.index)[GOSTERGE_KOLONLARI].to_numpy(dtype=float)
+    r = referans[GOSTERGE_KOLONLARI].to_numpy(dtype=float)
+    ayni = (v == r) | (np.isnan(v) & np.isnan(r))
+    with np.errstate(invalid="ignore"):
+        fark = np.nanmax(np.abs(v - r)) if (~np.isnan(v - r)).any() else 0.0
+    return {"uyusmayan": int((~ayni).sum()), "hucre": int(ayni.size), "max_fark": float(fark)}
+
+
+def puan_esligi(referans: pd.DataFrame, vektorel: pd.DataFrame, profil=None) -> dict:
+    kolonlar = [k for k in SONUC_KOLONLARI if k in referans.columns]
+    # Profilin isteğe bağlı bileşenleri (ör. P_RG / A_RG)
+    kolonlar += [k for k in referans.columns if k.startswith(("P_", "A_")) and k not in kolonlar]
+    r = referans.set_index("Ticker")[kolonlar[1:]].sort_index()
+    v = disa_aktarim_tablosu(vektorel, profil).astype({"Ticker": object})
+    v = v.set_index("Ticker")[kolonlar[1:]].sort_index()
+    if not r.index.equals(v.index):
+        return {"uyusmayan": -1, "hucre": 0, "satir_farki": len(r.index.symmetric_difference(v.index))}
+    ayni = (r.astype(object) == v.astype(object)) | (r.isna() & v.isna())
+    return {"uyusmayan": int((~ayni).to_numpy().sum()), "hucre": int(ayni.size)}
+
+
+def kosu(hisse_sayisi: int, gun: int, tekrar: int, tohum: int,
+         referans_siniri: int, eslik_ornegi: int) -> list[dict]:
+    """Bir boyut için tüm aşamaların ölçüm ve eşlik kayıtları."""
+    panel, temel = sentetik_veri(hisse_sayisi, gun, tohum)
+    tickers = list(temel)
+    kayitlar = []
+
+    def kaydet(asama, sureler, **ek):
+        kayitlar.append({"asama": asama, "min_s": min(sureler),
+                         "medyan_s": statistics.median(sureler), "tekrar": len(sureler), **ek})
+
+    sureler, gostergeler = olc(lambda: hesapla_gostergeler(panel), tekrar)
+    kaydet("gostergeler", sureler)
+
+    # Gün içi yeniden tarama: yalnızca son bar değişir, durum önceki taramadan
+    sureler, durum = olc(lambda: _kurulu_durum(panel), tekrar)
+    kaydet("gostergeler_artimli_kurulum", sureler)
+    gun_ici = panel.copy()
+    kapanis = gun_ici.columns.get_level_values(0) == "Close"
+    gun_ici.iloc[-1, kapanis] = gun_ici.iloc[-1, kapanis].to_numpy() * 1.004
+    sureler, artimli = olc(lambda: durum.guncelle(gun_ici), tekrar)
+    kaydet("gostergeler_artimli", sureler)
+    kayitlar.append({"asama": "eslik_artimli",
+                     **gosterge_esligi(hesapla_gostergeler(gun_ici), artimli)})
+
+    # Ek zaman dilimleri: ağ yok, yalnızca bellekteki günlük panelden örnekleme
+    ornekli = [d for d, t in ZAMAN_DILIMLERI.items() if "kural" in t]
+    sureler, _ = olc(lambda: dilim_tablosu(dilim_panelleri(panel, None, tickers, ornekli)), tekrar)
+    kaydet("zaman_dilimleri", sureler, dilim=len(ornekli))
+    haftalik = ZAMAN_DILIMLERI["haftalik"]["kural"]
+    ornek = tickers if hisse_sayisi <= referans_siniri else tickers[:eslik_ornegi]
+    kayitlar.append({"asama": "eslik_haftalik", **gosterge_esligi(
+        tekil_dilim_gostergeleri(panel, ornek, haftalik),
+        hesapla_gostergeler(yeniden_ornekle(panel, haftalik)))})
+
+    # Kesitsel: endeks verisi yok, ölçüt listenin medyan getirisi
+    sureler, kesit = olc(lambda: goreli_guc(panel), tekrar)
+    kaydet("kesitsel", sureler)
+    ref_getiri = tekil_getiri(panel, ornek)
+    v, r = kesit["Getiri"].reindex(ref_getiri.index).to_numpy(), ref_getiri.to_numpy()
+    ayni = (v == r) | (np.isnan(v) & np.isnan(r))
+    kayitlar.append({"asama": "eslik_kesitsel", "uyusmayan": int((~ayni).sum()), "hucre": len(r)})
+    gostergeler_rg = gostergeler.join(kesit)
+
+    temel_df = temel_tablosu(temel, list(gostergeler.index))
+    sureler, sonuc = olc(lambda: puanla(gostergeler, temel_df), tekrar)
+    kaydet("puanlama", sureler, bayt=int(sonuc.memory_usage(deep=True).sum()))
+    # Tüm profiller yan yana: girdiler bir kez, profil başına bir tablo geçişi
+    varsayilan, *digerleri = profilleri_yukle().values()
+    sureler, yan_yana = olc(lambda: puanla(gostergeler_rg, temel_df, karsilastirma=digerleri),
+                            tekrar)
+    kaydet("puanlama_profiller", sureler, profil=1 + len(digerleri))
+    sureler, _ = olc(lambda: sektor_ozeti(sektor_kolonlari_ekle(yan_yana.copy()), AL_ESIGI), tekrar)
+    kaydet("sektor", sureler)
+    sureler, _ = olc(lambda: disa_aktarim_tablosu(sonuc.sort_values("Toplam", ascending=False)), tekrar)
+    kaydet("sonuc_tablosu", sureler)
+    sureler, _ = olc(lambda: puan_tablosu_stili(sonuc[TABLO_KOLONLARI]).to_html(), tekrar)
+    kaydet("tablo_stili", sureler)
+
+    # Arayüzün gönderdiği yük: tablo sayfası ve AL listesinin ilk sayfası
+    sirali = sonuc.sort_values("Toplam", ascending=False)
+    sureler, html = olc(lambda: puan_tablosu_stili(
+        sirali[TABLO_KOLONLARI].head(TABLO_SAYFA_BOYUTLARI[0])).to_html(), tekrar)
+    kaydet("tablo_sayfasi", sureler, bayt=len(html))
+    al = sirali[sirali["Toplam"] >= AL_ESIGI]
+    sureler, js = olc(lambda: isi_haritasi(al.head(AL_SAYFA_BOYUTU)).to_json(), tekrar)
+    kaydet("al_isi_haritasi", sureler, bayt=len(js), al=len(al))
+    sureler, js = olc(lambda: "".join(bilesen_grafigi(r).to_json() for _, r in al.iterrows()), 1)
+    kaydet("al_grafikleri_tekil", sureler, bayt=len(js), al=len(al))
+
+    # Referans (tek hisse) yol: büyük boyutlarda yalnızca eşlik örneğinde
+    if hisse_sayisi <= referans_siniri:
+        sureler, ref_gosterge = olc(lambda: tekil_gosterge_tablosu(panel, tickers), 1)
+        kaydet("gostergeler_tekil", sureler)
+        sureler, ref_puan = olc(lambda: tekil_puanlama(ref_gosterge, temel), 1)
+        kaydet("puanlama_tekil", sureler)
+    else:
+        ornek = tickers[:eslik_ornegi]
+        ref_gosterge = tekil_gosterge_tablosu(panel, ornek)
+        ref_puan = tekil_puanlama(ref_gosterge, temel)
+
+    kayitlar.append({"asama": "eslik_gostergeler", **gosterge_esligi(ref_gosterge, gostergeler)})
+    ref_tickers = ref_puan["Ticker"] if len(ref_puan) else []
+    vektorel = sonuc[sonuc["Ticker"].isin(ref_tickers)]
+    kayitlar.append({"asama": "eslik_puanlama", **puan_esligi(ref_puan, vektorel)})
+
+    # Diğer profiller: skaler referans ve yan yana sütunun tek profilli puanlamayla eşliği
+    ref_gosterge_rg = ref_gosterge.join(kesit["RG"])
+    for p in digerleri:
+        ref = tekil_puanlama(ref_gosterge_rg, temel, p)
+        tek = puanla(gostergeler_rg, temel_df, profil=p)
+        kayitlar.append({"asama": f"eslik_puanlama_{p.ad}",
+                         **puan_esligi(ref, tek[tek["Ticker"].isin(ref_tickers)], p)})
+        farkli = int((yan_yana[karsilastirma_kolonu(p)] != tek["Toplam"]).sum())
+        kayitlar.append({"asama": f"eslik_yan_yana_{p.ad}", "uyusmayan": farkli,
+                         "hucre": len(tek)})
+    return kayitlar
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# KAYIT / KARŞILAŞTIRMA
+# ─────────────────────────────────────────────────────────────────────────────
+
+def ortam() -> dict:
+    try:
+        surum = subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True,
+                               text=True, cwd=Path(__file__).parent, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        surum = ""
+    return {
+        "surum": surum or "bilinmiyor",
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "makine": platform.machine(),
+        "islemci": platform.processor() or platform.machine(),
+    }
+
+
+def karsilastir(onceki: list[dict], simdiki: list[dict]) -> pd.DataFrame:
+    """Aynı (hisse, gün, aşama) için önceki son ölçümle min süre oranı."""
+    son = {}
+    for k in onceki:
+        if "min_s" in k:
+            son[(k["hisse"], k["gun"], k["asama"])] = k
+    satirlar = []
+    for k in simdiki:
+        eski = son.get((k["hisse"], k["gun"], k["asama"]))
+        if "min_s" in k and eski is not None:
+            satirlar.append({"Hisse": k["hisse"], "Gün": k["gun"], "Aşama": k["asama"],
+                             "Önceki": eski["surum"], "Önceki (s)": eski["min_s"],
+                             "Şimdi (s)": k["min_s"], "Oran": k["min_s"] / eski["min_s"]})
+    return pd.DataFrame(satirlar)
+
+
+def main(argv: list[str] | None = None) -> int:
+    warnings.filterwarnings('ignore')
+    ayristirici = argparse.ArgumentParser(description="Sentetik veriyle tarama hız ölçümü")
+    ayristirici.add_argument("--boyut", type=int, nargs="+", default=[65, 500], help="Hisse sayıları")
+    ayristirici.add_argument("--gun", type=int, default=260, help="İşlem günü sayısı")
+    ayristirici.add_argument("--tekrar", type=int, default=3, help="Vektörel aşamalar için tekrar")
+    ayristirici.add_argument("--tohum", type=int, default=42)
+    ayristirici.add_argument("--referans-siniri", type=int, default=1000,
+                             help="Tek hisselik referans yolun tamamen ölçüleceği en büyük boyut")
+    ayristirici.add_argument("--eslik-ornegi", type=int, default=200,
+                             help="Daha büyük boyutlarda eşlik için örneklenen hisse sayısı")
+    ayristirici.add_argument("--cikti", default=VARSAYILAN_DOSYA, help="Sonuçların ekleneceği JSONL")
+    ayristirici.add_argument("--karsilastir", help="Önceki sonuç dosyası (JSONL)")
+    args = ayristirici.parse_args(argv)
+
+    onceki = []
+    if args.karsilastir and Path(args.karsilastir).exists():
+        onceki = [json.loads(s) for s in Path(args.karsilastir).read_text(encoding="utf-8").splitlines() if s]
+
+    ortak = {"kosu": uuid.uuid4().hex[:12], "zaman": round(time.time(), 3), **ortam(),
+             "gun": args.gun, "tohum": args.tohum}
+    kayitlar = []
+    eslik_bozuk = False
+    for n in args.boyut:
+        for k in kosu(n, args.gun, args.tekrar, args.tohum, args.referans_siniri, args.eslik_ornegi):
+            kayitlar.append({**ortak, "hisse": n, **k})
+            if k["asama"].startswith("eslik") and k["uyusmayan"] != 0:
+                eslik_bozuk = True
+
+    tablo = pd.DataFrame(kayitlar)
+    print(tablo[[c for c in ["hisse", "asama", "min_s", "medyan_s", "uyusmayan", "max_fark"]
+                 if c in tablo]].to_string(index=False, float_format="%.4f"))
+    if onceki:
+        print()
+        print(karsilastir(onceki, kayitlar).to_string(index=False, float_format="%.4f"))
+
+    with open(args.cikti, "a", encoding="utf-8") as f:
+        f.writelines(json.dumps(k, ensure_ascii=False) + "\n" for k in kayitlar)
+    print(f"\n{len(kayitlar)} kayıt eklendi: {args.cikti}", file=sys.stderr)
+
+    if eslik_bozuk:
+        print("UYARI: referans ve vektörel yol sonuçları farklı.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          gecmis.py - Salt Eklemeli Tarama Geçmişi (SQLite)                   ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Tamamlanan her tarama `taramalar` tablosuna bir satır, her hisse sonucu da
+`sonuclar` tablosuna bir satır olarak eklenir; güncelleme ve silme
+tetikleyicilerle engellenir. `sonuclar` (ticker, tarama) birincil anahtarlı
+WITHOUT ROWID tablodur: bir hissenin tüm geçmişi diskte bitişiktir ve
+"THYAO'nun son 30 taramadaki Toplam'ı" tüm geçmiş okunmadan döner. Tarama
+başına sıralama sorguları için (tarama, toplam, sira) indeksi de tutulur.
+
+Budanan hisseler (temel verisi çekilmediği için Toplam'ı bilinmeyen) sıra
+almaz ve geçmişe yazılmaz. Aynı listenin taramaları `liste_imzasi` ile
+gruplanır; farklı listelerin sıraları birbirine karıştırılmaz. WAL kipi
+sayesinde Streamlit oturumları yazım sürerken okuyabilir.
+
+    python gecmis.py --ticker THYAO,GARAN --son 30
+"""
+
+import argparse
+import hashlib
+import sqlite3
+import sys
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from puanlama import BILESENLER
+
+VARSAYILAN_YOL = Path(".onbellek") / "tarama_gecmisi.sqlite"
+
+# Sonuç tablosu sütunu → SQLite sütunu
+SAKLANAN_KOLONLAR = {
+    "Fiyat": "fiyat", "RSI": "rsi", "Trend Geçti": "trend",
+    **{f"P_{b}": f"p_{b.lower()}" for b in BILESENLER},
+    "Temel": "temel", "Teknik": "teknik", "Toplam": "toplam", "Budandı": "budandi",
+}
+
+_SEMA = f"""
+CREATE TABLE IF NOT EXISTS taramalar (
+    id       INTEGER PRIMARY KEY,
+    zaman    TEXT NOT NULL,
+    liste    TEXT NOT NULL,
+    kaynak   TEXT,
+    kural    TEXT,
+    esik     INTEGER,
+    hisse    INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS taramalar_liste ON taramalar (liste, id);
+
+CREATE TABLE IF NOT EXISTS sonuclar (
+    ticker   TEXT NOT NULL,
+    tarama   INTEGER NOT NULL REFERENCES taramalar (id),
+    sira     INTEGER NOT NULL,
+    {", ".join(f"{k} {'REAL' if k in ('fiyat', 'rsi') else 'INTEGER'}"
+               for k in SAKLANAN_KOLONLAR.values())},
+    PRIMARY KEY (ticker, tarama)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sonuclar_tarama ON sonuclar (tarama, toplam, sira);
+
+CREATE TRIGGER IF NOT EXISTS taramalar_salt_ekleme_g BEFORE UPDATE ON taramalar
+BEGIN SELECT RAISE(ABORT, 'tarama geçmişi salt eklemelidir'); END;
+CREATE TRIGGER IF NOT EXISTS taramalar_salt_ekleme_s BEFORE DELETE ON taramalar
+BEGIN SELECT RAISE(ABORT, 'tarama geçmişi salt eklemelidir'); END;
+CREATE TRIGGER IF NOT EXISTS sonuclar_salt_ekleme_g BEFORE UPDATE ON sonuclar
+BEGIN SELECT RAISE(ABORT, 'tarama geçmişi salt eklemelidir'); END;
+CREATE TRIGGER IF NOT EXISTS sonuclar_salt_ekleme_s BEFORE DELETE ON sonuclar
+BEGIN SELECT RAISE(ABORT, 'tarama geçmişi salt eklemelidir'); END;
+"""
+
+
+def liste_imzasi(tickers) -> str:
+    """Sıradan bağımsız kısa liste kimliği (.IS soneki yok sayılır)."""
+    kodlar = sorted({t.replace(".IS", "") for t in tickers})
+    return hashlib.sha1(",".join(kodlar).encode()).hexdigest()[:12]
+
+
+class TaramaGecmisi:
+    """Tarama sonuçlarının kalıcı geçmişi ve sorguları."""
+
+    def __init__(self, yol: str | Path = VARSAYILAN_YOL):
+        self.yol = Path(yol)
+        self.yol.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._baglan()) as b:
+            b.execute("PRAGMA journal_mode=WAL")
+            b.executescript(_SEMA)
+
+    def _baglan(self) -> sqlite3.Connection:
+        # Her çağrı kendi bağlantısını açar: oturum iş parçacıkları arasında paylaşılmaz
+        return sqlite3.connect(self.yol, timeout=30)
+
+    def _sorgu(self, sql: str, parametreler=()) -> pd.DataFrame:
+        with closing(self._baglan()) as b:
+            return pd.read_sql_query(sql, b, params=list(parametreler))
+
+    # ── Yazma ────────────────────────────────────────────────────────────────
+
+    def ekle(self, df: pd.DataFrame, liste: str, kaynak: str | None = None,
+             kural: str | None = None, esik: int | None = None,
+             zaman: datetime | None = None) -> int:
+        """Sonuç tablosunu tek işlemde ekler; yeni tarama kimliğini döndürür."""
+        zaman = (zaman or datetime.now()).isoformat(sep=" ", timespec="seconds")
+        # Budananların Toplam'ı yok (NA): sıraya ve puan geçmişine girmezler
+        sirali = df[~df["Budandı"].to_numpy(dtype=bool)].sort_values(
+            "Toplam", ascending=False, kind="stable")
+        satirlar = pd.DataFrame({
+            "ticker": sirali["Ticker"].astype(str).to_numpy(),
+            "sira":   range(1, len(sirali) + 1),
+            **{k: sirali[c].to_numpy() for c, k in SAKLANAN_KOLONLAR.items()},
+        })
+        kolonlar = ["ticker", "tarama", "sira", *SAKLANAN_KOLONLAR.values()]
+        with closing(self._baglan()) as b, b:
+            imlec = b.execute(
+                "INSERT INTO taramalar (zaman, liste, kaynak, kural, esik, hisse) VALUES (?, ?, ?, ?, ?, ?)",
+                (zaman, liste, kaynak, kural, esik, len(satirlar)),
+            )
+            tarama = imlec.lastrowid
+            b.executemany(
+                f"INSERT INTO sonuclar ({', '.join(kolonlar)}) VALUES ({', '.join('?' * len(kolonlar))})",
+                ((s[0], tarama, *s[1:]) for s in satirlar.astype(object).itertuples(index=False)),
+            )
+        return tarama
+
+    # ── Sorgular ─────────────────────────────────────────────────────────────
+
+    def taramalar(self, liste: str | None = None, son: int | None = None) -> pd.DataFrame:
+        """Kayıtlı taramalar, eskiden yeniye."""
+        kosul, parametreler = ("WHERE liste = ?", [liste]) if liste else ("", [])
+        df = self._sorgu(
+            f"SELECT * FROM (SELECT * FROM taramalar {kosul} ORDER BY id DESC LIMIT ?) ORDER BY id",
+            [*parametreler, -1 if son is None else son],
+        )
+        df["zaman"] = pd.to_datetime(df["zaman"])
+        return df
+
+    def _son_taramalar(self, liste: str | None, son: int) -> tuple[str, list]:
+        kosul = "WHERE liste = ?" if liste else ""
+        return (f"SELECT id FROM taramalar {kosul} ORDER BY id DESC LIMIT ?",
+                [*([liste] if liste else []), son])
+
+    def hisse_gecmisi(self, tickers: list[str], liste: str | None = None,
+                      son: int = 30) -> pd.DataFrame:
+        """Verilen hisselerin son `son` taramadaki puan ve sıraları (uzun biçim)."""
+        if not tickers:
+            return pd.DataFrame()
+        alt_sorgu, parametreler = self._son_taramalar(liste, son)
+        kodlar = [t.replace(".IS", "") for t in tickers]
+        df = self._sorgu(
+            f"""SELECT t.zaman, s.* FROM sonuclar s JOIN taramalar t ON t.id = s.tarama
+                WHERE s.ticker IN ({', '.join('?' * len(kodlar))}) AND s.tarama IN ({alt_sorgu})
+                ORDER BY s.tarama, s.ticker""",
+            [*kodlar, *parametreler],
+        )
+        df["zaman"] = pd.to_datetime(df["zaman"])
+        return df
+
+    def puan_matrisi(self, tickers: list[str], liste: str | None = None,
+                     son: int = 30, alan: str = "toplam") -> pd.DataFrame:
+        """Zaman × ticker `alan` tablosu (grafik için)."""
+        df = self.hisse_gecmisi(tickers, liste, son)
+        if df.empty:
+            return df
+        return df.pivot(index="zaman", columns="ticker", values=alan)
+
+    def al_degisimleri(self, min_puan: float, liste: str | None = None,
+                       son: int = 30) -> pd.DataFrame:
+        """
+        Son `son` taramada AL listesine girenler ve çıkanlar: her hisse aynı
+        listedeki bir önceki taramasıyla karşılaştırılır.
+        """
+        alt_sorgu, parametreler = self._son_taramalar(liste, son + 1)
+        df = self._sorgu(
+            f"""WITH g AS (
+                    SELECT s.tarama, s.ticker, s.toplam, s.sira,
+                           LAG(s.toplam) OVER (PARTITION BY s.ticker ORDER BY s.tarama) AS onceki
+                    FROM sonuclar s WHERE s.tarama IN ({alt_sorgu}))
+                SELECT t.zaman, g.ticker, g.toplam, g.onceki, g.sira,
+                       CASE WHEN g.toplam >= ? THEN 'Giriş' ELSE 'Çıkış' END AS degisim
+                FROM g JOIN taramalar t ON t.id = g.tarama
+                WHERE g.onceki IS NOT NULL AND (g.toplam >= ?) != (g.onceki >= ?)
+                ORDER BY g.tarama DESC, g.sira""",
+            [*parametreler, min_puan, min_puan, min_puan],
+        )
+        df["zaman"] = pd.to_datetime(df["zaman"])
+        return df
+
+    def sira_degisimleri(self, liste: str | None = None) -> pd.DataFrame:
+        """Son iki tarama arasında sıra ve puan değişimi (yeni sıraya göre)."""
+        alt_sorgu, parametreler = self._son_taramalar(liste, 2)
+        ids = self._sorgu(alt_sorgu, parametreler)["id"].tolist()
+        if len(ids) < 2:
+            return pd.DataFrame()
+        return self._sorgu(
+            """SELECT y.ticker, y.sira, e.sira AS onceki_sira, e.sira - y.sira AS sira_degisimi,
+                      y.toplam, y.toplam - e.toplam AS puan_degisimi
+               FROM sonuclar y LEFT JOIN sonuclar e ON e.ticker = y.ticker AND e.tarama = ?
+               WHERE y.tarama = ? ORDER BY y.sira""",
+            [ids[1], ids[0]],
+        )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# KOMUT SATIRI
+# ─────────────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    ayristirici = argparse.ArgumentParser(description="Tarama geçmişi sorguları")
+    ayristirici.add_argument("--yol", default=str(VARSAYILAN_YOL), help="Geçmiş veritabanı")
+    ayristirici.add_argument("--liste", help="Liste imzası (varsayılan: tüm listeler)")
+    ayristirici.add_argument("--son", type=int, default=30, help="Son kaç tarama")
+    ayristirici.add_argument("--ticker", help="Puan geçmişi yazılacak kodlar (THYAO,GARAN)")
+    ayristirici.add_argument("--min-puan", type=int, default=70, help="AL giriş/çıkışları için eşik")
+    args = ayristirici.parse_args(argv)
+
+    gecmis = TaramaGecmisi(args.yol)
+    if args.ticker:
+        matris = gecmis.puan_matrisi(args.ticker.upper().split(","), args.liste, args.son)
+        print(matris.to_string() if not matris.empty else "Kayıt yok.")
+        return 0
+    print(gecmis.taramalar(args.liste, args.son).to_string(index=False))
+    print()
+    print(gecmis.al_degisimleri(args.min_puan, args.liste, args.son).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
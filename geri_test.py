@@ -0,0 +1,204 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          geri_test.py - Vektörel İleriye Yürüyen Geri Test                   ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+`hisse_analiz_et`in teknik puanı (trend kapısı, RSI, MACD, hacim, ATR) her
+tarih ve her hisse için tek geçişte yeniden üretilir; ardından sinyalden
+sonraki 1 aylık (VADE bar) getiri ve vade içindeki en kötü düşüş ölçülür.
+Sonuçlar puan kovalarına ve `min_puan` eşiklerine göre özetlenir.
+
+Temel veriler geçmişe dönük tutulmadığından varsayılan puan yalnızca tekniktir
+(0-70). `temel` verilirse bugünkü temel puan her tarihe eklenir; bu, ileriye
+bakma yanlılığı içerir.
+
+    python geri_test.py --liste hazir --period 5y
+"""
+
+import argparse
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from gostergeler import fiyat_matrisleri, gosterge_gecmisi, tarihe_dondur
+from puanlama import (
+    TEMEL_BILESENLER, VARSAYILAN_PROFIL, teknik_kodlar, teknik_puan, temel_kodlar,
+)
+from profiller import VARSAYILAN_PROFIL_ADI, PuanProfili, profilleri_yukle
+from temel import TTLOnbellek, TemelVeriToplayici, temel_tablosu
+from tarama import liste_coz, saglayici_olustur
+
+VADE = 21                                  # 1 aylık vade (işlem günü)
+KOVA_GENISLIGI = 10
+ESIKLER = [0, 30, 40, 50, 60, 70, 80, 90]  # 0 → tüm puanlanabilir hücreler
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SİNYAL MATRİSLERİ
+# ─────────────────────────────────────────────────────────────────────────────
+
+def puan_gecmisi(g: dict, temel_puan: np.ndarray | None = None,
+                 profil: PuanProfili | None = None) -> np.ndarray:
+    """`gosterge_gecmisi` matrislerinden bar × ticker puan; puanlanamayan hücre NaN."""
+    profil = profil or VARSAYILAN_PROFIL
+    kodlar, _, _ = teknik_kodlar(g, profil)
+    puan = teknik_puan(kodlar, profil).astype(float)
+    if temel_puan is not None:
+        _, toplam_gecti = profil.kapilar_gecti(kodlar)
+        puan += np.where(toplam_gecti, temel_puan[None, :], 0)
+    # hisse_analiz_et: 50 bardan kısa geçmiş ya da sıfır fiyat puanlanmaz
+    puan[(g["Bar"] < 50) | ~(g["Fiyat"] > 0)] = np.nan
+    return puan
+
+
+def temel_puani(temel: pd.DataFrame, tickers: list[str],
+                profil: PuanProfili | None = None) -> np.ndarray:
+    """Kapılar uygulanmadan temel bileşen puanlarının toplamı."""
+    profil = profil or VARSAYILAN_PROFIL
+    t = temel.reindex(tickers)
+    kodlar = temel_kodlar(*(pd.to_numeric(t[k], errors="coerce").to_numpy(dtype=float)
+                            for k in ["pddd", "fk", "buyume"]), profil)
+    return sum(profil.tablolar[b][kodlar[b]] for b in TEMEL_BILESENLER)
+
+
+def vade_matrisleri(m: dict, vade: int = VADE) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sağa yaslı fiyatlardan her bar için vade sonu getirisi ve vade içindeki en
+    kötü düşüş (sonraki `vade` barın en düşük Low'u / bugünkü kapanış - 1).
+    """
+    kapanis = pd.DataFrame(m["Close"])
+    getiri = kapanis.shift(-vade) / kapanis - 1
+    en_kotu = pd.DataFrame(m["Low"]).rolling(vade).min().shift(-vade) / kapanis - 1
+    return getiri.to_numpy(), en_kotu.to_numpy()
+
+
+def sinyal_matrisleri(panel: pd.DataFrame, temel: pd.DataFrame | None = None,
+                      vade: int = VADE, profil: PuanProfili | None = None) -> dict:
+    """Tarih × ticker hizalı Puan, Getiri ve EnKotu matrisleri."""
+    m = fiyat_matrisleri(panel)
+    tp = temel_puani(temel, m["Ticker"], profil) if temel is not None else None
+    puan = puan_gecmisi(gosterge_gecmisi(m), tp, profil)
+    getiri, en_kotu = vade_matrisleri(m, vade)
+    return {
+        "Puan":   tarihe_dondur(puan, m["Gecerli"]),
+        "Getiri": tarihe_dondur(getiri, m["Gecerli"]),
+        "EnKotu": tarihe_dondur(en_kotu, m["Gecerli"]),
+        "Tarih":  panel.index,
+        "Ticker": m["Ticker"],
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ÖZETLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _maks_dusus(uye: np.ndarray, getiri: np.ndarray, vade: int) -> float:
+    """Her `vade` barda bir yeniden dengelenen eşit ağırlıklı sepetin en büyük düşüşü (%)."""
+    r = getiri[::vade]
+    u = uye[::vade] & ~np.isnan(r)
+    with np.errstate(invalid="ignore"):
+        ort = np.where(u, r, 0.0).sum(axis=1) / u.sum(axis=1)
+    egri = np.concatenate([[1.0], np.cumprod(1 + np.nan_to_num(ort))])
+    return float((egri / np.maximum.accumulate(egri) - 1).min() * 100)
+
+
+def _ozet(uye: np.ndarray, s: dict, vade: int) -> dict:
+    getiri, en_kotu = s["Getiri"][uye], s["EnKotu"][uye]
+    return {
+        "Sinyal":         int(uye.sum()),
+        "Ort. Getiri %":  getiri.mean() * 100,
+        "Medyan %":       np.median(getiri) * 100,
+        "İsabet %":       (getiri > 0).mean() * 100,
+        "Ort. En Kötü %": np.nanmean(en_kotu) * 100,
+        "Maks. Düşüş %":  _maks_dusus(uye, s["Getiri"], vade),
+    }
+
+
+def _sinyaller(s: dict) -> np.ndarray:
+    return ~np.isnan(s["Puan"]) & ~np.isnan(s["Getiri"])
+
+
+def kova_ozeti(s: dict, genislik: int = KOVA_GENISLIGI, vade: int = VADE) -> pd.DataFrame:
+    """Puan kovası başına vade getirisi, isabet oranı ve düşüş."""
+    sinyal = _sinyaller(s)
+    if not sinyal.any():
+        return pd.DataFrame()
+    puan = s["Puan"]
+    satirlar = []
+    for alt in range(0, int(puan[sinyal].max()) + 1, genislik):
+        uye = sinyal & (puan >= alt) & (puan < alt + genislik)
+        if uye.any():
+            satirlar.append({"Kova": f"{alt}-{alt + genislik - 1}", **_ozet(uye, s, vade)})
+    return pd.DataFrame(satirlar)
+
+
+def esik_ozeti(s: dict, esikler: list[int] = ESIKLER, vade: int = VADE) -> pd.DataFrame:
+    """`Toplam >= min_puan` sinyalinin eşik başına sonuçları."""
+    sinyal = _sinyaller(s)
+    satirlar = []
+    for esik in esikler:
+        uye = sinyal & (s["Puan"] >= esik)
+        if uye.any():
+            satirlar.append({"Eşik": f"≥ {esik}", **_ozet(uye, s, vade)})
+    return pd.DataFrame(satirlar)
+
+
+def geri_test(panel: pd.DataFrame, temel: pd.DataFrame | None = None,
+              vade: int = VADE, genislik: int = KOVA_GENISLIGI,
+              profil: PuanProfili | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Panelin tüm geçmişini `profil`e göre puanlar; (kova özeti, eşik özeti) döndürür."""
+    s = sinyal_matrisleri(panel, temel, vade, profil)
+    return kova_ozeti(s, genislik, vade), esik_ozeti(s, vade=vade)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# KOMUT SATIRI
+# ─────────────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    warnings.filterwarnings('ignore')
+    ayristirici = argparse.ArgumentParser(description="Puan kovalarına göre geri test")
+    ayristirici.add_argument("--liste", default="hazir",
+                             help='"hazir", "evren" (bist_evren.csv) ya da virgülle ayrılmış kodlar')
+    ayristirici.add_argument("--kaynak", default="yahoo", help='"yahoo" ya da "csv:<dizin>"')
+    ayristirici.add_argument("--onbelleksiz", action="store_true",
+                             help="Yerel fiyat ve temel veri önbelleklerini kullanma")
+    ayristirici.add_argument("--period", default="5y", help="Geçmiş uzunluğu (örn. 2y, 5y, max)")
+    ayristirici.add_argument("--vade", type=int, default=VADE, help="İleri getiri vadesi (bar)")
+    ayristirici.add_argument("--kova", type=int, default=KOVA_GENISLIGI, help="Puan kovası genişliği")
+    ayristirici.add_argument("--temelli", action="store_true",
+                             help="Bugünkü temel puanı her tarihe ekle (ileriye bakma yanlılığı)")
+    ayristirici.add_argument("--profil", default=VARSAYILAN_PROFIL_ADI, help="Puan profili")
+    args = ayristirici.parse_args(argv)
+
+    tickers = liste_coz(args.liste)
+    if not tickers:
+        ayristirici.error("En az bir hisse kodu gir.")
+    profiller = profilleri_yukle()
+    if args.profil not in profiller:
+        ayristirici.error(f"Bilinmeyen profil: {args.profil} (tanımlı: {', '.join(profiller)})")
+
+    saglayici = saglayici_olustur(args.kaynak, not args.onbelleksiz)
+    panel = saglayici.fiyat_paneli(tickers, period=args.period)
+    if panel.empty:
+        print("Hiçbir hisseden veri çekilemedi.", file=sys.stderr)
+        return 1
+    temel = None
+    if args.temelli:
+        temel = temel_tablosu(TemelVeriToplayici(
+            saglayici, TTLOnbellek() if args.onbelleksiz else None).topla(tickers), tickers)
+
+    kovalar, esikler = geri_test(panel, temel, args.vade, args.kova, profiller[args.profil])
+    print(f"{panel.index[0].date()} → {panel.index[-1].date()}, vade {args.vade} bar, "
+          f"profil {args.profil}\n")
+    print(kovalar.to_string(index=False, float_format="%.2f"))
+    print()
+    print(esikler.to_string(index=False, float_format="%.2f"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
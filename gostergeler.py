@@ -0,0 +1,272 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          gostergeler.py - Vektörel Gösterge Motoru (tarih × ticker)          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+`hesapla_rsi`, `hesapla_macd`, `hesapla_atr`, `hesapla_ma` tek hissenin serisi
+üzerinde çalışır; matris fonksiyonları bunların tüm hisseler için tek geçişte
+çalışan karşılıklarıdır. Girdi, hizalı 2-B dizilerdir (satır = bar, sütun =
+ticker). Her sütun, hissenin yalnızca işlem gördüğü barlardan oluşacak şekilde
+sağa yaslanır (önde NaN dolgusu); böylece EWM ve pencere hesapları tek
+hisselik `history()` serisiyle birebir aynı sonucu verir.
+"""
+
+import numpy as np
+import pandas as pd
+
+from veri import panel_tickerlari
+
+GOSTERGE_KOLONLARI = [
+    "Bar", "Fiyat", "MA50", "MA200", "RSI",
+    "MACD", "Sinyal", "Histogram", "OncekiHist", "ATR", "H5", "H20",
+]
+
+# Trend kapısının (kısa, uzun) hareketli ortalamaları, günlük barda
+TREND_MA = (50, 200)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GÖSTERGE HESAPLAMA FONKSİYONLARI (TEK SERİ)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def hesapla_rsi(fiyatlar: pd.Series, periyot: int = 14) -> float:
+    delta = fiyatlar.diff()
+    kazan = delta.clip(lower=0)
+    kayip = -delta.clip(upper=0)
+    ort_kazan = kazan.ewm(com=periyot - 1, adjust=False).mean()
+    ort_kayip = kayip.ewm(com=periyot - 1, adjust=False).mean()
+    rs = ort_kazan / ort_kayip
+    rsi = 100 - (100 / (1 + rs))
+    return rsi.iloc[-1]
+
+
+def hesapla_macd(fiyatlar: pd.Series, hizli=12, yavas=26, sinyal=9):
+    ema_hizli = fiyatlar.ewm(span=hizli, adjust=False).mean()
+    ema_yavas = fiyatlar.ewm(span=yavas, adjust=False).mean()
+    macd_serisi = ema_hizli - ema_yavas
+    sinyal_serisi = macd_serisi.ewm(span=sinyal, adjust=False).mean()
+    histogram = macd_serisi - sinyal_serisi
+    return (
+        macd_serisi.iloc[-1],
+        sinyal_serisi.iloc[-1],
+        histogram.iloc[-1],
+        histogram.iloc[-2] if len(histogram) > 1 else 0
+    )
+
+
+def hesapla_atr(df: pd.DataFrame, periyot: int = 14) -> float:
+    yuksek = df['High']
+    dusuk = df['Low']
+    kapanis = df['Close']
+    tr1 = yuksek - dusuk
+    tr2 = abs(yuksek - kapanis.shift())
+    tr3 = abs(dusuk - kapanis.shift())
+    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    atr = true_range.ewm(span=periyot, adjust=False).mean()
+    return atr.iloc[-1]
+
+
+def hesapla_ma(fiyatlar: pd.Series, periyot: int) -> float:
+    if len(fiyatlar) < periyot:
+        return np.nan
+    return fiyatlar.rolling(window=periyot).mean().iloc[-1]
+
+
+def tekil_gostergeler(df: pd.DataFrame) -> dict:
+    """Tek hissenin son bar göstergeleri (vektörel motorun referans yolu)."""
+    kapanis = df['Close']
+    macd_val, sinyal_val, hist_val, onceki_hist = hesapla_macd(kapanis)
+    hacim = df['Volume']
+    return {
+        "Bar":        len(df),
+        "Fiyat":      kapanis.iloc[-1],
+        "MA50":       hesapla_ma(kapanis, 50),
+        "MA200":      hesapla_ma(kapanis, 200),
+        "RSI":        hesapla_rsi(kapanis),
+        "MACD":       macd_val,
+        "Sinyal":     sinyal_val,
+        "Histogram":  hist_val,
+        "OncekiHist": onceki_hist,
+        "ATR":        hesapla_atr(df),
+        "H5":         hacim.tail(5).mean(),
+        "H20":        hacim.tail(20).mean(),
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HİZALAMA
+# ─────────────────────────────────────────────────────────────────────────────
+
+def saga_yasla(matris: np.ndarray, gecerli: np.ndarray) -> np.ndarray:
+    """Her sütunun geçerli satırlarını sıralarını koruyarak alta toplar."""
+    sira = np.argsort(gecerli, axis=0, kind="stable")
+    return np.take_along_axis(matris, sira, axis=0)
+
+
+def tarihe_dondur(matris: np.ndarray, gecerli: np.ndarray) -> np.ndarray:
+    """`saga_yasla`nın tersi: sağa yaslı satırları panelin tarih satırlarına geri koyar."""
+    sira = np.argsort(gecerli, axis=0, kind="stable")
+    geri = np.empty_like(matris)
+    np.put_along_axis(geri, sira, matris, axis=0)
+    return geri
+
+
+def fiyat_matrisleri(panel: pd.DataFrame, tickers: list[str] | None = None) -> dict:
+    """
+    Panelden sağa yaslanmış Open/High/Low/Close/Volume matrislerini, her
+    hissenin bar sayısını ve tarih satırlarındaki geçerlilik maskesini döndürür.
+    """
+    tickers = tickers if tickers is not None else panel_tickerlari(panel)
+    kapanis = panel["Close"].reindex(columns=tickers).to_numpy(dtype=float)
+    gecerli = ~np.isnan(kapanis)
+    matrisler = {
+        alan: saga_yasla(panel[alan].reindex(columns=tickers).to_numpy(dtype=float), gecerli)
+        for alan in ["Open", "High", "Low", "Close", "Volume"]
+    }
+    matrisler["Bar"] = gecerli.sum(axis=0)
+    matrisler["Ticker"] = list(tickers)
+    matrisler["Gecerli"] = gecerli
+    return matrisler
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# MATRİS GÖSTERGELERİ
+# ─────────────────────────────────────────────────────────────────────────────
+# pandas'ın sütun bazlı EWM / rolling çekirdekleri kullanılır: tüm hisseler
+# tek çağrıda işlenir ve sonuçlar tek seri hesabıyla bit düzeyinde aynıdır.
+
+def ewm_matrisi(x: np.ndarray, com: float) -> np.ndarray:
+    return pd.DataFrame(x).ewm(com=com, adjust=False).mean().to_numpy()
+
+
+def ma_matrisi(x: np.ndarray, periyot: int) -> np.ndarray:
+    return pd.DataFrame(x).rolling(window=periyot).mean().to_numpy()
+
+
+def _fark(x: np.ndarray) -> np.ndarray:
+    fark = np.full_like(x, np.nan)
+    fark[1:] = x[1:] - x[:-1]
+    return fark
+
+
+def _onceki(x: np.ndarray) -> np.ndarray:
+    onceki = np.full_like(x, np.nan)
+    onceki[1:] = x[:-1]
+    return onceki
+
+
+def rsi_matrisi(kapanis: np.ndarray, periyot: int = 14) -> np.ndarray:
+    delta = _fark(kapanis)
+    kazan = np.clip(delta, 0, None)
+    kayip = -np.clip(delta, None, 0)
+    ort_kazan = ewm_matrisi(kazan, periyot - 1)
+    ort_kayip = ewm_matrisi(kayip, periyot - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = ort_kazan / ort_kayip
+        return 100 - (100 / (1 + rs))
+
+
+def macd_matrisi(kapanis: np.ndarray, hizli=12, yavas=26, sinyal=9):
+    ema_hizli = ewm_matrisi(kapanis, (hizli - 1) / 2)
+    ema_yavas = ewm_matrisi(kapanis, (yavas - 1) / 2)
+    macd = ema_hizli - ema_yavas
+    sinyal_m = ewm_matrisi(macd, (sinyal - 1) / 2)
+    return macd, sinyal_m, macd - sinyal_m
+
+
+def gercek_aralik(yuksek: np.ndarray, dusuk: np.ndarray, onceki: np.ndarray) -> np.ndarray:
+    """True range; `onceki` önceki kapanıştır (ilk barda NaN)."""
+    tr1 = yuksek - dusuk
+    tr2 = np.abs(yuksek - onceki)
+    tr3 = np.abs(dusuk - onceki)
+    # pandas max(axis=1) NaN'ları atlar: fmax ile aynı davranış
+    return np.fmax(np.fmax(tr1, tr2), tr3)
+
+
+def atr_matrisi(yuksek: np.ndarray, dusuk: np.ndarray, kapanis: np.ndarray,
+                periyot: int = 14) -> np.ndarray:
+    true_range = gercek_aralik(yuksek, dusuk, _onceki(kapanis))
+    return ewm_matrisi(true_range, (periyot - 1) / 2)
+
+
+def son_ortalama(x: np.ndarray, n: int) -> np.ndarray:
+    """Her sütunun son n barının NaN atlayan ortalaması (`tail(n).mean()`)."""
+    # Satır bazlı (bitişik eksen) toplam, 1-B seri toplamıyla aynı sırada toplar
+    pencere = np.ascontiguousarray(x[-n:].T)
+    gecerli = ~np.isnan(pencere)
+    with np.errstate(invalid="ignore"):
+        return np.where(gecerli, pencere, 0.0).sum(axis=1) / gecerli.sum(axis=1)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SON DEĞERLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+def hesapla_gostergeler(panel: pd.DataFrame, tickers: list[str] | None = None,
+                        ma: tuple[int, int] = TREND_MA) -> pd.DataFrame:
+    """
+    Tüm hisselerin son bar gösterge değerlerini tek geçişte hesaplar.
+    Sonuç ticker indeksli, GOSTERGE_KOLONLARI sütunlu tablodur. `ma` trend
+    ortalamalarının (kısa, uzun) uzunluğudur; MA50 / MA200 sütunları her
+    zaman bu ikisini taşır (ör. aylık barlarda daha kısa ortalamalar).
+    """
+    return matrislerden_gostergeler(fiyat_matrisleri(panel, tickers), ma)
+
+
+def matrislerden_gostergeler(m: dict, ma: tuple[int, int] = TREND_MA) -> pd.DataFrame:
+    """`fiyat_matrisleri` çıktısından (ya da onun bir sütun diliminden) son değerler."""
+    if not len(m["Ticker"]) or len(m["Close"]) == 0:
+        return pd.DataFrame(columns=GOSTERGE_KOLONLARI, index=pd.Index([], name="Ticker"))
+
+    kapanis = m["Close"]
+    bar = m["Bar"]
+    macd, sinyal, hist = macd_matrisi(kapanis)
+    onceki_hist = hist[-2] if len(hist) > 1 else np.full(len(bar), np.nan)
+
+    return pd.DataFrame({
+        "Bar":        bar,
+        "Fiyat":      kapanis[-1],
+        "MA50":       ma_matrisi(kapanis, ma[0])[-1],
+        "MA200":      ma_matrisi(kapanis, ma[1])[-1],
+        "RSI":        rsi_matrisi(kapanis)[-1],
+        "MACD":       macd[-1],
+        "Sinyal":     sinyal[-1],
+        "Histogram":  hist[-1],
+        "OncekiHist": np.where(bar > 1, onceki_hist, 0.0),
+        "ATR":        atr_matrisi(m["High"], m["Low"], kapanis)[-1],
+        "H5":         son_ortalama(m["Volume"], 5),
+        "H20":        son_ortalama(m["Volume"], 20),
+    }, index=pd.Index(m["Ticker"], name="Ticker"))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TÜM GEÇMİŞ
+# ─────────────────────────────────────────────────────────────────────────────
+
+def gosterge_gecmisi(m: dict) -> dict:
+    """
+    `matrislerden_gostergeler`in her bar için karşılığı: sağa yaslı (bar ×
+    ticker) GOSTERGE_KOLONLARI matrisleri. Satır r, hissenin o bara kadarki
+    geçmişiyle çağrılan `tekil_gostergeler` sonucudur (EWM'ler verinin başından
+    tohumlanır; tarama penceresi kısaysa son basamaklarda fark olabilir).
+    """
+    kapanis = m["Close"]
+    satir = np.arange(len(kapanis))[:, None]
+    bar = np.clip(satir - (len(kapanis) - m["Bar"])[None, :] + 1, 0, None)
+    macd, sinyal, hist = macd_matrisi(kapanis)
+    hacim = pd.DataFrame(m["Volume"])
+    return {
+        "Bar":        bar,
+        "Fiyat":      kapanis,
+        "MA50":       ma_matrisi(kapanis, 50),
+        "MA200":      ma_matrisi(kapanis, 200),
+        "RSI":        rsi_matrisi(kapanis),
+        "MACD":       macd,
+        "Sinyal":     sinyal,
+        "Histogram":  hist,
+        "OncekiHist": np.where(bar > 1, _onceki(hist), 0.0),
+        "ATR":        atr_matrisi(m["High"], m["Low"], kapanis),
+        "H5":         hacim.rolling(5, min_periods=1).mean().to_numpy(),
+        "H20":        hacim.rolling(20, min_periods=1).mean().to_numpy(),
+    }
@@ -0,0 +1,107 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          grafikler.py - AL Listesi Grafikleri ve Sayfalama                   ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+AL listesi satır başına bir Plotly figürü yerine tek bir ısı haritasıyla
+(sayfa başına sabit satır) ya da yalnızca seçilen hissenin bileşen
+grafiğiyle çizilir. Tablolar da sayfa sayfa gönderilir; böylece tarayıcıya
+giden yük ve çizim süresi AL listesi büyüdükçe artmaz.
+"""
+
+import math
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from puanlama import VARSAYILAN_PROFIL
+from profiller import PuanProfili
+
+AL_SAYFA_BOYUTU = 25
+TABLO_SAYFA_BOYUTLARI = [50, 100, 250]
+
+# Alınan / maksimum puan oranı: > 0.6 iyi, > 0.3 orta, diğerleri zayıf
+_RENK_OLCEGI = [
+    [0.0, "#FF6B6B"], [0.3, "#FF6B6B"], [0.3, "#FFD700"],
+    [0.6, "#FFD700"], [0.6, "#00C9FF"], [1.0, "#00C9FF"],
+]
+
+_DUZEN = dict(
+    paper_bgcolor="rgba(0,0,0,0)",
+    plot_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="white"),
+)
+
+
+def _renk(oran: float) -> str:
+    return "#00C9FF" if oran > 0.6 else "#FFD700" if oran > 0.3 else "#FF6B6B"
+
+
+def sayfala(df: pd.DataFrame, sayfa: int, boyut: int) -> tuple[pd.DataFrame, int]:
+    """1'den başlayan `sayfa` numaralı dilim ve toplam sayfa sayısı."""
+    sayfa_sayisi = max(1, math.ceil(len(df) / boyut))
+    sayfa = min(max(sayfa, 1), sayfa_sayisi)
+    return df.iloc[(sayfa - 1) * boyut: sayfa * boyut], sayfa_sayisi
+
+
+def _maks(profil: PuanProfili) -> list[int]:
+    # Sıfır puanlı bileşen oran hesabında bölme hatası vermesin
+    return [max(profil.maks[b], 1) for b in profil.bilesenler]
+
+
+def bilesen_grafigi(satir: pd.Series, profil: PuanProfili | None = None) -> go.Figure:
+    """Tek hissenin bileşen puanları, profilin maksimum puanı üzerine bindirilmiş."""
+    # İsteğe bağlı bileşenler (ör. RG) yalnızca tanımlayan profilde çizilir
+    profil = profil or VARSAYILAN_PROFIL
+    bilesenler = profil.bilesenler
+    kategoriler = [profil.adlar[b] for b in bilesenler]
+    puanlar = [satir[f"P_{b}"] for b in bilesenler]
+    maks = _maks(profil)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=kategoriler, y=maks, name="Maksimum",
+        marker_color="rgba(255,255,255,0.1)",
+    ))
+    fig.add_trace(go.Bar(
+        x=kategoriler, y=puanlar, name="Alınan Puan",
+        marker_color=[_renk(p / m) for p, m in zip(puanlar, maks)],
+    ))
+    fig.update_layout(
+        barmode="overlay",
+        height=250,
+        margin=dict(l=0, r=0, t=20, b=0),
+        showlegend=False,
+        **_DUZEN,
+    )
+    return fig
+
+
+def isi_haritasi(df: pd.DataFrame, profil: PuanProfili | None = None) -> go.Figure:
+    """Satır = hisse, sütun = bileşen; renk alınan/maksimum oranı (`profil`e göre), metin puan."""
+    profil = profil or VARSAYILAN_PROFIL
+    bilesenler = profil.bilesenler
+    puanlar = df[[f"P_{b}" for b in bilesenler]].to_numpy(dtype=float)
+    maks = _maks(profil)
+    etiketler = [f"{t}  ·  {p:.0f}" for t, p in zip(df["Ticker"], df["Toplam"])]
+    fig = go.Figure(go.Heatmap(
+        z=puanlar / maks,
+        x=[profil.adlar[b] for b in bilesenler],
+        y=etiketler,
+        text=puanlar.astype(int),
+        texttemplate="%{text}",
+        customdata=[maks] * len(df),
+        hovertemplate="%{y}<br>%{x}: %{text} / %{customdata}<extra></extra>",
+        colorscale=_RENK_OLCEGI,
+        zmin=0, zmax=1,
+        showscale=False,
+        xgap=2, ygap=2,
+    ))
+    fig.update_layout(
+        height=60 + 26 * len(df),
+        margin=dict(l=0, r=0, t=30, b=0),
+        xaxis=dict(side="top"),
+        yaxis=dict(autorange="reversed"),
+        **_DUZEN,
+    )
+    return fig
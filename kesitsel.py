@@ -0,0 +1,118 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          kesitsel.py - Göreli Güç ve Sektör Sıralaması                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Hisseleri tek tek değil birbirine göre değerlendirir. Tarama zaten indirilmiş
+hizalı fiyat panelini kullanır; XU100 aynı fiyat isteğine eklenir, ayrı bir
+istek yapılmaz. Her şey birkaç dizi / group-by işlemidir:
+
+- `Getiri`: son RG_VADESI bardaki getiri (%)
+- `RG`: endekse göre göreli güç, (1 + getiri) / (1 + endeks getirisi) - 1 (%).
+  Endeks verisi yoksa (ör. çevrimdışı fixture) taranan listenin medyan
+  getirisi ölçüt alınır.
+- `RG_Sektör`: aynı oranın sektör medyan getirisine göre karşılığı
+- `Yüzdelik_Sektör`: Toplam puanın sektör içindeki yüzdelik sırası
+
+RG fiyattan bilindiği için budamadan önce hesaplanır ve profil tanımlarsa
+("RG" bileşeni) teknik puana katılır. Sektör sütunları temel veri (sektör)
+geldikten sonra, birleştirilmiş sonuç tablosunda hesaplanır; sektörü
+bilinmeyen (budanan dahil) hisseler sektör istatistiklerine girmez.
+"""
+
+import numpy as np
+import pandas as pd
+
+from veri import panel_tickerlari
+from gostergeler import saga_yasla
+
+ENDEKS = "XU100.IS"
+RG_VADESI = 21   # 1 aylık vade (~21 işlem günü)
+BILINMEYEN_SEKTOR = "Bilinmiyor"
+
+
+def endeksi_ayir(panel: pd.DataFrame, endeks: str = ENDEKS,
+                 birak: bool = False) -> tuple[pd.DataFrame, pd.Series | None]:
+    """
+    Panelden endeks kapanışlarını ayırır: (hisse paneli, endeks kapanışı).
+    `birak` True ise endeks taranan listede de olduğu için panelde kalır.
+    """
+    if panel.empty or endeks not in panel.columns.get_level_values("Ticker"):
+        return panel, None
+    kapanis = panel[("Close", endeks)].dropna()
+    if not birak:
+        panel = panel.drop(columns=endeks, level="Ticker").dropna(how="all")
+    return panel, kapanis if len(kapanis) else None
+
+
+def _getiri(kapanis: np.ndarray, vade: int) -> np.ndarray:
+    """(tarih × sütun) kapanışlardan her sütunun son `vade` geçerli bardaki getirisi (%)."""
+    gecerli = ~np.isnan(kapanis)
+    bar = gecerli.sum(axis=0)
+    if len(kapanis) <= vade:
+        return np.full(kapanis.shape[1], np.nan)
+    sag = saga_yasla(kapanis, gecerli)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        getiri = (sag[-1] / sag[-1 - vade] - 1) * 100
+    return np.where(bar > vade, getiri, np.nan)
+
+
+def _goreli(getiri, olcut):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return ((100 + getiri) / (100 + olcut) - 1) * 100
+
+
+def goreli_guc(panel: pd.DataFrame, endeks_kapanis: pd.Series | None = None,
+               vade: int = RG_VADESI) -> pd.DataFrame:
+    """Tüm hisselerin getirisi ve endekse göre göreli gücü, tek panel geçişinde."""
+    if panel.empty:
+        return pd.DataFrame(columns=["Getiri", "RG"], index=pd.Index([], name="Ticker"))
+    tickers = panel_tickerlari(panel)
+    getiri = _getiri(panel["Close"].reindex(columns=tickers).to_numpy(dtype=float), vade)
+    if endeks_kapanis is not None:
+        olcut = _getiri(endeks_kapanis.to_numpy(dtype=float)[:, None], vade)[0]
+    else:
+        olcut = np.nanmedian(getiri) if (~np.isnan(getiri)).any() else np.nan
+    return pd.DataFrame({"Getiri": getiri, "RG": _goreli(getiri, olcut)},
+                        index=pd.Index(tickers, name="Ticker"))
+
+
+def _sektor(df: pd.DataFrame) -> pd.Series:
+    """Sektör; bilinmeyenler NaN (group-by dışında kalır)."""
+    return df["Sektör"].where(df["Sektör"].astype(str) != BILINMEYEN_SEKTOR)
+
+
+def sektor_kolonlari_ekle(df: pd.DataFrame) -> pd.DataFrame:
+    """Sonuç tablosuna sektör medyanına göre göreli güç ve sektör içi yüzdelik sırayı ekler."""
+    if df.empty:
+        return df
+    gruplar = df.groupby(_sektor(df), observed=True, sort=False)
+    if "Getiri" in df:
+        medyan = gruplar["Getiri"].transform("median")
+        df["RG_Sektör"] = np.round(_goreli(df["Getiri"], medyan), 1)
+    df["Yüzdelik_Sektör"] = np.round(gruplar["Toplam"].rank(pct=True, method="max") * 100, 1)
+    return df
+
+
+def sektor_ozeti(df: pd.DataFrame, min_puan: float) -> pd.DataFrame:
+    """Sektör başına hisse ve AL sayısı, puan ve göreli güç medyanları (medyan puana göre)."""
+    bilinen = df[_sektor(df).notna()]
+    if bilinen.empty:
+        return pd.DataFrame()
+    ozet = bilinen.assign(AL=bilinen["Toplam"] >= min_puan).groupby(
+        "Sektör", observed=True,
+    ).agg(**{
+        "Hisse": ("Toplam", "size"),
+        f"AL ({min_puan}+)": ("AL", "sum"),
+        "Medyan Toplam": ("Toplam", "median"),
+        "En Yüksek": ("Toplam", "max"),
+        **({"Medyan Getiri %": ("Getiri", "median")} if "Getiri" in bilinen else {}),
+        **({"Medyan RG": ("RG", "median")} if "RG" in bilinen else {}),
+    })
+    return ozet.sort_values("Medyan Toplam", ascending=False, kind="stable").reset_index()
+
+
+def kesitsel_kolonlari(df: pd.DataFrame) -> list[str]:
+    """Tablodaki kesitsel sütunlar, gösterim sırasıyla."""
+    return [k for k in ("Getiri", "RG", "RG_Sektör", "Yüzdelik_Sektör") if k in df.columns]
@@ -0,0 +1,121 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          olcum.py - Aşama Süreleri ve Hisse Bazında Hata Kaydı               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Bir taramanın nereye zaman harcadığını (fiyat indirme, temel veri,
+göstergeler, puanlama, çizim) ve hangi hissenin neden tablodan düştüğünü
+kaydeder. Kayıtlar JSON satırları olarak dışa aktarılır; dosyaya eklenerek
+tarama performansı zaman içinde izlenebilir.
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+# Hisse bazında sınıflandırılmış nedenler
+NEDENLER = {
+    "fiyat_yok":   "Fiyat verisi yok",
+    "az_bar":      "50 bardan az geçmiş",
+    "sifir_fiyat": "Sıfır / geçersiz fiyat",
+    "http_hatasi": "HTTP / bağlantı hatası",
+    "temel_yok":   "Temel veri yok",
+    "hata":        "Beklenmeyen hata",
+    "budandi":     "Budandı (eşiğe ulaşamaz)",
+}
+
+# Bu nedenler hisseyi sonuç tablosundan düşürür
+ELEYEN_NEDENLER = {"fiyat_yok", "az_bar", "sifir_fiyat"}
+
+
+def hata_nedeni(hata: BaseException) -> str:
+    """İstisnayı NEDENLER kategorisine çevirir."""
+    if isinstance(hata, (ConnectionError, TimeoutError)) or getattr(hata, "response", None) is not None:
+        return "http_hatasi"
+    if any(ad in type(hata).__name__ for ad in ("HTTP", "Connection", "Timeout")):
+        return "http_hatasi"
+    return "hata"
+
+
+class TaramaOlcumu:
+    """Tek taramanın aşama süreleri ve hisse kayıtları (iş parçacığı güvenli)."""
+
+    def __init__(self):
+        self.kimlik = uuid.uuid4().hex[:12]
+        self.zaman = time.time()
+        self.asamalar = {}   # aşama → saniye
+        self.hisseler = {}   # ticker → {nedenler, gecikme_ms, deneme, onbellek, ...}
+        self._kilit = threading.Lock()
+
+    @contextmanager
+    def asama(self, ad: str):
+        baslangic = time.perf_counter()
+        try:
+            yield
+        finally:
+            sure = time.perf_counter() - baslangic
+            with self._kilit:
+                self.asamalar[ad] = self.asamalar.get(ad, 0.0) + sure
+
+    def hisse(self, ticker: str, neden: str | None = None, **alanlar):
+        with self._kilit:
+            kayit = self.hisseler.setdefault(ticker, {"nedenler": []})
+            if neden is not None and neden not in kayit["nedenler"]:
+                kayit["nedenler"].append(neden)
+            kayit.update(alanlar)
+
+    # ── Özetler ──────────────────────────────────────────────────────────────
+
+    def neden_sayilari(self) -> Counter:
+        with self._kilit:
+            return Counter(n for k in self.hisseler.values() for n in k["nedenler"])
+
+    def asama_tablosu(self, ek_asamalar: dict | None = None) -> pd.DataFrame:
+        with self._kilit:
+            asamalar = {**self.asamalar, **(ek_asamalar or {})}
+        return pd.DataFrame({"Aşama": list(asamalar), "Süre (s)": list(asamalar.values())})
+
+    def hisse_tablosu(self) -> pd.DataFrame:
+        with self._kilit:
+            satirlar = [
+                {"Ticker": t,
+                 "Neden": ", ".join(NEDENLER[n] for n in k["nedenler"]),
+                 "Gecikme (ms)": k.get("gecikme_ms"),
+                 "Deneme": k.get("deneme"),
+                 "Önbellek": k.get("onbellek")}
+                for t, k in sorted(self.hisseler.items())
+            ]
+        return pd.DataFrame(satirlar, columns=["Ticker", "Neden", "Gecikme (ms)", "Deneme", "Önbellek"])
+
+    # ── Dışa aktarım ─────────────────────────────────────────────────────────
+
+    def kayitlar(self, ek_asamalar: dict | None = None) -> list[dict]:
+        """Tarama özeti, aşama ve hisse kayıtları (her biri bir JSON satırı)."""
+        with self._kilit:
+            asamalar = {**self.asamalar, **(ek_asamalar or {})}
+            hisseler = {t: dict(k) for t, k in self.hisseler.items()}
+        ortak = {"tarama": self.kimlik, "zaman": round(self.zaman, 3)}
+        nedenler = Counter(n for k in hisseler.values() for n in k["nedenler"])
+        return [
+            {**ortak, "tur": "tarama", "toplam_s": round(sum(asamalar.values()), 4),
+             "hisse": len(hisseler), "nedenler": dict(nedenler)},
+            *({**ortak, "tur": "asama", "asama": ad, "sure_s": round(s, 4)}
+              for ad, s in asamalar.items()),
+            *({**ortak, "tur": "hisse", "ticker": t, **k} for t, k in sorted(hisseler.items())),
+        ]
+
+    def jsonl(self, ek_asamalar: dict | None = None) -> str:
+        return "".join(json.dumps(k, ensure_ascii=False) + "\n" for k in self.kayitlar(ek_asamalar))
+
+    def dosyaya_ekle(self, yol: str | Path, ek_asamalar: dict | None = None):
+        yol = Path(yol)
+        yol.parent.mkdir(parents=True, exist_ok=True)
+        with open(yol, "a", encoding="utf-8") as f:
+            f.write(self.jsonl(ek_asamalar))
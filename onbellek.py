@@ -0,0 +1,182 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          onbellek.py - Diskte OHLCV Önbelleği (Artımlı Güncelleme)           ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Her kaynak + ticker + interval için fiyat geçmişi
+`<dizin>/<kaynak eki>/<interval>/<TICKER>.parquet` dosyasında tutulur; kaynak
+eki sağlayıcı sınıfı ve CSV kökünden türetilir, Yahoo ile fixture verisi
+birbirine karışmaz. Sonraki taramalarda yalnızca son önbellekteki bardan
+sonraki barlar indirilir. Kontrol zamanları `_meta.json` içindedir.
+
+Tazelik politikası: bir ticker `tazelik` süresi içinde kontrol edildiyse hiç
+istek atılmaz. Süre dolduysa önbellekteki sondan bir önceki bardan itibaren
+indirilir; o bar değişmişse (bölünme / temettü düzeltmesi) ticker geçersiz
+kılınır ve tüm geçmişi baştan çekilir.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from veri import VeriSaglayici, hisse_verisi, kaynak_eki, panel_olustur, period_baslangici
+
+VARSAYILAN_DIZIN = Path(".onbellek") / "fiyat"
+
+
+def _ayni_tz(ts, indeks: pd.DatetimeIndex) -> pd.Timestamp:
+    ts = pd.Timestamp(ts)
+    if indeks.tz is not None and ts.tz is None:
+        return ts.tz_localize(indeks.tz)
+    if indeks.tz is None and ts.tz is not None:
+        return ts.tz_localize(None)
+    return ts
+
+
+class OnbellekliSaglayici(VeriSaglayici):
+    """Başka bir sağlayıcının önüne konan, diskte kalıcı fiyat önbelleği."""
+
+    def __init__(self, kaynak: VeriSaglayici, dizin: str | Path = VARSAYILAN_DIZIN,
+                 tazelik: pd.Timedelta = pd.Timedelta(minutes=15), rtol: float = 1e-6):
+        self.kaynak = kaynak
+        self.dizin = Path(dizin) / kaynak_eki(kaynak)
+        self.tazelik = tazelik
+        self.rtol = rtol
+
+    @property
+    def ag_gerektirir(self):
+        return self.kaynak.ag_gerektirir
+
+    @property
+    def kimlik(self):
+        return self.kaynak.kimlik
+
+    def temel_veri(self, ticker):
+        return self.kaynak.temel_veri(ticker)
+
+    # ── Dosya düzeni ─────────────────────────────────────────────────────────
+
+    def _klasor(self, interval: str) -> Path:
+        return self.dizin / interval
+
+    def _yol(self, ticker: str, interval: str) -> Path:
+        return self._klasor(interval) / f"{ticker}.parquet"
+
+    def _meta_oku(self, interval: str) -> dict:
+        yol = self._klasor(interval) / "_meta.json"
+        if not yol.exists():
+            return {}
+        return json.loads(yol.read_text(encoding="utf-8"))
+
+    def _meta_yaz(self, interval: str, meta: dict):
+        yol = self._klasor(interval) / "_meta.json"
+        gecici = yol.with_suffix(".tmp")
+        gecici.write_text(json.dumps(meta, indent=1), encoding="utf-8")
+        gecici.replace(yol)
+
+    def _oku(self, ticker: str, interval: str) -> pd.DataFrame | None:
+        yol = self._yol(ticker, interval)
+        return pd.read_parquet(yol) if yol.exists() else None
+
+    def _yaz(self, ticker: str, interval: str, df: pd.DataFrame):
+        yol = self._yol(ticker, interval)
+        gecici = yol.with_suffix(".tmp")
+        df.to_parquet(gecici)
+        gecici.replace(yol)
+
+    # ── Geçersiz kılma ───────────────────────────────────────────────────────
+
+    def gecersiz_kil(self, tickers: list[str] | None = None, interval: str | None = None):
+        """Verilen ticker'ların (None → tümü) önbelleğini siler; sonraki taramada baştan çekilir."""
+        klasorler = [self._klasor(interval)] if interval else [
+            k for k in self.dizin.glob("*") if k.is_dir()
+        ]
+        for klasor in klasorler:
+            if not klasor.exists():
+                continue
+            meta = self._meta_oku(klasor.name)
+            hedefler = tickers if tickers is not None else list(meta) + [
+                y.stem for y in klasor.glob("*.parquet")
+            ]
+            for ticker in set(hedefler):
+                self._yol(ticker, klasor.name).unlink(missing_ok=True)
+                meta.pop(ticker, None)
+            self._meta_yaz(klasor.name, meta)
+
+    # ── Panel ────────────────────────────────────────────────────────────────
+
+    def fiyat_paneli(self, tickers, period="1y", interval="1d", baslangic=None):
+        self._klasor(interval).mkdir(parents=True, exist_ok=True)
+        meta = self._meta_oku(interval)
+        simdi = datetime.now()
+        istenen_bas = (pd.Timestamp(baslangic) if baslangic is not None
+                       else period_baslangici(pd.Timestamp(simdi.date()), period))
+
+        hisseler, eksik, bayat = {}, [], {}
+        for ticker in tickers:
+            df = self._oku(ticker, interval)
+            kayit = meta.get(ticker)
+            if df is None or df.empty or kayit is None:
+                eksik.append(ticker)
+                continue
+            # Önbellek istenenden kısa bir dönemi kapsıyorsa baştan çek
+            kapsam = kayit.get("baslangic")
+            if kapsam is not None and (istenen_bas is None or istenen_bas < pd.Timestamp(kapsam)):
+                eksik.append(ticker)
+                continue
+            hisseler[ticker] = df
+            if simdi - datetime.fromisoformat(kayit["kontrol"]) > self.tazelik:
+                bayat[ticker] = df
+
+        # Bayat hisseler: sondan bir önceki bardan itibaren tek toplu istek
+        if bayat:
+            referanslar = {t: df.index[-2] if len(df) > 1 else df.index[-1] for t, df in bayat.items()}
+            en_eski = min(referanslar.values())
+            yeni = self.kaynak.fiyat_paneli(list(bayat), interval=interval, baslangic=str(en_eski.date()))
+            for ticker, df in bayat.items():
+                ek = hisse_verisi(yeni, ticker)
+                if ek is None or ek.empty:
+                    meta[ticker]["kontrol"] = simdi.isoformat()
+                    continue
+                ref = _ayni_tz(referanslar[ticker], ek.index)
+                if ref in ek.index and not np.isclose(
+                    ek.at[ref, "Close"], df["Close"].iloc[-2 if len(df) > 1 else -1], rtol=self.rtol
+                ):
+                    # Geçmiş düzeltilmiş (bölünme / temettü): ticker'ı baştan çek
+                    del hisseler[ticker]
+                    eksik.append(ticker)
+                    continue
+                birlesik = pd.concat([df[df.index < ek.index[0]], ek])
+                birlesik = birlesik[~birlesik.index.duplicated(keep="last")]
+                self._yaz(ticker, interval, birlesik)
+                hisseler[ticker] = birlesik
+                meta[ticker]["kontrol"] = simdi.isoformat()
+
+        if eksik:
+            yeni = self.kaynak.fiyat_paneli(eksik, period=period, interval=interval, baslangic=baslangic)
+            for ticker in eksik:
+                df = hisse_verisi(yeni, ticker)
+                if df is None or df.empty:
+                    continue
+                self._yaz(ticker, interval, df)
+                hisseler[ticker] = df
+                meta[ticker] = {
+                    "kontrol": simdi.isoformat(),
+                    "baslangic": None if istenen_bas is None else str(istenen_bas.date()),
+                }
+
+        self._meta_yaz(interval, meta)
+
+        # Önbellek istenenden uzun olabilir: istenen dönemi kes
+        for ticker, df in hisseler.items():
+            if baslangic is not None:
+                hisseler[ticker] = df[df.index >= _ayni_tz(baslangic, df.index)]
+            else:
+                ilk = period_baslangici(df.index[-1], period)
+                if ilk is not None:
+                    hisseler[ticker] = df[df.index > ilk]
+        return panel_olustur(hisseler)
@@ -0,0 +1,269 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          optimizasyon.py - Puan Parametreleri için Izgara Taraması           ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+MA periyotları, MACD span'leri, RSI / ATR bant sınırları ve `min_puan`
+eşiğinden oluşan bir ızgara, geçmiş veri üzerinde geri test edilir.
+
+Göstergeler her farklı periyot için bir kez hesaplanır (ör. MA50 küpü tüm MA
+çiftlerinde ortaktır), her seçenek de bir kez bileşen puanına çevrilir.
+Kombinasyon başına yalnızca bu puan vektörleri toplanır; tüm `min_puan`
+eşiklerinin istatistikleri tek `bincount` ile birlikte çıkar. Sıralama örnek
+içi döneme göre yapılır, son dönem (`ayrim`) dış örneklem olarak raporlanır.
+
+Puan tabloları, bant yönleri ve kapılar seçilen profilden gelir; ızgara
+yalnızca periyotları ve bant sınırlarını değiştirir. Temel veri verilmezse
+puan teknik grubun üst sınırını aşamaz; bu sınırın üstündeki `min_puan`
+eşikleri hiç sinyal üretemeyeceği için atlanır.
+
+    python optimizasyon.py --liste hazir --period 5y --izgara izgara.json
+    python optimizasyon.py --profil muhafazakar --temelli
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from gostergeler import (
+    fiyat_matrisleri, gosterge_gecmisi, ma_matrisi, macd_matrisi, saga_yasla,
+)
+from puanlama import VARSAYILAN_PROFIL, bant_kodu, macd_kodu, teknik_kodlar, trend_kodu
+from profiller import (
+    EN_YUKSEK_PUAN, SIFIRLANABILIR, VARSAYILAN_PROFIL_ADI, PuanProfili, profilleri_yukle,
+)
+from temel import TTLOnbellek, TemelVeriToplayici, temel_tablosu
+from geri_test import VADE, temel_puani, vade_matrisleri
+from tarama import liste_coz, saglayici_olustur
+
+VARSAYILAN_IZGARA = {
+    "MA":       [[50, 200], [20, 50], [50, 100], [20, 200]],
+    "MACD":     [[12, 26, 9], [8, 17, 9], [5, 35, 5]],
+    "RSI":      [[30, 50, 65, 70, 80], [30, 45, 60, 70, 80],
+                 [30, 50, 60, 65, 75], [25, 45, 65, 75, 85]],
+    "ATR":      [[1, 2, 5, 8], [1, 2, 4, 6], [0.5, 1.5, 4, 7]],
+    "min_puan": [30, 40, 50, 60, 70, 80, 90],
+}
+
+
+# Izgarada değişen bileşenler; profilin diğer teknik bileşenleri sabit kalır
+IZGARA_BILESENLERI = {"MA": "Trend", "MACD": "MACD", "RSI": "RSI", "ATR": "ATR"}
+
+
+def _bant_dogrula(ad: str, sinirlar: list, profil: PuanProfili) -> list:
+    beklenen = len(profil.bantlar[ad]["sinirlar"])
+    if len(sinirlar) != beklenen or list(sinirlar) != sorted(sinirlar):
+        raise ValueError(f"{ad} için {beklenen} artan sınır gerekli: {sinirlar}")
+    return list(sinirlar)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BİLEŞEN PUANLARI
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _ve(maskeler) -> np.ndarray | None:
+    """Kapı maskelerinin kesişimi; kapı yoksa None (hepsi geçer)."""
+    maskeler = [k for k in maskeler if k is not None]
+    return np.logical_and.reduce(maskeler) if maskeler else None
+
+
+def _secenek(profil: PuanProfili, bilesen: str, kod: np.ndarray) -> tuple:
+    """Bileşen kodlarından (puan, teknik kapısı, toplam kapısı); kapısı olmayan None."""
+    kapilar = {g: [k["gecer"][kod] for k in profil.kapilar
+                   if k["bilesen"] == bilesen and k["sifirlar"] == g] for g in SIFIRLANABILIR}
+    toplam = _ve(kapilar["toplam"])
+    # kapilar_gecti ile aynı: toplamı sıfırlayan kapı teknik puanı da sıfırlar
+    return (profil.tablolar[bilesen][kod].astype(np.int16),
+            _ve([*kapilar["teknik"], toplam]), toplam)
+
+
+def bilesen_puanlari(m: dict, izgara: dict, hucre: np.ndarray,
+                     profil: PuanProfili | None = None) -> dict:
+    """
+    Her ızgara seçeneği için seçili hücrelerin (1-B) `_secenek` üçlüsü.
+    Profilin ızgarada olmayan teknik bileşenleri (ör. hacim) "Sabit" altında
+    tek üçlüde birleşir.
+    """
+    profil = profil or VARSAYILAN_PROFIL
+    g = gosterge_gecmisi(m)
+    kodlar, _, volatilite = teknik_kodlar(g, profil)
+    kapanis = m["Close"]
+    fiyat = kapanis[hucre]
+
+    ma = {p: ma_matrisi(kapanis, p)[hucre]
+          for p in sorted({p for cift in izgara["MA"] for p in cift})}
+    trend = {(kisa, uzun): _secenek(profil, "Trend", trend_kodu(fiyat, ma[kisa], ma[uzun]))
+             for kisa, uzun in izgara["MA"]}
+
+    macd = {}
+    for hizli, yavas, sinyal in izgara["MACD"]:
+        m_, s_, h_ = macd_matrisi(kapanis, hizli, yavas, sinyal)
+        onceki = np.vstack([np.full((1, h_.shape[1]), np.nan), h_[:-1]])
+        kod = macd_kodu(m_[hucre], s_[hucre], h_[hucre], onceki[hucre])
+        macd[(hizli, yavas, sinyal)] = _secenek(profil, "MACD", kod)
+
+    def bant(ad, x):
+        x = x[hucre]
+        return {
+            tuple(s): _secenek(profil, ad, bant_kodu(
+                x, {**profil.bantlar[ad], "sinirlar": s}, np.isnan(x)))
+            for s in (_bant_dogrula(ad, s, profil) for s in izgara[ad])
+        }
+
+    sabit = [_secenek(profil, b, kodlar[b][hucre]) for b in profil.teknik_bilesenler
+             if b not in IZGARA_BILESENLERI.values()]
+    return {
+        "MA":    trend,
+        "MACD":  macd,
+        "RSI":   bant("RSI", g["RSI"]),
+        "ATR":   bant("ATR", volatilite),
+        "Sabit": (sum(s[0] for s in sabit), _ve(s[1] for s in sabit), _ve(s[2] for s in sabit)),
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# IZGARA
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _esik_toplami(anahtar: np.ndarray, agirlik, kutu: int, esikler: np.ndarray) -> np.ndarray:
+    """(örnek içi/dış) × eşik: puanı eşiğe eşit ya da büyük hücrelerin ağırlık toplamı."""
+    t = np.bincount(anahtar, agirlik, minlength=2 * kutu).reshape(2, kutu)
+    return t[:, ::-1].cumsum(axis=1)[:, ::-1][:, esikler]
+
+
+def optimize_et(panel: pd.DataFrame, izgara: dict | None = None,
+                temel: pd.DataFrame | None = None, vade: int = VADE,
+                ayrim: float = 0.7, min_sinyal: int = 100,
+                profil: PuanProfili | None = None) -> pd.DataFrame:
+    """
+    Izgaradaki her (MA, MACD, RSI, ATR, min_puan) kombinasyonu için vade
+    getirisi istatistikleri, `profil`in puanları ve kapılarıyla (None →
+    varsayılan). İlk `ayrim` oranındaki tarihler örnek içidir; tablo örnek
+    içi ortalama getiriye göre sıralıdır. Ulaşılamayan `min_puan`lar atlanır.
+    """
+    profil = profil or VARSAYILAN_PROFIL
+    izgara = {**VARSAYILAN_IZGARA, **(izgara or {})}
+    m = fiyat_matrisleri(panel)
+    gecerli = m["Gecerli"]
+    getiri, en_kotu = vade_matrisleri(m, vade)
+
+    # Puanlanabilir ve vadesi dolmuş hücreler (hisse_analiz_et'in 50 bar kapısı dahil)
+    satir = np.arange(len(gecerli))[:, None]
+    bar = satir - (len(gecerli) - m["Bar"])[None, :] + 1
+    hucre = (bar >= 50) & (m["Close"] > 0) & ~np.isnan(getiri) & ~np.isnan(en_kotu)
+
+    tarih_satiri = saga_yasla(np.broadcast_to(satir, gecerli.shape).copy(), gecerli)
+    dis = (tarih_satiri[hucre] >= int(len(gecerli) * ayrim)).astype(np.int16)
+    r, kotu = getiri[hucre], en_kotu[hucre]
+    kazandi = (r > 0).astype(float)
+    temel_p = (np.broadcast_to(temel_puani(temel, m["Ticker"], profil), gecerli.shape)[hucre]
+               .astype(np.int16) if temel is not None else None)
+
+    # Temel veri yoksa puan teknik grubun üst sınırında kalır
+    ust = profil.grup_maks["teknik"] + (profil.grup_maks["temel"] if temel is not None else 0)
+    esikler = np.asarray([e for e in izgara["min_puan"] if e <= ust], dtype=int)
+    p = bilesen_puanlari(m, izgara, hucre, profil)
+    sabit_p, sabit_tk, sabit_tp = p["Sabit"]
+    kutu = EN_YUKSEK_PUAN + 1
+    satirlar = []
+    for (ma, (trend_p, trend_tk, trend_tp)), (macd, (macd_p, macd_tk, macd_tp)) in \
+            itertools.product(p["MA"].items(), p["MACD"].items()):
+        taban = trend_p + macd_p + sabit_p
+        taban_tk, taban_tp = _ve([trend_tk, macd_tk, sabit_tk]), _ve([trend_tp, macd_tp, sabit_tp])
+        for (rsi, (rsi_p, rsi_tk, rsi_tp)), (atr, (atr_p, atr_tk, atr_tp)) in \
+                itertools.product(p["RSI"].items(), p["ATR"].items()):
+            toplam = taban + rsi_p + atr_p
+            teknik_gecti = _ve([taban_tk, rsi_tk, atr_tk])
+            if teknik_gecti is not None:
+                toplam = np.where(teknik_gecti, toplam, 0)
+            if temel_p is not None:
+                toplam_gecti = _ve([taban_tp, rsi_tp, atr_tp])
+                toplam = toplam + (temel_p if toplam_gecti is None
+                                   else np.where(toplam_gecti, temel_p, 0))
+            anahtar = toplam + kutu * dis
+            n, top_r, top_k, top_kotu = (_esik_toplami(anahtar, a, kutu, esikler)
+                                         for a in (None, r, kazandi, kotu))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ort, isabet, ort_kotu = top_r / n * 100, top_k / n * 100, top_kotu / n * 100
+            for i, esik in enumerate(esikler):
+                satirlar.append({
+                    "MA": ma, "MACD": macd, "RSI": rsi, "ATR": atr, "min_puan": int(esik),
+                    "Sinyal":          int(n[0, i]),
+                    "Ort. Getiri %":   ort[0, i],
+                    "İsabet %":        isabet[0, i],
+                    "Ort. En Kötü %":  ort_kotu[0, i],
+                    "Dış Sinyal":      int(n[1, i]),
+                    "Dış Getiri %":    ort[1, i],
+                    "Dış İsabet %":    isabet[1, i],
+                })
+
+    sonuc = pd.DataFrame(satirlar)
+    if sonuc.empty:
+        return sonuc
+    sonuc = sonuc[sonuc["Sinyal"] >= min_sinyal]
+    return sonuc.sort_values(["Ort. Getiri %", "Sinyal"], ascending=False).reset_index(drop=True)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# KOMUT SATIRI
+# ─────────────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    warnings.filterwarnings('ignore')
+    ayristirici = argparse.ArgumentParser(description="Puan parametreleri için ızgara taraması")
+    ayristirici.add_argument("--liste", default="hazir",
+                             help='"hazir", "evren" (bist_evren.csv) ya da virgülle ayrılmış kodlar')
+    ayristirici.add_argument("--kaynak", default="yahoo", help='"yahoo" ya da "csv:<dizin>"')
+    ayristirici.add_argument("--onbelleksiz", action="store_true",
+                             help="Yerel fiyat ve temel veri önbelleklerini kullanma")
+    ayristirici.add_argument("--period", default="5y", help="Geçmiş uzunluğu (örn. 2y, 5y, max)")
+    ayristirici.add_argument("--izgara", help="Izgara JSON dosyası (VARSAYILAN_IZGARA anahtarları)")
+    ayristirici.add_argument("--vade", type=int, default=VADE, help="İleri getiri vadesi (bar)")
+    ayristirici.add_argument("--ayrim", type=float, default=0.7, help="Örnek içi tarih oranı")
+    ayristirici.add_argument("--min-sinyal", type=int, default=100, help="En az örnek içi sinyal")
+    ayristirici.add_argument("--ilk", type=int, default=20, help="Yazdırılacak satır sayısı")
+    ayristirici.add_argument("--cikti", help="Tüm sonuçlar için CSV dosyası")
+    ayristirici.add_argument("--temelli", action="store_true",
+                             help="Bugünkü temel puanı her tarihe ekle (ileriye bakma yanlılığı); "
+                                  "yoksa teknik üst sınırı aşan min_puan eşikleri atlanır")
+    ayristirici.add_argument("--profil", default=VARSAYILAN_PROFIL_ADI, help="Puan profili")
+    args = ayristirici.parse_args(argv)
+
+    tickers = liste_coz(args.liste)
+    if not tickers:
+        ayristirici.error("En az bir hisse kodu gir.")
+    profiller = profilleri_yukle()
+    if args.profil not in profiller:
+        ayristirici.error(f"Bilinmeyen profil: {args.profil} (tanımlı: {', '.join(profiller)})")
+    izgara = None
+    if args.izgara:
+        with open(args.izgara, encoding="utf-8") as f:
+            izgara = json.load(f)
+
+    saglayici = saglayici_olustur(args.kaynak, not args.onbelleksiz)
+    panel = saglayici.fiyat_paneli(tickers, period=args.period)
+    if panel.empty:
+        print("Hiçbir hisseden veri çekilemedi.", file=sys.stderr)
+        return 1
+    temel = None
+    if args.temelli:
+        temel = temel_tablosu(TemelVeriToplayici(
+            saglayici, TTLOnbellek() if args.onbelleksiz else None).topla(tickers), tickers)
+
+    sonuc = optimize_et(panel, izgara, temel, vade=args.vade, ayrim=args.ayrim,
+                        min_sinyal=args.min_sinyal, profil=profiller[args.profil])
+    if args.cikti:
+        sonuc.to_csv(args.cikti, index=False, encoding="utf-8-sig")
+        print(f"{len(sonuc)} satır yazıldı: {args.cikti}", file=sys.stderr)
+    print(sonuc.head(args.ilk).to_string(index=False, float_format="%.2f"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          profiller.py - Bildirimsel Puan Profilleri                          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Bant sınırları, puanlar, etiketler ve kapılar (ör. trend filtresi) kodda değil
+`puan_profilleri.json` dosyasında tanımlıdır. Her profil bir kez doğrulanıp
+`PuanProfili`ne derlenir: sınırlar float, kod → puan tabloları tamsayı dizisi
+olur. Puanlama kodu yalnızca `searchsorted` ve tablo okumasıdır; birden çok
+profil aynı gösterge girdileri üzerinde profil başına tek geçişle puanlanır.
+
+Dosyada her anahtar bir profildir:
+
+    "momentum": {
+        "taban": "varsayilan",                 # isteğe bağlı: devralınan profil
+        "baslik": "Momentum", "aciklama": "...",
+        "bilesenler": {"RSI": {"sinirlar": [...], "puanlar": [...]}, ...},
+        "kapilar": [{"bilesen": "Trend", "gecer": [...], "sifirlar": "teknik"}]
+    }
+
+Bant bileşenleri `yon`, `sinirlar`, `puanlar`, `etiketler`; koşul bileşenleri
+(Trend, MACD) yalnızca `puanlar` ve `etiketler` alır. Son kod her zaman "veri
+yok" durumudur. Bir kapı, bileşen kodu `gecer` listesinde False ise `teknik`
+grubunu ya da `toplam`ı sıfırlar. Bileşen kümesi ve grupları sabittir: sonuç
+tablosu, geçmiş veritabanı ve budama bunlara dayanır. İsteğe bağlı teknik
+bileşenler (ISTEGE_BAGLI_BILESENLER, ör. endekse göre göreli güç "RG")
+yalnızca tanımlayan profillerde puanlanır.
+"""
+
+import copy
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+PROFIL_DOSYASI = Path(__file__).with_name("puan_profilleri.json")
+VARSAYILAN_PROFIL_ADI = "varsayilan"
+
+BILESENLER = ["PDDD", "FK", "Kar", "Trend", "RSI", "MACD", "Hacim", "ATR"]
+TEMEL_BILESENLER = ["PDDD", "FK", "Kar"]
+TEKNIK_BILESENLER = ["Trend", "RSI", "MACD", "Hacim", "ATR"]
+# Profilde tanımlanırsa teknik gruba eklenen, fiyattan kesitsel hesaplanan bileşenler
+ISTEGE_BAGLI_BILESENLER = ["RG"]
+
+# Bant bileşenlerinin okuduğu değer (sonuç tablosu sütunu)
+BANT_DEGERLERI = {
+    "PDDD": "PD/DD", "FK": "F/K", "Kar": "Büyüme",
+    "RSI": "RSI", "Hacim": "Hacim Oranı", "ATR": "Volatilite", "RG": "RG",
+}
+# Koşul bileşenlerinin kod sayısı (`trend_kodu` / `macd_kodu`)
+KOSUL_KOD_SAYISI = {"Trend": 5, "MACD": 6}
+
+EN_YUKSEK_PUAN = 100
+SIFIRLANABILIR = ("teknik", "toplam")
+
+
+class PuanProfili:
+    """Doğrulanmış ve dizilere derlenmiş tek puan profili."""
+
+    def __init__(self, ad: str, tanim: dict):
+        self.ad = ad
+        self.baslik = tanim.get("baslik", ad)
+        self.aciklama = tanim.get("aciklama", "")
+        bilesenler = tanim.get("bilesenler", {})
+        fark = (set(BILESENLER) ^ set(bilesenler)) - set(ISTEGE_BAGLI_BILESENLER)
+        if fark:
+            raise ValueError(f"{ad}: bileşenler {BILESENLER} olmalı (fark: {sorted(fark)})")
+        ek = [b for b in ISTEGE_BAGLI_BILESENLER if b in bilesenler]
+        self.bilesenler = [*BILESENLER, *ek]
+        self.teknik_bilesenler = [*TEKNIK_BILESENLER, *ek]
+
+        self.adlar, self.aciklamalar = {}, {}
+        self.bantlar, self.kosullar, self.etiketler = {}, {}, {}
+        for b in self.bilesenler:
+            k = bilesenler[b]
+            self.adlar[b] = k.get("ad", b)
+            self.aciklamalar[b] = k.get("aciklama", "")
+            if b in BANT_DEGERLERI:
+                sinirlar = [float(s) for s in k["sinirlar"]]
+                if sinirlar != sorted(sinirlar):
+                    raise ValueError(f"{ad}.{b}: sınırlar artan sırada olmalı: {sinirlar}")
+                if k["yon"] not in ("<", ">"):
+                    raise ValueError(f"{ad}.{b}: yon '<' ya da '>' olmalı: {k['yon']!r}")
+                kod_sayisi = len(sinirlar) + 2
+            else:
+                kod_sayisi = KOSUL_KOD_SAYISI[b]
+            puanlar, etiketler = [int(p) for p in k["puanlar"]], list(k["etiketler"])
+            if len(puanlar) != kod_sayisi or len(etiketler) != kod_sayisi:
+                raise ValueError(f"{ad}.{b}: {kod_sayisi} puan ve etiket gerekli "
+                                 f"({len(puanlar)} puan, {len(etiketler)} etiket)")
+            if min(puanlar) < 0:
+                raise ValueError(f"{ad}.{b}: puanlar negatif olamaz: {puanlar}")
+            try:
+                for e in etiketler:
+                    e.format(1.0)
+            except (IndexError, KeyError, ValueError) as hata:
+                raise ValueError(f"{ad}.{b}: etiket biçimi geçersiz: {hata}") from None
+            self.etiketler[b] = etiketler
+            if b in BANT_DEGERLERI:
+                # bant_kodu ile uyumlu kural sözlüğü
+                self.bantlar[b] = {"deger": BANT_DEGERLERI[b], "yon": k["yon"],
+                                   "sinirlar": sinirlar, "puanlar": puanlar,
+                                   "etiketler": etiketler}
+            else:
+                self.kosullar[b] = {"puanlar": puanlar, "etiketler": etiketler}
+
+        self.kapilar = []
+        for kapi in tanim.get("kapilar", []):
+            b = kapi["bilesen"]
+            if b not in self.teknik_bilesenler:
+                # Budama temel veriden önce yapılır: kapı yalnızca fiyattan bilinmeli
+                raise ValueError(f"{ad}: kapı bileşeni teknik olmalı: {b!r}")
+            if kapi["sifirlar"] not in SIFIRLANABILIR:
+                raise ValueError(f"{ad}: kapı {SIFIRLANABILIR} gruplarından birini sıfırlar")
+            gecer = np.asarray(kapi["gecer"], dtype=bool)
+            if len(gecer) != len(self.etiketler[b]):
+                raise ValueError(f"{ad}: {b} kapısı {len(self.etiketler[b])} kod için tanımlanmalı")
+            self.kapilar.append({"bilesen": b, "gecer": gecer, "sifirlar": kapi["sifirlar"]})
+
+        # Derlenmiş tablolar
+        self.tablolar = {b: np.asarray((self.bantlar.get(b) or self.kosullar[b])["puanlar"],
+                                       dtype=np.int16) for b in self.bilesenler}
+        self.sinirlar = {b: np.asarray(k["sinirlar"], dtype=float) for b, k in self.bantlar.items()}
+        self.maks = {b: int(t.max()) for b, t in self.tablolar.items()}
+        self.grup_maks = {"temel": sum(self.maks[b] for b in TEMEL_BILESENLER),
+                          "teknik": sum(self.maks[b] for b in self.teknik_bilesenler)}
+        self.temel_ust_sinir = self.grup_maks["temel"]
+        if sum(self.grup_maks.values()) > EN_YUKSEK_PUAN:
+            raise ValueError(f"{ad}: en yüksek toplam {sum(self.grup_maks.values())} "
+                             f"> {EN_YUKSEK_PUAN}")
+
+        kurallar = {
+            "bantlar": {b: [k["yon"], k["sinirlar"], k["puanlar"]] for b, k in self.bantlar.items()},
+            "kosullar": {b: k["puanlar"] for b, k in self.kosullar.items()},
+            "kapilar": [[k["bilesen"], k["gecer"].tolist(), k["sifirlar"]] for k in self.kapilar],
+        }
+        self.imza = hashlib.sha1(json.dumps(kurallar, sort_keys=True).encode()).hexdigest()[:12]
+
+    def __repr__(self) -> str:
+        return f"PuanProfili({self.ad!r}, imza={self.imza})"
+
+    def kapili(self, bilesen: str) -> bool:
+        return any(k["bilesen"] == bilesen for k in self.kapilar)
+
+    def etiket(self, bilesen: str, kod: int, deger=None) -> str:
+        return self.etiketler[bilesen][kod].format(deger)
+
+    # ── Değerlendirme ────────────────────────────────────────────────────────
+
+    def kapilar_gecti(self, kodlar: dict) -> tuple[np.ndarray, np.ndarray]:
+        """(teknik grubu, toplam) kapılarından geçen hücreler."""
+        sekil = np.shape(kodlar[TEKNIK_BILESENLER[0]])
+        gecti = {g: np.ones(sekil, dtype=bool) for g in SIFIRLANABILIR}
+        for kapi in self.kapilar:
+            gecti[kapi["sifirlar"]] &= kapi["gecer"][kodlar[kapi["bilesen"]]]
+        return gecti["teknik"] & gecti["toplam"], gecti["toplam"]
+
+    def degerlendir(self, kodlar: dict) -> tuple[dict, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Kodlardan bileşen puanları, kapılı temel ve teknik toplamlar ve tüm
+        kapılardan geçiş. Temel kodlar verilmezse temel toplam 0'dır; profilin
+        tanımlamadığı isteğe bağlı bileşen kodları yok sayılır.
+        """
+        puanlar = {b: self.tablolar[b][k] for b, k in kodlar.items() if b in self.tablolar}
+        teknik_gecti, toplam_gecti = self.kapilar_gecti(kodlar)
+        teknik = np.where(teknik_gecti, sum(puanlar[b] for b in self.teknik_bilesenler), 0)
+        temel = np.where(toplam_gecti, sum(puanlar[b] for b in TEMEL_BILESENLER if b in puanlar), 0)
+        return puanlar, temel, teknik, teknik_gecti
+
+    def ust_sinir(self, teknik_kodlar: dict) -> np.ndarray:
+        """Yalnızca teknik kodlardan: temel tam puan alsa ulaşılabilecek en yüksek toplam."""
+        _, _, teknik, _ = self.degerlendir(teknik_kodlar)
+        _, toplam_gecti = self.kapilar_gecti(teknik_kodlar)
+        return teknik + np.where(toplam_gecti, self.temel_ust_sinir, 0)
+
+
+def _coz(ad: str, tanimlar: dict, zincir: tuple = ()) -> dict:
+    """`taban` zincirini izleyerek profil tanımını bileşen bazında birleştirir."""
+    if ad not in tanimlar:
+        raise ValueError(f"Bilinmeyen puan profili: {ad!r}")
+    if ad in zincir:
+        raise ValueError(f"Döngüsel profil tabanı: {' → '.join((*zincir, ad))}")
+    tanim = tanimlar[ad]
+    if "taban" not in tanim:
+        return copy.deepcopy(tanim)
+    sonuc = _coz(tanim["taban"], tanimlar, (*zincir, ad))
+    for anahtar, deger in tanim.items():
+        if anahtar == "bilesenler":
+            for b, alanlar in deger.items():
+                sonuc["bilesenler"].setdefault(b, {}).update(copy.deepcopy(alanlar))
+        elif anahtar != "taban":
+            sonuc[anahtar] = copy.deepcopy(deger)
+    return sonuc
+
+
+def profilleri_yukle(yol: str | Path = PROFIL_DOSYASI) -> dict[str, PuanProfili]:
+    """Dosyadaki tüm profiller, tanım sırasıyla. Varsayılan profil zorunludur."""
+    with open(yol, encoding="utf-8") as f:
+        tanimlar = json.load(f)
+    if VARSAYILAN_PROFIL_ADI not in tanimlar:
+        raise ValueError(f"{yol}: '{VARSAYILAN_PROFIL_ADI}' profili tanımlı değil")
+    return {ad: PuanProfili(ad, _coz(ad, tanimlar)) for ad in tanimlar}
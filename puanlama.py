@@ -0,0 +1,496 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          puanlama.py - Dizi Tabanlı Puanlama Çekirdeği                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+`puan_*` fonksiyonları tek hisseyi puanlar; `puanla` aynı kuralların sütun
+bazlı karşılığıdır. Her bileşen önce bir bant koduna (K_*) çevrilir, puan bu
+kodla tablodan okunur. Sınırlar, puan tabloları, etiketler ve kapılar
+`profiller.PuanProfili`nden gelir (`profil` verilmezse varsayılan profil).
+İnsan okunur `A_*` etiketleri puanlamada üretilmez;
+yalnızca gösterilen / dışa aktarılan satırlar için `etiketler_ekle` ile
+koddan türetilir.
+
+Sonuç tablosu tiplidir: kod ve puanlar küçük tamsayı, trend kapısı bool,
+sektör kategorik. Budanan hisselerin Temel / Toplam puanı bilinmez: bu
+sütunlar boş olabilen Int16'dır (NA), ortalamalara ve sıralara girmez. "✅ Evet" gibi görüntü metinleri de yalnızca çizim ve dışa
+aktarımda (`goruntu_metinleri`) üretilir.
+"""
+
+import numbers
+
+import numpy as np
+import pandas as pd
+
+from profiller import (
+    BILESENLER, ISTEGE_BAGLI_BILESENLER, TEMEL_BILESENLER,
+    VARSAYILAN_PROFIL_ADI, PuanProfili, profilleri_yukle,
+)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PROFİLLER
+# ─────────────────────────────────────────────────────────────────────────────
+# Kurallar puan_profilleri.json'dadır; `profil` parametresi verilmeyen her
+# fonksiyon varsayılan profili kullanır. Aşağıdaki sabitler varsayılan profilin
+# derlenmiş tablolarıdır (optimizasyon ve geri test bunlar üzerinde çalışır).
+
+VARSAYILAN_PROFIL = profilleri_yukle()[VARSAYILAN_PROFIL_ADI]
+
+BANT_KURALLARI = VARSAYILAN_PROFIL.bantlar
+PUAN_TABLOLARI = VARSAYILAN_PROFIL.tablolar
+TREND_GECER_DIZI = next(k["gecer"] for k in VARSAYILAN_PROFIL.kapilar if k["bilesen"] == "Trend")
+TEMEL_UST_SINIR = VARSAYILAN_PROFIL.temel_ust_sinir
+
+# CSV / dışa aktarım sütun sırası (hisse_analiz_et sözlüğüyle aynı)
+SONUC_KOLONLARI = [
+    "Ticker", "Fiyat", "MA50", "MA200", "RSI", "PD/DD", "F/K", "Sektör", "Trend Geçti",
+    *[k for b in BILESENLER for k in (f"P_{b}", f"A_{b}")],
+    "Temel", "Teknik", "Toplam", "Budandı",
+]
+# İsteğe bağlı, sona eklenen sütunlar: yan yana profiller (Toplam_<ad>), zaman
+# dilimleri (Teknik_<dilim>, Trend_<dilim>, Uyum_<dilim>, Uyum) ve kesitsel
+# aşama (Getiri, RG, RG_Sektör, Yüzdelik_Sektör)
+EK_KOLON_ONEKLERI = ("Toplam_", "Teknik_", "Trend_", "Uyum", "Getiri", "RG", "Yüzdelik_")
+
+
+def _profil(profil: PuanProfili | None) -> PuanProfili:
+    return VARSAYILAN_PROFIL if profil is None else profil
+
+
+def kural_imzasi(profil: PuanProfili | None = None) -> str:
+    """Puan kurallarının kısa özeti; kurallar değişince önbellek anahtarları da değişir."""
+    return _profil(profil).imza
+
+
+def karsilastirma_kolonu(profil: PuanProfili) -> str:
+    """Yan yana puanlanan profilin Toplam sütunu."""
+    return f"Toplam_{profil.ad}"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SKALER PUANLAMA FONKSİYONLARI (TEK HİSSE)
+# ─────────────────────────────────────────────────────────────────────────────
+# Referans yol: kodlar if zincirleriyle bulunur, puan ve etiket profilden okunur.
+
+def _eksik(x) -> bool:
+    return x is None or (isinstance(x, float) and np.isnan(x))
+
+
+def _bant_kodu_skaler(kural: dict, x, gecersiz: bool) -> int:
+    sinirlar = kural["sinirlar"]
+    if gecersiz:
+        return len(sinirlar) + 1
+    if kural["yon"] == "<":
+        return next((i for i, s in enumerate(sinirlar) if x < s), len(sinirlar))
+    return next((i for i, s in enumerate(reversed(sinirlar)) if x > s), len(sinirlar))
+
+
+def _trend_kodu_skaler(fiyat, ma50, ma200) -> int:
+    if np.isnan(ma50) or np.isnan(ma200):
+        return 4
+    f_ma50, f_ma200, ma50_ma200 = fiyat > ma50, fiyat > ma200, ma50 > ma200
+    if f_ma50 and f_ma200 and ma50_ma200:
+        return 0
+    elif f_ma50 and f_ma200:
+        return 1
+    elif f_ma200 and not f_ma50:
+        return 2
+    return 3
+
+
+def _macd_kodu_skaler(macd, sinyal, histogram, onceki_hist) -> int:
+    if any(np.isnan(v) for v in [macd, sinyal, histogram, onceki_hist]):
+        return 5
+    pozitif, hist_poz, hist_art = macd > sinyal, histogram > 0, histogram > onceki_hist
+    if pozitif and hist_poz and hist_art: return 0
+    elif pozitif and hist_poz:            return 1
+    elif pozitif:                         return 2
+    elif hist_art:                        return 3
+    return 4
+
+
+def _bant_puani(bilesen: str, x, gecersiz: bool, profil) -> tuple[int, str]:
+    profil = _profil(profil)
+    kod = _bant_kodu_skaler(profil.bantlar[bilesen], x, gecersiz)
+    return int(profil.tablolar[bilesen][kod]), profil.etiket(bilesen, kod, x)
+
+
+def puan_pddd(pddd, profil=None):
+    return _bant_puani("PDDD", pddd, _eksik(pddd) or pddd <= 0, profil)
+
+
+def puan_fk(fk, profil=None):
+    return _bant_puani("FK", fk, _eksik(fk) or fk <= 0, profil)
+
+
+def puan_kar_buyumesi(buyume, profil=None):
+    return _bant_puani("Kar", buyume, _eksik(buyume), profil)
+
+
+def puan_trend(fiyat, ma50, ma200, profil=None):
+    """Puan, etiket ve trend kapılarından geçiş."""
+    profil = _profil(profil)
+    kod = _trend_kodu_skaler(fiyat, ma50, ma200)
+    gecti = all(k["gecer"][kod] for k in profil.kapilar if k["bilesen"] == "Trend")
+    return int(profil.tablolar["Trend"][kod]), profil.etiket("Trend", kod), gecti
+
+
+def puan_rsi(rsi, profil=None):
+    return _bant_puani("RSI", rsi, np.isnan(rsi), profil)
+
+
+def puan_macd(macd, sinyal, histogram, onceki_hist, profil=None):
+    profil = _profil(profil)
+    kod = _macd_kodu_skaler(macd, sinyal, histogram, onceki_hist)
+    return int(profil.tablolar["MACD"][kod]), profil.etiket("MACD", kod)
+
+
+def puan_hacim(h5, h20, profil=None):
+    gecersiz = h20 == 0 or np.isnan(h5) or np.isnan(h20)
+    return _bant_puani("Hacim", np.nan if gecersiz else h5 / h20, gecersiz, profil)
+
+
+def puan_atr(atr, fiyat, profil=None):
+    gecersiz = fiyat <= 0 or np.isnan(atr) or np.isnan(fiyat)
+    return _bant_puani("ATR", np.nan if gecersiz else (atr / fiyat) * 100, gecersiz, profil)
+
+
+def skaler_puanla(g, pddd, fk, buyume, profil=None) -> dict:
+    """
+    Tek hissenin gösterge sözlüğü (`tekil_gostergeler`) ve temel verilerinden
+    bileşen puan / etiketleri ile kapılı Temel, Teknik ve Toplam.
+    """
+    profil = _profil(profil)
+    fiyat = g["Fiyat"]
+    gecersiz_hacim = g["H20"] == 0 or np.isnan(g["H5"]) or np.isnan(g["H20"])
+    gecersiz_atr = fiyat <= 0 or np.isnan(g["ATR"]) or np.isnan(fiyat)
+    degerler = {
+        "PDDD": pddd, "FK": fk, "Kar": buyume, "RSI": g["RSI"],
+        "Hacim": np.nan if gecersiz_hacim else g["H5"] / g["H20"],
+        "ATR":   np.nan if gecersiz_atr else (g["ATR"] / fiyat) * 100,
+        "RG":    g.get("RG", np.nan),
+    }
+    gecersiz = {
+        "PDDD": _eksik(pddd) or pddd <= 0, "FK": _eksik(fk) or fk <= 0,
+        "Kar": _eksik(buyume), "RSI": np.isnan(g["RSI"]),
+        "Hacim": gecersiz_hacim, "ATR": gecersiz_atr, "RG": _eksik(degerler["RG"]),
+    }
+    kodlar = {b: _bant_kodu_skaler(profil.bantlar[b], degerler[b], gecersiz[b])
+              for b in profil.bantlar}
+    kodlar["Trend"] = _trend_kodu_skaler(fiyat, g["MA50"], g["MA200"])
+    kodlar["MACD"] = _macd_kodu_skaler(g["MACD"], g["Sinyal"], g["Histogram"], g["OncekiHist"])
+
+    puanlar = {b: int(profil.tablolar[b][kodlar[b]]) for b in profil.bilesenler}
+    teknik_gecti, toplam_gecti = (bool(x) for x in profil.kapilar_gecti(kodlar))
+    temel = sum(puanlar[b] for b in TEMEL_BILESENLER) if toplam_gecti else 0
+    teknik = sum(puanlar[b] for b in profil.teknik_bilesenler) if teknik_gecti else 0
+    return {
+        "puanlar":   puanlar,
+        "etiketler": {b: profil.etiket(b, kodlar[b], degerler.get(b)) for b in profil.bilesenler},
+        "gecti":     teknik_gecti,
+        "Temel":     temel,
+        "Teknik":    teknik,
+        "Toplam":    temel + teknik,
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# KOD HESAPLAMA
+# ─────────────────────────────────────────────────────────────────────────────
+
+def bant_kodu(x: np.ndarray, kural: dict, gecersiz: np.ndarray) -> np.ndarray:
+    sinirlar = np.asarray(kural["sinirlar"], dtype=float)
+    if kural["yon"] == "<":
+        kod = np.searchsorted(sinirlar, x, side="right")
+    else:
+        kod = len(sinirlar) - np.searchsorted(sinirlar, x, side="left")
+    return np.where(gecersiz, len(kural["puanlar"]) - 1, kod).astype(np.int8)
+
+
+def trend_kodu(fiyat, ma50, ma200) -> np.ndarray:
+    f_ma50, f_ma200, ma50_ma200 = fiyat > ma50, fiyat > ma200, ma50 > ma200
+    kod = np.select(
+        [np.isnan(ma50) | np.isnan(ma200),
+         f_ma50 & f_ma200 & ma50_ma200,
+         f_ma50 & f_ma200,
+         f_ma200 & ~f_ma50],
+        [4, 0, 1, 2],
+        default=3,
+    )
+    return kod.astype(np.int8)
+
+
+def macd_kodu(macd, sinyal, histogram, onceki_hist) -> np.ndarray:
+    eksik = np.isnan(macd) | np.isnan(sinyal) | np.isnan(histogram) | np.isnan(onceki_hist)
+    pozitif, hist_poz, hist_art = macd > sinyal, histogram > 0, histogram > onceki_hist
+    kod = np.select(
+        [eksik, pozitif & hist_poz & hist_art, pozitif & hist_poz, pozitif, hist_art],
+        [5, 0, 1, 2, 3],
+        default=4,
+    )
+    return kod.astype(np.int8)
+
+
+# Teknik kodların ihtiyaç duyduğu gösterge alanları; kesitsel aşama çalıştıysa
+# "RG" (endekse göre göreli güç) de okunur
+GOSTERGE_ALANLARI = ["Fiyat", "MA50", "MA200", "RSI", "MACD", "Sinyal", "Histogram",
+                     "OncekiHist", "ATR", "H5", "H20"]
+
+
+def _temel_girdiler(pddd, fk, buyume) -> dict:
+    """Temel bant bileşenlerinin (değer, "veri yok") çiftleri."""
+    return {
+        "PDDD": (pddd, np.isnan(pddd) | (pddd <= 0)),
+        "FK":   (fk, np.isnan(fk) | (fk <= 0)),
+        "Kar":  (buyume, np.isnan(buyume)),
+    }
+
+
+def _teknik_girdiler(g: dict) -> tuple[dict, dict, np.ndarray, np.ndarray]:
+    """Teknik bant girdileri, profilden bağımsız koşul kodları, hacim oranı, volatilite."""
+    fiyat, atr, h5, h20 = g["Fiyat"], g["ATR"], g["H5"], g["H20"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hacim_orani = h5 / h20
+        volatilite = (atr / fiyat) * 100
+    bantlar = {
+        "RSI":   (g["RSI"], np.isnan(g["RSI"])),
+        "Hacim": (hacim_orani, (h20 == 0) | np.isnan(h5) | np.isnan(h20)),
+        "ATR":   (volatilite, (fiyat <= 0) | np.isnan(atr) | np.isnan(fiyat)),
+    }
+    # Göreli güç yalnızca kesitsel aşamadan gelir; yoksa "veri yok"
+    rg = g["RG"] if "RG" in g else np.full(np.shape(fiyat), np.nan)
+    bantlar["RG"] = (rg, np.isnan(rg))
+    kosullar = {
+        "Trend": trend_kodu(fiyat, g["MA50"], g["MA200"]),
+        "MACD":  macd_kodu(g["MACD"], g["Sinyal"], g["Histogram"], g["OncekiHist"]),
+    }
+    return bantlar, kosullar, hacim_orani, volatilite
+
+
+def _kodla(bantlar: dict, kosullar: dict, profil: PuanProfili,
+           paylasilan: dict | None = None) -> dict:
+    """
+    Bant girdilerini profilin sınırlarıyla koda çevirir (profilin tanımlamadığı
+    isteğe bağlı bileşenler atlanır). `paylasilan` verilirse aynı sınırlı
+    bantlar profiller arasında bir kez kodlanır.
+    """
+    paylasilan = {} if paylasilan is None else paylasilan
+    kodlar = dict(kosullar)
+    for b, (x, gecersiz) in bantlar.items():
+        if b not in profil.bantlar:
+            continue
+        kural = profil.bantlar[b]
+        anahtar = (b, kural["yon"], tuple(kural["sinirlar"]))
+        if anahtar not in paylasilan:
+            paylasilan[anahtar] = bant_kodu(x, kural, gecersiz)
+        kodlar[b] = paylasilan[anahtar]
+    return kodlar
+
+
+def temel_kodlar(pddd, fk, buyume, profil: PuanProfili | None = None) -> dict:
+    return _kodla(_temel_girdiler(pddd, fk, buyume), {}, _profil(profil))
+
+
+def teknik_kodlar(g: dict, profil: PuanProfili | None = None) -> tuple[dict, np.ndarray, np.ndarray]:
+    """
+    Gösterge dizilerinden (her şekilde: 1-B son değerler ya da 2-B bar × ticker
+    geçmişi) teknik bileşen kodlarını, hacim oranını ve volatiliteyi üretir.
+    """
+    bantlar, kosullar, hacim_orani, volatilite = _teknik_girdiler(g)
+    return _kodla(bantlar, kosullar, _profil(profil)), hacim_orani, volatilite
+
+
+def teknik_puan(kodlar: dict, profil: PuanProfili | None = None) -> np.ndarray:
+    """Kapıları uygulanmış teknik puan."""
+    profil = _profil(profil)
+    return profil.degerlendir({b: kodlar[b] for b in profil.teknik_bilesenler})[2]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PUANLAMA
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _puanlanabilir(gostergeler: pd.DataFrame) -> pd.DataFrame:
+    # hisse_analiz_et ile aynı: 50 bardan kısa ya da fiyatı sıfır olanlar elenir
+    return gostergeler[(gostergeler["Bar"] >= 50) & (gostergeler["Fiyat"] > 0)]
+
+
+def _gosterge_dizileri(g: pd.DataFrame) -> dict:
+    return {k: g[k].to_numpy(dtype=float) for k in [*GOSTERGE_ALANLARI, "RG"] if k in g}
+
+
+def teknik_on_puan(gostergeler: pd.DataFrame, profil: PuanProfili | None = None) -> pd.Series:
+    """Yalnızca fiyattan: puanlanabilir hisselerin (kesin) teknik puanı."""
+    g = _puanlanabilir(gostergeler)
+    kodlar, _, _ = teknik_kodlar(_gosterge_dizileri(g), profil)
+    return pd.Series(teknik_puan(kodlar, profil), index=g.index, name="Teknik")
+
+
+def teknik_tablosu(gostergeler: pd.DataFrame, profil: PuanProfili | None = None) -> pd.DataFrame:
+    """
+    Yalnızca fiyattan: puanlanabilir hisselerin teknik puanı ve tüm kapılardan
+    geçişi (ör. başka bir zaman diliminin göstergeleri için).
+    """
+    g = _puanlanabilir(gostergeler)
+    kodlar, _, _ = teknik_kodlar(_gosterge_dizileri(g), profil)
+    _, _, teknik, gecti = _profil(profil).degerlendir(kodlar)
+    return pd.DataFrame({"Teknik": teknik.astype(np.int16), "Geçti": gecti}, index=g.index)
+
+
+def budanacaklar(gostergeler: pd.DataFrame, min_puan: float,
+                 tam_liste=(), profiller=None) -> list[str]:
+    """
+    Temel bileşenlerden tam puan alsa bile `min_puan`a ulaşamayan hisseler
+    (kapılardan geçemeyenler dahil). Birden çok profil verilirse yalnızca
+    hiçbirinde ulaşamayanlar budanır. `tam_liste` hiçbir zaman budanmaz.
+    """
+    g = _puanlanabilir(gostergeler)
+    bantlar, kosullar, _, _ = _teknik_girdiler(_gosterge_dizileri(g))
+    paylasilan = {}
+    ust = np.max([p.ust_sinir(_kodla(bantlar, kosullar, p, paylasilan))
+                  for p in map(_profil, profiller or [None])], axis=0)
+    ulasamaz = g.index[ust < min_puan]
+    return [t for t in ulasamaz if t not in set(tam_liste)]
+
+
+def _toplam_kolonu(puan: np.ndarray, budandi: np.ndarray) -> pd.arrays.IntegerArray:
+    """Int16 puan; temel verisi çekilmeyen (budanan) hücreler NA."""
+    return pd.arrays.IntegerArray(np.asarray(puan, dtype=np.int16), budandi.copy())
+
+
+def puanla(gostergeler: pd.DataFrame, temel: pd.DataFrame, budanan=(),
+           profil: PuanProfili | None = None, karsilastirma=()) -> pd.DataFrame:
+    """
+    `hesapla_gostergeler` çıktısı ve `temel_tablosu` (pddd, fk, sektor, buyume)
+    ile tüm hisseleri tek geçişte puanlar. `budanan` hisselerin temel verisi
+    çekilmemiştir: "Budandı" ile işaretlenip tabloda kalır, bileşenleri "Veri
+    yok" puanı alır ama Temel / Toplam (ve `Toplam_<ad>`) NA'dır.
+
+    Girdiler ve koşul kodları bir kez hazırlanır; `karsilastirma`daki her
+    profil bunlar üzerinde tek geçişle puanlanıp `Toplam_<ad>` sütunu olur.
+    """
+    profil = _profil(profil)
+    g = _puanlanabilir(gostergeler)
+    t = temel.reindex(g.index)
+
+    fiyat = g["Fiyat"].to_numpy(dtype=float)
+    ma50, ma200 = g["MA50"].to_numpy(dtype=float), g["MA200"].to_numpy(dtype=float)
+    rsi = g["RSI"].to_numpy(dtype=float)
+    pddd = pd.to_numeric(t["pddd"], errors="coerce").to_numpy(dtype=float)
+    fk = pd.to_numeric(t["fk"], errors="coerce").to_numpy(dtype=float)
+    buyume = pd.to_numeric(t["buyume"], errors="coerce").to_numpy(dtype=float)
+
+    bantlar, kosullar, hacim_orani, volatilite = _teknik_girdiler(_gosterge_dizileri(g))
+    bantlar.update(_temel_girdiler(pddd, fk, buyume))
+    paylasilan = {}
+    kodlar = _kodla(bantlar, kosullar, profil, paylasilan)
+    puanlar, temel_p, teknik_p, trend_gecti = profil.degerlendir(kodlar)
+
+    budandi = g.index.isin(list(budanan))
+    pddd_var = ~np.isnan(pddd) & (pddd != 0)
+    fk_var = ~np.isnan(fk) & (fk != 0)
+    sonuc = pd.DataFrame({
+        "Ticker":      pd.array(g.index.str.replace(".IS", "", regex=False),
+                                dtype="string[pyarrow]"),
+        "Fiyat":       np.round(fiyat, 2),
+        "MA50":        np.round(ma50, 2),
+        "MA200":       np.round(ma200, 2),
+        "RSI":         np.round(rsi, 1),
+        "PD/DD":       np.where(pddd_var, np.round(pddd, 2), np.nan),
+        "F/K":         np.where(fk_var, np.round(fk, 1), np.nan),
+        "Sektör":      pd.Categorical(t["sektor"].fillna("Bilinmiyor")),
+        "Trend Geçti": trend_gecti,
+        "Büyüme":      buyume,
+        "Hacim Oranı": hacim_orani,
+        "Volatilite":  volatilite,
+        **{f"K_{b}": kodlar[b].astype(np.int8) for b in profil.bilesenler},
+        **{f"P_{b}": puanlar[b].astype(np.int8) for b in profil.bilesenler},
+        "Temel":       _toplam_kolonu(temel_p, budandi),
+        "Teknik":      teknik_p.astype(np.int16),
+        "Toplam":      _toplam_kolonu(temel_p + teknik_p, budandi),
+        "Budandı":     budandi,
+    })
+    # Kesitsel aşamanın sütunları (ya da RG puanlayan profilin "veri yok" değeri)
+    if "Getiri" in g:
+        sonuc["Getiri"] = np.round(g["Getiri"].to_numpy(dtype=float), 1)
+    if "RG" in g or "RG" in profil.bantlar:
+        sonuc["RG"] = np.round(bantlar["RG"][0], 1)
+    for p in karsilastirma:
+        _, temel_k, teknik_k, _ = p.degerlendir(_kodla(bantlar, kosullar, p, paylasilan))
+        sonuc[karsilastirma_kolonu(p)] = _toplam_kolonu(temel_k + teknik_k, budandi)
+    return sonuc
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TEMBEL ETİKETLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+def etiketler_ekle(df: pd.DataFrame, profil: PuanProfili | None = None) -> pd.DataFrame:
+    """Yalnızca verilen satırlar için A_* etiket sütunlarını üretir."""
+    profil = _profil(profil)
+    df = df.copy()
+    for b, kural in profil.bantlar.items():
+        df[f"A_{b}"] = [kural["etiketler"][k].format(v)
+                        for k, v in zip(df[f"K_{b}"], df[kural["deger"]])]
+    for b, kural in profil.kosullar.items():
+        df[f"A_{b}"] = [kural["etiketler"][k] for k in df[f"K_{b}"]]
+    return df
+
+
+def goruntu_metinleri(df: pd.DataFrame) -> pd.DataFrame:
+    """Bool kapı ve uyum sütunlarını "✅ Evet" / "❌ Hayır" metnine çevirir (kopya)."""
+    df = df.copy()
+    for k in df.columns:
+        if k == "Trend Geçti" or k.startswith(("Trend_", "Uyum")):
+            df[k] = np.where(df[k], "✅ Evet", "❌ Hayır")
+    return df
+
+
+def disa_aktarim_tablosu(df: pd.DataFrame, profil: PuanProfili | None = None) -> pd.DataFrame:
+    """
+    CSV için etiketli, hisse_analiz_et sütun düzeninde tablo; yan yana
+    profil, isteğe bağlı bileşen, zaman dilimi ve kesitsel sütunlar sona eklenir.
+    """
+    ek_bilesenler = [k for b in ISTEGE_BAGLI_BILESENLER if f"K_{b}" in df
+                     for k in (f"P_{b}", f"A_{b}")]
+    kolonlar = [*SONUC_KOLONLARI, *ek_bilesenler,
+                *(k for k in df.columns if k.startswith(EK_KOLON_ONEKLERI))]
+    return goruntu_metinleri(etiketler_ekle(df, profil)[kolonlar])
+
+
+def profil_karsilastirmasi(df: pd.DataFrame, profil: PuanProfili,
+                           karsilastirma) -> pd.DataFrame:
+    """Aynı taramanın profillere göre toplam puanı ve sırası, aktif profilin sırasıyla."""
+    tablo = pd.DataFrame({"Ticker": df["Ticker"].astype(str).to_numpy()})
+    for p in [profil, *karsilastirma]:
+        toplam = df["Toplam"] if p is profil else df[karsilastirma_kolonu(p)]
+        tablo[p.baslik] = toplam.array
+        # Budananlar (NA) sıra almaz
+        tablo[f"Sıra · {p.baslik}"] = (toplam.rank(ascending=False, method="min")
+                                       .astype("Int32").array)
+    return tablo.sort_values(f"Sıra · {profil.baslik}", kind="stable").reset_index(drop=True)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TABLO RENKLERİ
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Arayüzdeki "Tüm Hisseler" tablosunun sütunları
+TABLO_KOLONLARI = [
+    "Ticker", "Fiyat", "RSI", "PD/DD", "F/K",
+    "Trend Geçti", "Temel", "Teknik", "Toplam", "Sektör", "Budandı",
+]
+
+
+def renk_puan(val):
+    if isinstance(val, numbers.Real):
+        if val >= 70: return "background-color: #1a4a1a; color: #7fff7f"
+        elif val >= 50: return "background-color: #3a3a00; color: #ffff88"
+        else: return "background-color: #3a0000; color: #ff9999"
+    return ""
+
+
+def puan_tablosu_stili(df: pd.DataFrame):
+    """Tüm hisseler tablosunun Toplam sütununu puan bandına göre renklendirir."""
+    return goruntu_metinleri(df).style.map(renk_puan, subset=["Toplam"])
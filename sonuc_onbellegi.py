@@ -0,0 +1,120 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          sonuc_onbellegi.py - Süreç Geneli, Tek Uçuşlu Sonuç Önbelleği       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Aynı sunucuya bağlı birden çok oturum aynı listeyi aynı anda taramak
+istediğinde tarama yalnızca bir kez çalışır ("single-flight"): ilk istek
+taramayı yürütür, diğerleri onun sonucunu bekler. Biten sonuçlar `ttl` dolana
+(yeni barlar gelene) kadar paylaşılır. Kayıt sayısı ve toplam bellek sınırı
+aşılınca en uzun süredir kullanılmayan sonuçlar atılır (LRU).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import pandas as pd
+
+
+class TaramaKesildi(Exception):
+    """Beklenen tarama sahibinin oturumunda durduruldu (kısmi sonuç paylaşılmaz)."""
+
+
+def _boyut(deger) -> int:
+    if isinstance(deger, pd.DataFrame):
+        return int(deger.memory_usage(deep=True).sum())
+    if isinstance(deger, tuple):
+        return sum(_boyut(d) for d in deger)
+    return 0
+
+
+class TaramaOnbellegi:
+    def __init__(self, max_kayit: int = 32, max_bellek_mb: float = 256, ttl: float = 15 * 60):
+        self.max_kayit = max_kayit
+        self.max_bellek = max_bellek_mb * 1024 * 1024
+        self.ttl = ttl
+        self._kayitlar = OrderedDict()   # anahtar → (değer, zaman, ttl, boyut)
+        self._ucustakiler = {}           # anahtar → Future
+        self._kilit = threading.Lock()
+        self.istatistik = {"isabet": 0, "bekleme": 0, "tarama": 0, "atilan": 0}
+
+    # ── Yardımcılar ──────────────────────────────────────────────────────────
+
+    def _gecerli(self, kayit) -> bool:
+        _, zaman, ttl, _ = kayit
+        return time.time() - zaman < ttl
+
+    def _bellek(self) -> int:
+        return sum(k[3] for k in self._kayitlar.values())
+
+    def _tahliye(self):
+        while self._kayitlar and (len(self._kayitlar) > self.max_kayit
+                                  or self._bellek() > self.max_bellek):
+            self._kayitlar.popitem(last=False)
+            self.istatistik["atilan"] += 1
+
+    # ── API ──────────────────────────────────────────────────────────────────
+
+    def getir(self, anahtar, hesapla, ttl: float | None = None, zorla: bool = False,
+              beklerken=None):
+        """
+        Anahtarın sonucunu döndürür: (değer, durum). durum "onbellek", "bekledi"
+        ya da "tarandi" olur. Aynı anahtar için süren bir tarama varsa ona
+        katılınır; `zorla` yalnızca hazır önbellek kaydını atlar. `beklerken()`
+        başka bir oturumun taramasını beklemeye başlamadan önce çağrılır.
+        """
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+            if kayit is not None and not zorla and self._gecerli(kayit):
+                self._kayitlar.move_to_end(anahtar)
+                self.istatistik["isabet"] += 1
+                return kayit[0], "onbellek"
+            ucus = self._ucustakiler.get(anahtar)
+            sahip = ucus is None
+            if sahip:
+                ucus = Future()
+                self._ucustakiler[anahtar] = ucus
+
+        if not sahip:
+            if beklerken:
+                beklerken()
+            with self._kilit:
+                self.istatistik["bekleme"] += 1
+            return ucus.result(), "bekledi"
+
+        try:
+            deger = hesapla()
+        except BaseException as hata:
+            with self._kilit:
+                del self._ucustakiler[anahtar]
+            # Streamlit'in yeniden çalıştırma sinyali gibi kesintiler bekleyenlere taşınmaz
+            ucus.set_exception(hata if isinstance(hata, Exception) else TaramaKesildi())
+            raise
+
+        with self._kilit:
+            boyut = _boyut(deger)
+            # Tek başına sınırı aşan sonuç saklanmaz, diğerlerini de silmez
+            if boyut <= self.max_bellek:
+                self._kayitlar[anahtar] = (deger, time.time(), self.ttl if ttl is None else ttl, boyut)
+                self._kayitlar.move_to_end(anahtar)
+                self._tahliye()
+            del self._ucustakiler[anahtar]
+            self.istatistik["tarama"] += 1
+        ucus.set_result(deger)
+        return deger, "tarandi"
+
+    def temizle(self):
+        with self._kilit:
+            self._kayitlar.clear()
+
+    def ozet(self) -> dict:
+        with self._kilit:
+            return {
+                **self.istatistik,
+                "kayit": len(self._kayitlar),
+                "bellek_mb": round(self._bellek() / 1024 / 1024, 2),
+                "suren": len(self._ucustakiler),
+            }
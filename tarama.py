@@ -0,0 +1,463 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          tarama.py - Arayüzsüz Tarama Motoru + Komut Satırı                  ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Streamlit veya Plotly içe aktarmadan çalışır; yfinance yalnızca veri gerçekten
+Yahoo'dan çekilirken yüklenir. cron / toplu işler için:
+
+    python tarama.py --liste hazir --cikti sonuc.csv
+    python tarama.py --liste THYAO,GARAN --kaynak csv:veri_fixture --cikti sonuc.json
+    python tarama.py --liste evren --isci 8 --cikti evren.parquet
+    python tarama.py --liste evren --gecmis        # sonucu tarama geçmişine ekle
+    python tarama.py --liste evren --durum         # gün içi yeniden taramada yalnızca son bar
+    python tarama.py --profil momentum --karsilastir varsayilan,muhafazakar
+    python tarama.py --liste evren --zaman-dilimleri haftalik,aylik,saatlik
+    python tarama.py --liste evren --kesitsel      # XU100'e göre göreli güç + sektör sırası
+"""
+
+import argparse
+import sys
+import threading
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from veri import VeriSaglayici, YahooSaglayici, CSVSaglayici, donem_kes, hisse_verisi
+from onbellek import OnbellekliSaglayici
+from temel import TTLOnbellek, TemelVeriToplayici, temel_ayikla, temel_tablosu
+from gostergeler import hesapla_gostergeler, tekil_gostergeler
+from olcum import TaramaOlcumu
+from gecmis import VARSAYILAN_YOL as VARSAYILAN_GECMIS, TaramaGecmisi, liste_imzasi
+from artimli import VARSAYILAN_DIZIN as VARSAYILAN_DURUM_DIZINI, GostergeDurumu, durum_yolu
+from paralel import PARALEL_ESIK, paralel_gostergeler
+from puanlama import (
+    puanla, disa_aktarim_tablosu, goruntu_metinleri, budanacaklar, teknik_on_puan, kural_imzasi,
+    karsilastirma_kolonu, skaler_puanla,
+)
+from profiller import PROFIL_DOSYASI, VARSAYILAN_PROFIL_ADI, PuanProfili, profilleri_yukle
+from zaman_dilimi import (
+    ZAMAN_DILIMLERI, dilim_kolonlari, dilim_kolonlari_ekle, dilim_panelleri, dilim_tablosu,
+    gunluk_period,
+)
+from kesitsel import (
+    ENDEKS, endeksi_ayir, goreli_guc, kesitsel_kolonlari, sektor_kolonlari_ekle, sektor_ozeti,
+)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BIST HİSSE LİSTESİ
+# ─────────────────────────────────────────────────────────────────────────────
+
+BIST_LISTESI = [
+    "AKBNK.IS", "GARAN.IS", "HALKB.IS", "ISCTR.IS", "VAKBN.IS", "YKBNK.IS",
+    "QNBFB.IS", "TSKB.IS", "ALBRK.IS", "KLNMA.IS",
+    "KCHOL.IS", "SAHOL.IS", "SISE.IS", "KOZAA.IS", "KOZAL.IS", "TUPRS.IS",
+    "EREGL.IS", "ARCLK.IS", "BIMAS.IS", "MIGROS.IS", "TCELL.IS",
+    "THYAO.IS", "PGSUS.IS", "ULKER.IS", "AEFES.IS",
+    "ENKAI.IS", "AYGAZ.IS", "DOHOL.IS", "PETKM.IS", "GUBRF.IS", "EKGYO.IS",
+    "TOASO.IS", "FROTO.IS", "OTKAR.IS", "TTRAK.IS",
+    "ASELS.IS", "LOGO.IS", "NETAS.IS", "KAREL.IS", "ARENA.IS",
+    "ISGYO.IS", "TRGYO.IS", "ALGYO.IS",
+    "ECILC.IS", "DEVA.IS", "ECZYT.IS",
+    "KRDMD.IS", "CIMSA.IS", "AKCNS.IS", "BOLUC.IS",
+    "TTKOM.IS", "VESBE.IS", "BRISA.IS",
+    "TRKCM.IS", "SODA.IS", "BAGFS.IS",
+    "HEKTS.IS", "BIZIM.IS", "TAVHL.IS",
+    "AKSEN.IS", "ZOREN.IS", "CLEBI.IS",
+    "AGESA.IS", "AKSA.IS", "SOKM.IS", "MAVI.IS",
+]
+BIST_LISTESI = list(set(BIST_LISTESI))
+
+# Tüm evren modu için sembol ana dosyası (her satırda bir Yahoo kodu)
+EVREN_DOSYASI = Path(__file__).with_name("bist_evren.csv")
+
+
+def evren_yukle(yol: str | Path = EVREN_DOSYASI) -> list[str]:
+    return pd.read_csv(yol)["Ticker"].dropna().str.strip().drop_duplicates().tolist()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ANA ANALİZ FONKSİYONU (TEK HİSSE, REFERANS YOL)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def hisse_analiz_et(ticker: str, df: pd.DataFrame | None = None,
+                    saglayici: VeriSaglayici | None = None,
+                    info: dict | None = None,
+                    gosterge: dict | pd.Series | None = None,
+                    profil: PuanProfili | None = None) -> dict | None:
+    saglayici = saglayici or YahooSaglayici()
+    try:
+        if gosterge is None:
+            if df is None:
+                df = hisse_verisi(saglayici.fiyat_paneli([ticker]), ticker)
+            if df is None or len(df) < 50:
+                return None
+            gosterge = tekil_gostergeler(df)
+
+        if gosterge["Bar"] < 50:
+            return None
+
+        son_fiyat = gosterge["Fiyat"]
+        if son_fiyat <= 0:
+            return None
+
+        ma50, ma200, rsi = gosterge["MA50"], gosterge["MA200"], gosterge["RSI"]
+
+        # Temel veriler
+        try:
+            if info is None:
+                info = saglayici.temel_veri(ticker)
+            pddd, fk, sektor, buyume = temel_ayikla(info)
+        except Exception:
+            pddd, fk, sektor, buyume = np.nan, np.nan, "Bilinmiyor", np.nan
+
+        # Puanlar
+        puan = skaler_puanla(gosterge, pddd, fk, buyume, profil)
+
+        return {
+            "Ticker": ticker.replace(".IS", ""),
+            "Fiyat": round(son_fiyat, 2),
+            "MA50":  round(ma50, 2)  if not np.isnan(ma50)  else None,
+            "MA200": round(ma200, 2) if not np.isnan(ma200) else None,
+            "RSI":   round(rsi, 1),
+            "PD/DD": round(float(pddd), 2) if pddd and not (isinstance(pddd, float) and np.isnan(pddd)) else None,
+            "F/K":   round(float(fk), 1)   if fk   and not (isinstance(fk, float)   and np.isnan(fk))   else None,
+            "Sektör": sektor,
+            "Trend Geçti": "✅ Evet" if puan["gecti"] else "❌ Hayır",
+            **{k: v for b in puan["puanlar"]
+               for k, v in ((f"P_{b}", puan["puanlar"][b]), (f"A_{b}", puan["etiketler"][b]))},
+            "Temel":  puan["Temel"],
+            "Teknik": puan["Teknik"],
+            "Toplam": puan["Toplam"],
+        }
+
+    except Exception:
+        return None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TARAMA API
+# ─────────────────────────────────────────────────────────────────────────────
+
+def saglayici_olustur(kaynak: str = "yahoo", onbellek: bool = True,
+                      tazelik_dk: float = 15) -> VeriSaglayici:
+    """"yahoo" ya da "csv:<dizin>" tanımından (isteğe bağlı önbellekli) sağlayıcı kurar."""
+    if kaynak.startswith("csv:"):
+        saglayici = CSVSaglayici(kaynak[4:])
+    elif kaynak == "yahoo":
+        saglayici = YahooSaglayici()
+    else:
+        raise ValueError(f"Bilinmeyen veri kaynağı: {kaynak}")
+    if onbellek:
+        saglayici = OnbellekliSaglayici(saglayici, tazelik=pd.Timedelta(minutes=tazelik_dk))
+    return saglayici
+
+
+def tara_akisi(tickers: list[str], saglayici: VeriSaglayici | None = None,
+               period: str = "1y", interval: str = "1d", ilerleme=None,
+               isci_sayisi: int | None = None, min_puan: float | None = None,
+               tam_liste=(), olcum: TaramaOlcumu | None = None,
+               iptal: threading.Event | None = None, parti_suresi: float = 0.5,
+               durum: GostergeDurumu | None = None, profil: PuanProfili | None = None,
+               karsilastirma=(), zaman_dilimleri=(), kesitsel: bool = False,
+               temel_onbellegi: bool = True):
+    """
+    Listeyi iki aşamada tarar ve puanlanan hisseleri hazır oldukça parça
+    parça (`puanla` çıktısı DataFrame'ler) üretir.
+
+    Önce yalnızca fiyattan teknik puanlar çıkar; `min_puan` verilirse temel
+    verilerden tam puan alsa bile eşiğe ulaşamayan hisselerin `hisse.info`
+    çağrısı atlanır ("Budandı"). `tam_liste` her zaman tam analiz edilir.
+    Temel veriler en yüksek teknik puandan başlayarak çekilir; böylece güçlü
+    adaylar ilk parçalarda gelir. `iptal` kurulunca ya da üreteç kapatılınca
+    tarama o ana kadarki parçalarla biter.
+
+    Göstergeler varsayılan olarak tek süreçte hesaplanır; süreç havuzu
+    yalnızca `isci_sayisi` > 1 açıkça verilirse ve liste PARALEL_ESIK ve
+    üzeri hisse içeriyorsa kullanılır. `olcum` verilirse
+    aşama süreleri ve hisse bazında eleme nedenleri ona yazılır.
+    `temel_onbellegi` False ise temel veriler TTL önbelleği okunmadan çekilir. `durum`
+    verilirse göstergeler artımlı durumdan güncellenir (gün içi yeniden
+    taramada hisse başına tek bar); sonuç tam hesaplamayla aynıdır.
+
+    Puanlar `profil`e göredir (None → varsayılan); `karsilastirma`daki
+    profiller aynı geçişte `Toplam_<ad>` sütunlarına puanlanır ve bir hisse
+    ancak hiçbir profilde eşiğe ulaşamıyorsa budanır.
+
+    `zaman_dilimleri` (ZAMAN_DILIMLERI anahtarları) verilirse günlük fiyatlar
+    bir kez, dilimlerin istediği en uzun dönemle çekilir; haftalık / aylık
+    barlar bundan örneklenir, saatlik barlar tek ek istekle gelir. Dilim
+    sütunları bilgi amaçlıdır: Toplam ve budama günlük puana göredir.
+
+    `kesitsel` True ise (ya da profillerden biri "RG" bileşeni tanımlıyorsa)
+    XU100 aynı fiyat isteğine eklenir ve budamadan önce her hisseye `Getiri`
+    ve endekse göre `RG` sütunları hesaplanır; sektör sütunları
+    `sonuclari_birlestir`de eklenir.
+    """
+    saglayici = saglayici or saglayici_olustur()
+    bildir = ilerleme or (lambda oran, mesaj: None)
+    olcum = olcum if olcum is not None else TaramaOlcumu()
+    kesitsel = kesitsel or any("RG" in p.bantlar for p in [profil, *karsilastirma] if p)
+
+    # Tüm listenin fiyatları (kesitsel aşamada endeks dahil) tek istekte
+    bildir(0.0, f"{len(tickers)} hissenin fiyat verisi indiriliyor...")
+    with olcum.asama("fiyat"):
+        istek_period = gunluk_period(period, zaman_dilimleri) if zaman_dilimleri else period
+        istek = [*tickers, ENDEKS] if kesitsel and ENDEKS not in tickers else tickers
+        tam_panel = saglayici.fiyat_paneli(istek, period=istek_period, interval=interval)
+        endeks = None
+        if kesitsel:
+            tam_panel, endeks = endeksi_ayir(tam_panel, birak=ENDEKS in tickers)
+        panel = donem_kes(tam_panel, period) if istek_period != period else tam_panel
+
+    # 1. aşama: göstergeler tüm liste için tek geçişte
+    bildir(0.0, "Göstergeler hesaplanıyor...")
+    with olcum.asama("gostergeler"):
+        if durum is not None:
+            gostergeler = durum.guncelle(panel)
+        elif (isci_sayisi or 1) > 1 and len(tickers) >= PARALEL_ESIK:
+            gostergeler = paralel_gostergeler(panel, isci_sayisi)
+        else:
+            gostergeler = hesapla_gostergeler(panel)
+    eleme_nedenlerini_yaz(olcum, tickers, gostergeler)
+
+    # Kesitsel: endekse göre göreli güç, budama RG puanını görebilsin diye önce
+    if kesitsel:
+        with olcum.asama("kesitsel"):
+            gostergeler = gostergeler.join(goreli_guc(panel, endeks))
+
+    # Diğer zaman dilimleri: aynı gösterge ve puanlama, bellekteki günlük veriden
+    dilimler = pd.DataFrame()
+    if zaman_dilimleri:
+        bildir(0.0, "Zaman dilimleri hesaplanıyor...")
+        with olcum.asama("zaman_dilimleri"):
+            dilimler = dilim_tablosu(dilim_panelleri(tam_panel, saglayici, tickers, zaman_dilimleri),
+                                     profil)
+
+    def parca_puanla(temel_veriler: dict, budanan=()) -> pd.DataFrame:
+        with olcum.asama("puanlama"):
+            secili = list(temel_veriler)
+            sonuc = puanla(gostergeler.loc[secili], temel_tablosu(temel_veriler, secili), budanan,
+                           profil, karsilastirma)
+            return dilim_kolonlari_ekle(sonuc, dilimler)
+
+    # Budananlar temel veri beklemez
+    teknik = teknik_on_puan(gostergeler, profil)
+    budanan = (budanacaklar(gostergeler, min_puan, tam_liste, [profil, *karsilastirma])
+               if min_puan is not None else [])
+    for ticker in budanan:
+        olcum.hisse(ticker, "budandi")
+    if budanan:
+        yield parca_puanla({t: {} for t in budanan}, budanan)
+
+    # 2. aşama: temel veriler yalnızca eşiğe ulaşabilecek hisseler için
+    sira = teknik.drop(budanan).sort_values(ascending=False, kind="stable").index
+    akis = TemelVeriToplayici(saglayici, None if temel_onbellegi else TTLOnbellek()).akis(
+        list(sira), ilerleme=lambda i, n, t: bildir(i / n, f"Temel veri: {t} ({i}/{n})"),
+        olcum=olcum, iptal=iptal,
+    )
+    parca, son = {}, time.perf_counter()
+    try:
+        while True:
+            with olcum.asama("temel"):
+                oge = next(akis, None)
+            if oge is None:
+                break
+            parca[oge[0]] = oge[1]
+            if time.perf_counter() - son >= parti_suresi:
+                yield parca_puanla(parca)
+                parca, son = {}, time.perf_counter()
+    finally:
+        akis.close()
+    if parca:
+        yield parca_puanla(parca)
+    bildir(1.0, "Tarama tamamlandı.")
+
+
+def sonuclari_birlestir(parcalar: list[pd.DataFrame]) -> pd.DataFrame:
+    """`tara_akisi` parçalarını Toplam puana göre sıralı tek tabloda toplar."""
+    parcalar = [p for p in parcalar if len(p)]
+    if not parcalar:
+        return pd.DataFrame()
+    df = pd.concat(parcalar, ignore_index=True)
+    # Farklı kategorili parçalar birleşince Sektör object'e döner
+    df["Sektör"] = df["Sektör"].astype("category")
+    if "Getiri" in df:
+        df = sektor_kolonlari_ekle(df)
+    return df.sort_values("Toplam", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def tara(tickers: list[str], saglayici: VeriSaglayici | None = None,
+         period: str = "1y", interval: str = "1d", ilerleme=None,
+         isci_sayisi: int | None = None, min_puan: float | None = None,
+         tam_liste=(), olcum: TaramaOlcumu | None = None,
+         profil: PuanProfili | None = None, karsilastirma=(),
+         zaman_dilimleri=(), kesitsel: bool = False,
+         temel_onbellegi: bool = True) -> pd.DataFrame:
+    """`tara_akisi`nın tamamını bekleyip Toplam puana göre sıralı tabloyu döndürür."""
+    return sonuclari_birlestir(list(tara_akisi(
+        tickers, saglayici, period, interval, ilerleme, isci_sayisi, min_puan, tam_liste, olcum,
+        profil=profil, karsilastirma=karsilastirma, zaman_dilimleri=zaman_dilimleri,
+        kesitsel=kesitsel, temel_onbellegi=temel_onbellegi,
+    )))
+
+
+def eleme_nedenlerini_yaz(olcum: TaramaOlcumu, tickers: list[str], gostergeler: pd.DataFrame):
+    """Puanlamadan önce elenecek hisseleri (puanla'daki süzgeçle aynı) sınıflandırır."""
+    g = gostergeler.reindex(tickers)
+    bar = g["Bar"].fillna(0).to_numpy()
+    neden = np.select(
+        [bar == 0, bar < 50, ~(g["Fiyat"].to_numpy(dtype=float) > 0)],
+        ["fiyat_yok", "az_bar", "sifir_fiyat"],
+        default="",
+    )
+    for ticker, n, b in zip(tickers, neden, bar):
+        if n:
+            olcum.hisse(ticker, n, bar=int(b))
+
+
+def disa_aktar(df: pd.DataFrame, yol: str | Path, profil: PuanProfili | None = None):
+    """Sonuçları uzantıya göre CSV / Parquet / JSON olarak yazar."""
+    yol = Path(yol)
+    tablo = disa_aktarim_tablosu(df, profil)
+    if yol.suffix == ".csv":
+        tablo.to_csv(yol, index=False, encoding="utf-8-sig")
+    elif yol.suffix == ".parquet":
+        tablo.to_parquet(yol, index=False)
+    elif yol.suffix == ".json":
+        tablo.to_json(yol, orient="records", force_ascii=False, indent=1)
+    else:
+        raise ValueError(f"Desteklenmeyen çıktı biçimi: {yol.suffix} (.csv / .parquet / .json)")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# KOMUT SATIRI
+# ─────────────────────────────────────────────────────────────────────────────
+
+def liste_coz(tanim: str) -> list[str]:
+    if tanim == "hazir":
+        return BIST_LISTESI
+    if tanim == "evren":
+        return evren_yukle()
+    return [t if "." in t else t + ".IS"
+            for t in (p.strip().upper() for p in tanim.split(",")) if t]
+
+
+def main(argv: list[str] | None = None) -> int:
+    warnings.filterwarnings('ignore')
+    ayristirici = argparse.ArgumentParser(description="BIST swing trade taraması (arayüzsüz)")
+    ayristirici.add_argument("--liste", default="hazir",
+                             help='"hazir", "evren" (bist_evren.csv) ya da virgülle ayrılmış kodlar')
+    ayristirici.add_argument("--kaynak", default="yahoo", help='"yahoo" ya da "csv:<dizin>"')
+    ayristirici.add_argument("--onbelleksiz", action="store_true",
+                             help="Yerel fiyat ve temel veri önbelleklerini kullanma")
+    ayristirici.add_argument("--tazelik", type=float, default=15, help="Önbellek tazelik süresi (dakika)")
+    ayristirici.add_argument("--min-puan", type=int, default=70, help="AL eşiği")
+    ayristirici.add_argument("--sadece-al", action="store_true",
+                             help="Yalnızca AL listesini yaz (eşiğe ulaşamayanların temel verisi çekilmez)")
+    ayristirici.add_argument("--tam", default="",
+                             help="Budanmadan tam analiz edilecek kodlar (THYAO,GARAN)")
+    ayristirici.add_argument("--cikti", help="Çıktı dosyası (.csv / .parquet / .json)")
+    ayristirici.add_argument("--isci", type=int, default=None,
+                             help="Gösterge süreç sayısı (varsayılan: 1; vektörel hesap tek süreçte "
+                                  "zaten hızlı, havuz yalnızca çok büyük listelerde kazandırır)")
+    ayristirici.add_argument("--olcum", help="Aşama süreleri ve eleme nedenlerini bu JSONL dosyasına ekle")
+    ayristirici.add_argument("--gecmis", nargs="?", const=str(VARSAYILAN_GECMIS), default=None,
+                             help="Tamamlanan taramayı geçmiş veritabanına ekle "
+                                  f"(varsayılan yol: {VARSAYILAN_GECMIS})")
+    ayristirici.add_argument("--durum", nargs="?", const="", default=None,
+                             help="Gösterge durumunu diskte tut; gün içi yeniden taramalar yalnızca "
+                                  f"son barı işler (varsayılan dizin: {VARSAYILAN_DURUM_DIZINI})")
+    ayristirici.add_argument("--profil", default=VARSAYILAN_PROFIL_ADI, help="Puan profili")
+    ayristirici.add_argument("--karsilastir", default="",
+                             help="Aynı geçişte yan yana puanlanacak profiller (muhafazakar,momentum)")
+    ayristirici.add_argument("--profil-dosyasi", default=str(PROFIL_DOSYASI),
+                             help="Puan profilleri JSON dosyası")
+    ayristirici.add_argument("--zaman-dilimleri", default="",
+                             help="Ek zaman dilimleri (" + ",".join(ZAMAN_DILIMLERI) + "); haftalık "
+                                  "ve aylık barlar günlük veriden örneklenir")
+    ayristirici.add_argument("--kesitsel", action="store_true",
+                             help=f"{ENDEKS.removesuffix('.IS')}'e göre göreli güç ve sektör içi sıra "
+                                  "sütunlarını ekle (RG tanımlayan profillerde kendiliğinden açık)")
+    ayristirici.add_argument("--sessiz", action="store_true", help="İlerleme mesajlarını yazma")
+    args = ayristirici.parse_args(argv)
+
+    zaman_dilimleri = list(dict.fromkeys(d.strip() for d in args.zaman_dilimleri.split(",")
+                                         if d.strip()))
+    bilinmeyen = [d for d in zaman_dilimleri if d not in ZAMAN_DILIMLERI]
+    if bilinmeyen:
+        ayristirici.error(f"Bilinmeyen zaman dilimi: {', '.join(bilinmeyen)} "
+                          f"(tanımlı: {', '.join(ZAMAN_DILIMLERI)})")
+
+    try:
+        profiller = profilleri_yukle(args.profil_dosyasi)
+        profil = profiller[args.profil]
+        karsilastirma = [profiller[ad] for ad in dict.fromkeys(
+            a.strip() for a in args.karsilastir.split(",") if a.strip()) if ad != args.profil]
+    except KeyError as hata:
+        ayristirici.error(f"Bilinmeyen profil: {hata.args[0]} (tanımlı: {', '.join(profiller)})")
+    except ValueError as hata:
+        ayristirici.error(str(hata))
+
+    tickers = liste_coz(args.liste)
+    if not tickers:
+        ayristirici.error("En az bir hisse kodu gir.")
+
+    ilerleme = None if args.sessiz else (lambda oran, mesaj: print(mesaj, file=sys.stderr))
+    saglayici = saglayici_olustur(args.kaynak, not args.onbelleksiz, args.tazelik)
+    olcum = TaramaOlcumu()
+    durum_dosyasi = (args.durum or durum_yolu(args.kaynak)) if args.durum is not None else None
+    durum = GostergeDurumu.yukle(durum_dosyasi) if durum_dosyasi else None
+    parcalar = []
+    budama_esigi = args.min_puan if args.sadece_al else None
+    tamam = False
+    try:
+        for parca in tara_akisi(tickers, saglayici, ilerleme=ilerleme, isci_sayisi=args.isci,
+                                min_puan=budama_esigi,
+                                tam_liste=liste_coz(args.tam) if args.tam else (), olcum=olcum,
+                                durum=durum, profil=profil, karsilastirma=karsilastirma,
+                                zaman_dilimleri=zaman_dilimleri, kesitsel=args.kesitsel,
+                                temel_onbellegi=not args.onbelleksiz):
+            parcalar.append(parca)
+        tamam = True
+    except KeyboardInterrupt:
+        # Ctrl-C: o ana kadar puanlananlar yine yazılır
+        print(f"Tarama durduruldu; {sum(len(p) for p in parcalar)} hisselik kısmi sonuç.",
+              file=sys.stderr)
+    df = sonuclari_birlestir(parcalar)
+    if durum is not None:
+        durum.kaydet(durum_dosyasi)
+    if args.olcum:
+        olcum.dosyaya_ekle(args.olcum)
+    if df.empty:
+        print("Hiçbir hisseden veri çekilemedi.", file=sys.stderr)
+        return 1
+    # Kısmi taramalar geçmişe yazılmaz; sıralar eksik listeyle karşılaştırılamaz
+    if args.gecmis and tamam:
+        TaramaGecmisi(args.gecmis).ekle(df, liste_imzasi(tickers), args.kaynak,
+                                        kural_imzasi(profil), budama_esigi)
+
+    if args.sadece_al:
+        df = df[df["Toplam"] >= args.min_puan].reset_index(drop=True)
+
+    if args.cikti:
+        disa_aktar(df, args.cikti, profil)
+        print(f"{len(df)} satır yazıldı: {args.cikti}", file=sys.stderr)
+    else:
+        kolonlar = ["Ticker", "Fiyat", "Trend Geçti", "Temel", "Teknik", "Toplam",
+                    *map(karsilastirma_kolonu, karsilastirma), *dilim_kolonlari(df),
+                    *kesitsel_kolonlari(df), "Sektör"]
+        print(goruntu_metinleri(df[kolonlar]).to_string(index=False))
+        ozet = sektor_ozeti(df, args.min_puan) if "Getiri" in df else pd.DataFrame()
+        if not ozet.empty:
+            print("\nSektörler:")
+            print(ozet.round(2).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
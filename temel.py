@@ -0,0 +1,231 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          temel.py - Paralel, Hız Sınırlı Temel Veri Toplayıcı                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+`hisse.info` taramanın en yavaş çağrısıdır ama kullanılan beş alan en fazla
+çeyrekte bir değişir. Toplayıcı bu alanları sınırlı bir iş parçacığı havuzunda
+paralel çeker, istekleri token-bucket ile kısıtlar ve sonuçları TTL'li disk
+önbelleğine yazar. Tüm alanlar tek `info` isteğiyle geldiği için TTL hisse
+başınadır ve en kısa ömürlü alana (fiyata bağlı oranlar) göre seçilir: alan
+bazında süre tutmak yeni istek kazandırmaz. Önbellek dosyası kaynağa özgüdür
+(`.onbellek/temel_<kaynak eki>.json`): fixture değerleri Yahoo taramasına sızmaz.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from olcum import TaramaOlcumu, hata_nedeni
+from veri import TEMEL_ALANLAR, VeriSaglayici, kaynak_eki
+
+VARSAYILAN_DIZIN = Path(".onbellek")
+
+GUN = 24 * 60 * 60
+
+# Kaydın geçerlilik süresi (saniye): PD/DD ve F/K fiyatla her gün değişir
+TEMEL_TTL = 1 * GUN
+
+
+def _bos_mu(deger) -> bool:
+    return deger is None or (isinstance(deger, float) and np.isnan(deger))
+
+
+def temel_ayikla(info: dict) -> tuple:
+    """Ham info sözlüğünden (pddd, fk, sektor, buyume%) üretir."""
+    pddd   = info.get('priceToBook', np.nan)
+    fk     = info.get('trailingPE', np.nan)
+    sektor = info.get('sector', 'Bilinmiyor')
+    buyume = info.get('earningsQuarterlyGrowth', np.nan)
+    if not _bos_mu(buyume):
+        buyume = float(buyume) * 100
+    else:
+        yillik = info.get('earningsGrowth', np.nan)
+        buyume = float(yillik) * 100 if yillik and not _bos_mu(yillik) else np.nan
+    return (
+        np.nan if pddd is None else pddd,
+        np.nan if fk is None else fk,
+        sektor or 'Bilinmiyor',
+        buyume,
+    )
+
+
+def temel_tablosu(temel_veriler: dict[str, dict], tickers: list[str] | None = None) -> pd.DataFrame:
+    """ticker → info sözlüğünü puanlama çekirdeğinin beklediği tabloya çevirir."""
+    tickers = tickers if tickers is not None else list(temel_veriler)
+    satirlar = [temel_ayikla(temel_veriler.get(t) or {}) for t in tickers]
+    return pd.DataFrame(satirlar, columns=["pddd", "fk", "sektor", "buyume"],
+                        index=pd.Index(tickers, name="Ticker"))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HIZ SINIRLAYICI
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TokenKovasi:
+    """Saniyede `hiz` token dolan, en fazla `kapasite` biriktiren kova."""
+
+    def __init__(self, hiz: float, kapasite: float | None = None):
+        self.hiz = hiz
+        self.kapasite = kapasite if kapasite is not None else max(1.0, hiz)
+        self._token = self.kapasite
+        self._son = time.monotonic()
+        self._kilit = threading.Lock()
+
+    def al(self):
+        while True:
+            with self._kilit:
+                simdi = time.monotonic()
+                self._token = min(self.kapasite, self._token + (simdi - self._son) * self.hiz)
+                self._son = simdi
+                if self._token >= 1:
+                    self._token -= 1
+                    return
+                bekle = (1 - self._token) / self.hiz
+            time.sleep(bekle)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TTL ÖNBELLEK
+# ─────────────────────────────────────────────────────────────────────────────
+
+def onbellek_yolu(saglayici: VeriSaglayici, dizin: str | Path = VARSAYILAN_DIZIN) -> Path:
+    """Kaynağın temel veri önbelleği dosyası."""
+    return Path(dizin) / f"temel_{kaynak_eki(saglayici)}.json"
+
+
+class TTLOnbellek:
+    """
+    ticker → {"zaman": kayıt zamanı, "alanlar": {alan: değer}} şeklinde
+    önbellek; `dosya` None ise yalnızca bellekte tutulur (önbelleksiz tarama).
+    """
+
+    def __init__(self, dosya: str | Path | None = None, ttl: float = TEMEL_TTL):
+        self.dosya = Path(dosya) if dosya is not None else None
+        self.ttl = ttl
+        self._veri = {}
+        if self.dosya is not None and self.dosya.exists():
+            self._veri = json.loads(self.dosya.read_text(encoding="utf-8"))
+
+    def gecerli_mi(self, ticker: str, simdi: float | None = None) -> bool:
+        kayit = self._veri.get(ticker)
+        # Eski (alan bazında) biçimdeki kayıtlarda "zaman" yok: bayat sayılır
+        if not kayit or "zaman" not in kayit:
+            return False
+        return (simdi or time.time()) - kayit["zaman"] < self.ttl
+
+    def oku(self, ticker: str) -> dict:
+        alanlar = self._veri.get(ticker, {}).get("alanlar", {})
+        return {alan: deger for alan, deger in alanlar.items() if not _bos_mu(deger)}
+
+    def yaz(self, ticker: str, info: dict, simdi: float | None = None):
+        self._veri[ticker] = {"zaman": simdi or time.time(),
+                              "alanlar": {alan: info.get(alan) for alan in TEMEL_ALANLAR}}
+
+    def gecersiz_kil(self, tickers: list[str] | None = None):
+        if tickers is None:
+            self._veri.clear()
+        for ticker in tickers or []:
+            self._veri.pop(ticker, None)
+
+    def kaydet(self):
+        if self.dosya is None:
+            return
+        self.dosya.parent.mkdir(parents=True, exist_ok=True)
+        gecici = self.dosya.with_suffix(".tmp")
+        gecici.write_text(json.dumps(self._veri), encoding="utf-8")
+        gecici.replace(self.dosya)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TOPLAYICI
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TemelVeriToplayici:
+    def __init__(self, saglayici: VeriSaglayici, onbellek: TTLOnbellek | None = None,
+                 isci_sayisi: int = 8, hiz: float = 4.0, deneme_sayisi: int = 3,
+                 bekleme: float = 0.5):
+        self.saglayici = saglayici
+        self.onbellek = onbellek if onbellek is not None else TTLOnbellek(onbellek_yolu(saglayici))
+        self.isci_sayisi = isci_sayisi
+        self.deneme_sayisi = deneme_sayisi
+        self.bekleme = bekleme
+        # Yerel kaynaklarda kısıtlamaya gerek yok
+        self.kova = TokenKovasi(hiz) if saglayici.ag_gerektirir else None
+
+    def _getir(self, ticker: str, olcum: TaramaOlcumu) -> dict:
+        baslangic = time.perf_counter()
+        for deneme in range(1, self.deneme_sayisi + 1):
+            if self.kova is not None:
+                self.kova.al()
+            try:
+                info = self.saglayici.temel_veri(ticker) or {}
+                break
+            except Exception as hata:
+                if deneme == self.deneme_sayisi:
+                    olcum.hisse(ticker, hata_nedeni(hata), deneme=deneme, hata=repr(hata),
+                                gecikme_ms=round((time.perf_counter() - baslangic) * 1000, 1))
+                    raise
+                time.sleep(self.bekleme * 2 ** (deneme - 1))
+        olcum.hisse(ticker, deneme=deneme, onbellek=False,
+                    gecikme_ms=round((time.perf_counter() - baslangic) * 1000, 1))
+        # numpy skalerleri JSON'a yazılabilsin diye Python tiplerine çevrilir
+        return {alan: v.item() if isinstance(v, np.generic) else v
+                for alan, v in ((a, info.get(a)) for a in TEMEL_ALANLAR)}
+
+    def _teslim(self, ticker: str, veri: dict, olcum: TaramaOlcumu) -> tuple[str, dict]:
+        if not veri and not olcum.hisseler.get(ticker, {}).get("nedenler"):
+            olcum.hisse(ticker, "temel_yok")
+        return ticker, veri
+
+    def akis(self, tickers: list[str], ilerleme=None, olcum: TaramaOlcumu | None = None,
+             iptal: threading.Event | None = None):
+        """
+        (ticker, temel alanlar) çiftlerini hazır oldukça üretir: önce önbellekte
+        geçerli olanlar, sonra istek sırasıyla çekilenler. Hata veren istekler
+        `deneme_sayisi` kez üstel beklemeyle tekrarlanır. `iptal` kurulunca ya
+        da üreteç kapatılınca bekleyen istekler atılır; o ana kadar çekilenler
+        önbelleğe yazılır. `ilerleme(tamamlanan, toplam, ticker)` tüketen iş
+        parçacığında çağrılır (Streamlit öğeleri güvenle güncellenebilir).
+        """
+        olcum = olcum if olcum is not None else TaramaOlcumu()
+        eksik = []
+        for ticker in tickers:
+            if self.onbellek.gecerli_mi(ticker):
+                olcum.hisse(ticker, onbellek=True)
+                yield self._teslim(ticker, self.onbellek.oku(ticker), olcum)
+            else:
+                eksik.append(ticker)
+        if not eksik:
+            return
+
+        havuz = ThreadPoolExecutor(max_workers=self.isci_sayisi)
+        try:
+            isler = {havuz.submit(self._getir, t, olcum): t for t in eksik}
+            for i, is_ in enumerate(as_completed(isler), start=1):
+                ticker = isler[is_]
+                try:
+                    info = is_.result()
+                    self.onbellek.yaz(ticker, info)
+                    veri = self.onbellek.oku(ticker)
+                except Exception:
+                    veri = {}
+                if ilerleme:
+                    ilerleme(i, len(eksik), ticker)
+                yield self._teslim(ticker, veri, olcum)
+                if iptal is not None and iptal.is_set():
+                    break
+        finally:
+            havuz.shutdown(wait=False, cancel_futures=True)
+            self.onbellek.kaydet()
+
+    def topla(self, tickers: list[str], ilerleme=None,
+              olcum: TaramaOlcumu | None = None) -> dict[str, dict]:
+        """Tüm ticker'lar için temel alanları döndürür (bkz. `akis`)."""
+        return dict(self.akis(tickers, ilerleme, olcum))
@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Modüller depo kökünde düz dosyalardır
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from veri import CSVSaglayici, panel_kaydet, panel_olustur  # noqa: E402
+
+
+@pytest.fixture
+def csv_kaynagi(tmp_path):
+    """
+    `tmp_path/<ad>` altında tek hisselik (AAA.IS) fixture kurup CSVSaglayici
+    döndüren fabrika: 30 sabit `kapanis` bar ve `pddd` PD/DD'li temel.csv.
+    """
+    def kur(ad: str, kapanis: float = 10.0, pddd: float = 1.0) -> CSVSaglayici:
+        tarihler = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=30)
+        df = pd.DataFrame({"Open": kapanis, "High": kapanis, "Low": kapanis,
+                           "Close": kapanis, "Volume": 1000.0}, index=tarihler)
+        temel = pd.DataFrame({"priceToBook": [pddd], "sector": ["Sanayi"]}, index=["AAA.IS"])
+        panel_kaydet(panel_olustur({"AAA.IS": df}), tmp_path / ad, temel)
+        return CSVSaglayici(tmp_path / ad)
+    return kur
@@ -0,0 +1,50 @@
+import pandas as pd
+
+from artimli import GostergeDurumu
+from benchmark import sentetik_veri
+from gostergeler import hesapla_gostergeler
+
+
+def _esit(a: pd.DataFrame, b: pd.DataFrame):
+    pd.testing.assert_frame_equal(a, b, check_exact=True)
+
+
+def _gun_ici(panel: pd.DataFrame, carpan: float) -> pd.DataFrame:
+    """Son barın kapanışı gün içinde değişmiş panel."""
+    panel = panel.copy()
+    kapanis = panel.columns.get_level_values(0) == "Close"
+    panel.iloc[-1, kapanis] = panel.iloc[-1, kapanis].to_numpy() * carpan
+    return panel
+
+
+def test_artimli_guncelleme_tam_hesapla_bit_duzeyinde_ayni(tmp_path):
+    panel, _ = sentetik_veri(40, 260)
+    durum = GostergeDurumu()
+    _esit(durum.guncelle(panel.iloc[:-2]), hesapla_gostergeler(panel.iloc[:-2]))
+
+    # Gün içi: aynı son bar iki kez değişir
+    for carpan in (1.004, 0.997):
+        dun = _gun_ici(panel.iloc[:-1], carpan)
+        _esit(durum.guncelle(dun), hesapla_gostergeler(dun))
+
+    # Diskten yüklenen durum yeni günü (önceki bar kesinleşir) işler
+    durum.kaydet(tmp_path / "durum.npz")
+    yuklenen = GostergeDurumu.yukle(tmp_path / "durum.npz")
+    _esit(yuklenen.guncelle(panel), hesapla_gostergeler(panel))
+
+
+def test_duzeltilen_son_kesin_bar_hisseyi_yeniden_kurar():
+    panel, _ = sentetik_veri(20, 260)
+    durum = GostergeDurumu()
+    durum.guncelle(panel)
+    duzeltilmis = panel.copy()
+    duzeltilmis.loc[panel.index[-2], ("Close", "S0003.IS")] *= 1.1
+    _esit(durum.guncelle(duzeltilmis), hesapla_gostergeler(duzeltilmis))
+
+
+def test_kayan_pencere_hisseleri_yeniden_kurar():
+    panel, _ = sentetik_veri(20, 260)
+    durum = GostergeDurumu()
+    durum.guncelle(panel.iloc[:-1])
+    # period="1y": yeni gün gelince en eski bar düşer
+    _esit(durum.guncelle(panel.iloc[1:]), hesapla_gostergeler(panel.iloc[1:]))
@@ -0,0 +1,57 @@
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from gecmis import SAKLANAN_KOLONLAR, TaramaGecmisi, liste_imzasi
+
+
+def _sonuc(toplamlar: dict) -> pd.DataFrame:
+    """Yalnızca saklanan sütunlarla ticker → Toplam sonuç tablosu."""
+    n = len(toplamlar)
+    df = pd.DataFrame({c: [0] * n for c in SAKLANAN_KOLONLAR})
+    df["Ticker"] = list(toplamlar)
+    df["Toplam"] = pd.array(list(toplamlar.values()), dtype="Int16")
+    df["Trend Geçti"] = True
+    df["Budandı"] = False
+    return df
+
+
+@pytest.fixture
+def gecmis(tmp_path):
+    g = TaramaGecmisi(tmp_path / "gecmis.sqlite")
+    g.ekle(_sonuc({"AAA": 80, "BBB": 60, "CCC": 40}), "liste", zaman=datetime(2026, 1, 1))
+    g.ekle(_sonuc({"AAA": 55, "BBB": 75, "CCC": 40}), "liste", zaman=datetime(2026, 1, 2))
+    return g
+
+
+@pytest.mark.parametrize("sql", [
+    "UPDATE sonuclar SET toplam = 0",
+    "DELETE FROM sonuclar",
+    "UPDATE taramalar SET esik = 0",
+    "DELETE FROM taramalar",
+])
+def test_gecmis_salt_eklemeli(gecmis, sql):
+    with closing(sqlite3.connect(gecmis.yol)) as b:
+        with pytest.raises(sqlite3.IntegrityError, match="salt eklemeli"):
+            b.execute(sql)
+    assert len(gecmis.hisse_gecmisi(["AAA", "BBB", "CCC"])) == 6
+
+
+def test_al_degisimleri_ve_sira_degisimleri(gecmis):
+    al = gecmis.al_degisimleri(70, "liste")
+    assert al.set_index("ticker")["degisim"].to_dict() == {"AAA": "Çıkış", "BBB": "Giriş"}
+
+    sira = gecmis.sira_degisimleri("liste").set_index("ticker")
+    assert sira.loc["BBB", ["sira", "onceki_sira", "sira_degisimi", "puan_degisimi"]].tolist() == [1, 2, 1, 15]
+    assert sira.loc["AAA", "sira_degisimi"] == -1
+
+
+def test_listeler_birbirine_karismaz(gecmis):
+    gecmis.ekle(_sonuc({"AAA": 10}), "baska")
+    assert gecmis.taramalar("liste")["hisse"].tolist() == [3, 3]
+    # "liste"nin son iki taraması hâlâ karşılaştırılır
+    assert len(gecmis.sira_degisimleri("liste")) == 3
+    assert liste_imzasi(["GARAN.IS", "THYAO"]) == liste_imzasi(["THYAO.IS", "GARAN"])
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from benchmark import sentetik_veri
+from geri_test import VADE, esik_ozeti, kova_ozeti, sinyal_matrisleri
+from gostergeler import hesapla_gostergeler
+from puanlama import puanla
+from temel import temel_tablosu
+
+
+def test_gecmis_puan_o_gunku_taramayla_ayni():
+    # İleriye bakma yok: her tarihin puanı, panel o güne kesilip taransa çıkacak puan
+    panel, info = sentetik_veri(30, 260)
+    temel = temel_tablosu(info, list(info))
+    s = sinyal_matrisleri(panel, temel)
+    puan = pd.DataFrame(s["Puan"], index=s["Tarih"], columns=s["Ticker"])
+    for tarih in panel.index[[80, 150, -1]]:
+        kesik = panel.loc[:tarih]
+        tarama = puanla(hesapla_gostergeler(kesik), temel)
+        beklenen = pd.Series(tarama["Toplam"].astype(float).to_numpy(),
+                             index=tarama["Ticker"].astype(str) + ".IS")
+        # O gün işlem görmeyen hisse (boşluk) o tarihte sinyal üretmez
+        islem = panel["Close"].loc[tarih].notna()
+        beklenen = beklenen[islem[beklenen.index].to_numpy()]
+        gun = puan.loc[tarih]
+        assert np.array_equal(gun[beklenen.index].to_numpy(), beklenen.to_numpy())
+        assert gun.drop(beklenen.index).isna().all()
+
+
+def test_vade_getirisi_ve_ozet_sayilari():
+    panel, _ = sentetik_veri(30, 260)
+    s = sinyal_matrisleri(panel)
+    getiri = pd.DataFrame(s["Getiri"], index=s["Tarih"], columns=s["Ticker"])
+    kapanis = panel["Close"]["S0000.IS"].dropna()
+    assert np.isclose(getiri["S0000.IS"].loc[kapanis.index[0]],
+                      kapanis.iloc[VADE] / kapanis.iloc[0] - 1)
+    assert getiri["S0000.IS"].loc[kapanis.index[-VADE:]].isna().all()
+    # Kovalar tüm sinyalleri bir kez sayar; "≥ 0" eşiği de tümünü
+    assert kova_ozeti(s)["Sinyal"].sum() == esik_ozeti(s, [0])["Sinyal"].iloc[0]
@@ -0,0 +1,16 @@
+from benchmark import gosterge_esligi, sentetik_veri, tekil_gosterge_tablosu
+from gostergeler import hesapla_gostergeler
+
+
+def test_vektorel_gostergeler_tekil_yolla_ayni():
+    # Kısa geçmişli halka arzlar ve işlem durdurma boşlukları dahil
+    panel, info = sentetik_veri(60, 260)
+    referans = tekil_gosterge_tablosu(panel, list(info))
+    assert gosterge_esligi(referans, hesapla_gostergeler(panel))["uyusmayan"] == 0
+
+
+def test_ticker_alt_kumesi_ayni_satirlari_verir():
+    panel, info = sentetik_veri(20, 260)
+    tickers = list(info)[5:12]
+    tum = hesapla_gostergeler(panel)
+    assert hesapla_gostergeler(panel, tickers).equals(tum.loc[tickers])
@@ -0,0 +1,16 @@
+import numpy as np
+import pandas as pd
+
+from grafikler import isi_haritasi
+from profiller import profilleri_yukle
+
+
+def test_isi_haritasi_secili_profilin_ad_ve_maksimumunu_kullanir():
+    profil = profilleri_yukle()["goreli"]
+    df = pd.DataFrame({"Ticker": ["AAA"], "Toplam": [60],
+                       **{f"P_{b}": [profil.maks[b]] for b in profil.bilesenler}})
+    harita = isi_haritasi(df, profil).data[0]
+    assert list(harita.x) == [profil.adlar[b] for b in profil.bilesenler]
+    assert "Göreli Güç (XU100)" in harita.x
+    # Her bileşen profilin kendi maksimumunda: oran 1
+    assert np.allclose(np.asarray(harita.z, dtype=float), 1.0)
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from benchmark import sentetik_veri, tekil_getiri
+from kesitsel import BILINMEYEN_SEKTOR, endeksi_ayir, goreli_guc, sektor_kolonlari_ekle, sektor_ozeti
+from veri import panel_tickerlari
+
+
+def _tablo():
+    return pd.DataFrame({
+        "Sektör": pd.Categorical(["Banka", "Banka", "Banka", "Enerji", BILINMEYEN_SEKTOR]),
+        "Toplam": [40, 60, 80, 50, 90],
+        "Getiri": [1.0, 3.0, 5.0, 10.0, 20.0],
+    }, index=pd.Index(["A", "B", "C", "D", "E"], name="Ticker"))
+
+
+def test_getiri_hisse_bazli_referansla_ayni():
+    panel, _ = sentetik_veri(40, 260)
+    tickers = panel_tickerlari(panel)
+    rg = goreli_guc(panel)
+    pd.testing.assert_series_equal(rg["Getiri"], tekil_getiri(panel, tickers).rename_axis("Ticker"),
+                                   check_names=False)
+    # Endeks yoksa ölçüt medyan getiridir
+    medyan = np.nanmedian(rg["Getiri"])
+    np.testing.assert_allclose(rg["RG"], ((100 + rg["Getiri"]) / (100 + medyan) - 1) * 100)
+
+
+def test_endeks_ayrilir_ve_olcut_olur():
+    panel, _ = sentetik_veri(6, 60)
+    endeks = panel.xs("S0000.IS", axis=1, level="Ticker", drop_level=False).rename(
+        columns={"S0000.IS": "XU100.IS"}, level="Ticker")
+    hisseler, kapanis = endeksi_ayir(pd.concat([panel, endeks], axis=1))
+    assert "XU100.IS" not in panel_tickerlari(hisseler)
+    pd.testing.assert_series_equal(kapanis, panel[("Close", "S0000.IS")].dropna(), check_names=False)
+    # Endeksle aynı seyreden hissenin göreli gücü sıfırdır
+    assert goreli_guc(hisseler, kapanis).loc["S0000.IS", "RG"] == 0
+
+
+def test_bilinmeyen_sektor_siralamaya_girmez():
+    df = sektor_kolonlari_ekle(_tablo())
+    assert df.loc[["A", "B", "C"], "Yüzdelik_Sektör"].tolist() == [33.3, 66.7, 100.0]
+    assert df.loc["D", "Yüzdelik_Sektör"] == 100.0
+    np.testing.assert_allclose(df.loc[["A", "C", "D"], "RG_Sektör"],
+                               [np.round((101 / 103 - 1) * 100, 1), np.round((105 / 103 - 1) * 100, 1), 0.0])
+    assert df.loc["E", ["RG_Sektör", "Yüzdelik_Sektör"]].isna().all()
+
+
+def test_sektor_ozeti_bilinmeyeni_disarida_birakir():
+    ozet = sektor_ozeti(sektor_kolonlari_ekle(_tablo()), min_puan=60)
+    assert ozet["Sektör"].tolist() == ["Banka", "Enerji"]
+    assert ozet["Hisse"].tolist() == [3, 1]
+    assert ozet["AL (60+)"].tolist() == [2, 0]
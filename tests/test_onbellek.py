@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+from onbellek import OnbellekliSaglayici
+from veri import YahooSaglayici
+
+
+def test_fiyat_onbellegi_kaynak_basina_ayri_dizinde(tmp_path, csv_kaynagi):
+    onbellek = tmp_path / "fiyat"
+    tazelik = pd.Timedelta(days=1)
+    a = OnbellekliSaglayici(csv_kaynagi("a", kapanis=10.0), onbellek, tazelik=tazelik)
+    b = OnbellekliSaglayici(csv_kaynagi("b", kapanis=20.0), onbellek, tazelik=tazelik)
+
+    assert np.all(a.fiyat_paneli(["AAA.IS"])["Close"]["AAA.IS"] == 10.0)
+    # Taze önbellek var ama başka kaynağın: b kendi verisini okumalı
+    assert np.all(b.fiyat_paneli(["AAA.IS"])["Close"]["AAA.IS"] == 20.0)
+    assert a.dizin != b.dizin
+
+
+def test_yahoo_csv_onbellegini_gormez(tmp_path, csv_kaynagi):
+    onbellek = tmp_path / "fiyat"
+    csv = OnbellekliSaglayici(csv_kaynagi("a"), onbellek)
+    csv.fiyat_paneli(["AAA.IS"])
+    yahoo = OnbellekliSaglayici(YahooSaglayici(), onbellek)
+    assert yahoo.dizin != csv.dizin
+    assert yahoo._oku("AAA.IS", "1d") is None
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from benchmark import sentetik_veri
+from geri_test import VADE, puan_gecmisi, temel_puani, vade_matrisleri
+from gostergeler import fiyat_matrisleri, gosterge_gecmisi
+from optimizasyon import optimize_et
+from profiller import profilleri_yukle
+from temel import temel_tablosu
+
+
+@pytest.mark.parametrize("temelli", [False, True])
+@pytest.mark.parametrize("ad", list(profilleri_yukle()))
+def test_izgara_sinyal_sayilari_geri_testle_ayni(ad, temelli):
+    profil = profilleri_yukle()[ad]
+    panel, info = sentetik_veri(40, 260)
+    temel = temel_tablosu(info, list(info)) if temelli else None
+    # Profilin kendi ayarları tek kombinasyonluk ızgara
+    izgara = {"MA": [[50, 200]], "MACD": [[12, 26, 9]],
+              "RSI": [profil.bantlar["RSI"]["sinirlar"]], "ATR": [profil.bantlar["ATR"]["sinirlar"]],
+              "min_puan": [20, 40, 60, 80, 100]}
+    sonuc = optimize_et(panel, izgara, temel, ayrim=1.0, min_sinyal=0, profil=profil)
+
+    m = fiyat_matrisleri(panel)
+    tp = temel_puani(temel, m["Ticker"], profil) if temelli else None
+    puan = puan_gecmisi(gosterge_gecmisi(m), tp, profil)
+    getiri, en_kotu = vade_matrisleri(m, VADE)
+    hucre = ~np.isnan(puan) & ~np.isnan(getiri) & ~np.isnan(en_kotu)
+    beklenen = {e: int((hucre & (puan >= e)).sum()) for e in sonuc["min_puan"]}
+    assert dict(zip(sonuc["min_puan"], sonuc["Sinyal"])) == beklenen
+
+    # Temel veri yoksa teknik üst sınırın üstündeki eşikler atlanır
+    ust = profil.grup_maks["teknik"] + (profil.grup_maks["temel"] if temelli else 0)
+    assert set(sonuc["min_puan"]) == {e for e in izgara["min_puan"] if e <= ust}
@@ -0,0 +1,37 @@
+import pandas as pd
+
+import tarama
+from benchmark import sentetik_veri
+from gostergeler import hesapla_gostergeler
+from paralel import paralel_gostergeler
+from veri import CSVSaglayici, panel_kaydet
+
+
+def test_paralel_gostergeler_tek_surecle_ayni():
+    panel, _ = sentetik_veri(30, 260)
+    pd.testing.assert_frame_equal(paralel_gostergeler(panel, 2), hesapla_gostergeler(panel))
+
+
+def test_tarama_isci_verilince_havuzu_kullanir(tmp_path, monkeypatch):
+    panel, temel = sentetik_veri(30, 260)
+    panel_kaydet(panel, tmp_path, pd.DataFrame.from_dict(temel, orient="index"))
+    tickers = sorted(temel)
+    cagrilar = []
+
+    def izle(p, isci_sayisi):
+        cagrilar.append(isci_sayisi)
+        return paralel_gostergeler(p, isci_sayisi)
+
+    monkeypatch.setattr(tarama, "PARALEL_ESIK", 1)
+    monkeypatch.setattr(tarama, "paralel_gostergeler", izle)
+
+    def tara(isci):
+        df = tarama.tara(tickers, CSVSaglayici(tmp_path), period="max", isci_sayisi=isci,
+                         temel_onbellegi=False)
+        return df.sort_values("Ticker").reset_index(drop=True)
+
+    seri = tara(None)
+    assert cagrilar == [] and len(seri) > 20
+    paralel = tara(2)
+    assert cagrilar == [2]
+    pd.testing.assert_frame_equal(paralel, seri)
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark import puan_esligi, sentetik_veri, tekil_puanlama
+from gecmis import TaramaGecmisi
+from gostergeler import hesapla_gostergeler
+from profiller import profilleri_yukle
+from puanlama import budanacaklar, goruntu_metinleri, puan_tablosu_stili, puanla, renk_puan
+from tarama import sonuclari_birlestir
+from temel import temel_tablosu
+
+
+def _budanmis_tarama(min_puan: float = 70):
+    panel, info = sentetik_veri(60, 260)
+    g = hesapla_gostergeler(panel)
+    budanan = budanacaklar(g, min_puan)
+    # Budananların temel verisi hiç çekilmez
+    temel = temel_tablosu({t: v for t, v in info.items() if t not in budanan}, list(g.index))
+    return puanla(g, temel, budanan), budanan
+
+
+def test_budanan_satirlarin_temel_ve_toplami_bos():
+    df, budanan = _budanmis_tarama()
+    budandi = df["Budandı"].to_numpy(dtype=bool)
+    assert budanan and budandi.sum() == len(budanan)
+    assert df.loc[budandi, ["Temel", "Toplam"]].isna().all().all()
+    assert df.loc[~budandi, ["Temel", "Toplam"]].notna().all().all()
+    # Ortalama yalnızca puanlanan hisselerden
+    toplam = df["Toplam"].astype(float).to_numpy()
+    assert np.isclose(np.nanmean(toplam), toplam[~budandi].mean())
+
+
+def test_budanan_satirlar_gecmise_ve_siraya_girmez(tmp_path):
+    df, budanan = _budanmis_tarama()
+    gecmis = TaramaGecmisi(tmp_path / "gecmis.sqlite")
+    gecmis.ekle(df, "liste")
+    puanlanan = df.loc[~df["Budandı"], "Ticker"].astype(str).tolist()
+    assert gecmis.taramalar()["hisse"].tolist() == [len(puanlanan)]
+
+    kayit = gecmis.hisse_gecmisi(df["Ticker"].astype(str).tolist())
+    assert sorted(kayit["ticker"]) == sorted(puanlanan)
+    assert not set(kayit["ticker"]) & {t.replace(".IS", "") for t in budanan}
+    assert kayit.sort_values("sira")["sira"].tolist() == list(range(1, len(puanlanan) + 1))
+    assert kayit["toplam"].notna().all()
+
+
+@pytest.mark.parametrize("ad", list(profilleri_yukle()))
+def test_dizi_puanlama_skaler_kurallarla_ayni(ad):
+    profil = profilleri_yukle()[ad]
+    panel, info = sentetik_veri(60, 260)
+    g = hesapla_gostergeler(panel)
+    vektorel = puanla(g, temel_tablosu(info, list(g.index)), profil=profil)
+    referans = tekil_puanlama(g, info, profil)
+    assert len(referans) == len(vektorel)
+    assert puan_esligi(referans, vektorel, profil)["uyusmayan"] == 0
+
+
+def test_sonuc_tablosu_tipli_metinler_yalnizca_gosterimde():
+    panel, info = sentetik_veri(30, 260)
+    g = hesapla_gostergeler(panel)
+    df = puanla(g, temel_tablosu(info, list(g.index)))
+    assert df["Trend Geçti"].dtype == bool
+    assert isinstance(df["Sektör"].dtype, pd.CategoricalDtype)
+    assert {str(df[k].dtype) for k in df if k.startswith(("K_", "P_"))} == {"int8"}
+    assert str(df["Teknik"].dtype) == "int16" and str(df["Toplam"].dtype) == "Int16"
+
+    metin = goruntu_metinleri(df)
+    assert set(metin["Trend Geçti"]) <= {"✅ Evet", "❌ Hayır"}
+    assert df["Trend Geçti"].dtype == bool   # kopya: asıl tablo değişmez
+
+    # Akışla gelen parçalar birleşince sektör yine kategorik, sıra Toplam'a göre
+    birlesik = sonuclari_birlestir([df.iloc[:10], df.iloc[10:]])
+    assert isinstance(birlesik["Sektör"].dtype, pd.CategoricalDtype)
+    assert birlesik["Toplam"].is_monotonic_decreasing
+
+
+def test_renk_puan_numpy_tamsayi_ve_na():
+    assert renk_puan(np.int16(75)).startswith("background-color: #1a4a1a")
+    assert renk_puan(np.int16(55)).startswith("background-color: #3a3a00")
+    assert renk_puan(pd.NA) == ""
+
+
+@pytest.mark.filterwarnings("error::FutureWarning")
+def test_puan_tablosu_stili_uyarisiz_renklendirir():
+    panel, temel = sentetik_veri(10, 260)
+    df = puanla(hesapla_gostergeler(panel), temel_tablosu(temel))
+    assert "background-color" in puan_tablosu_stili(df).to_html()
@@ -0,0 +1,30 @@
+from temel import TTLOnbellek, TemelVeriToplayici, onbellek_yolu
+from veri import CSVSaglayici, YahooSaglayici
+
+
+def test_temel_onbellek_dosyasi_kaynaga_ozgu(tmp_path, monkeypatch, csv_kaynagi):
+    monkeypatch.chdir(tmp_path)
+    a, b = csv_kaynagi("a", pddd=1.0), csv_kaynagi("b", pddd=2.0)
+    assert TemelVeriToplayici(a).topla(["AAA.IS"])["AAA.IS"]["priceToBook"] == 1.0
+    assert TemelVeriToplayici(b).topla(["AAA.IS"])["AAA.IS"]["priceToBook"] == 2.0
+    assert onbellek_yolu(YahooSaglayici()) not in {onbellek_yolu(a), onbellek_yolu(b)}
+
+
+def test_onbelleksiz_toplayici_diski_okumaz(tmp_path, monkeypatch, csv_kaynagi):
+    monkeypatch.chdir(tmp_path)
+    a = csv_kaynagi("a", pddd=1.0)
+    TemelVeriToplayici(a).topla(["AAA.IS"])
+    (tmp_path / "a" / "temel.csv").write_text("Ticker,priceToBook\nAAA.IS,3.0\n")
+    taze = TemelVeriToplayici(CSVSaglayici(tmp_path / "a"), TTLOnbellek())
+    assert taze.topla(["AAA.IS"])["AAA.IS"]["priceToBook"] == 3.0
+
+
+def test_kayit_tek_ttl_ile_bayatlar():
+    onbellek = TTLOnbellek(ttl=100)
+    onbellek.yaz("AAA.IS", {"priceToBook": 1.0, "sector": "Sanayi"}, simdi=1000)
+    assert onbellek.gecerli_mi("AAA.IS", simdi=1099)
+    assert not onbellek.gecerli_mi("AAA.IS", simdi=1100)
+    assert onbellek.oku("AAA.IS") == {"priceToBook": 1.0, "sector": "Sanayi"}
+    # Eski alan bazında biçim yeniden çekilir
+    onbellek._veri["BBB.IS"] = {"sector": ["Sanayi", 1000]}
+    assert not onbellek.gecerli_mi("BBB.IS", simdi=1001)
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from benchmark import gosterge_esligi, sentetik_veri, tekil_dilim_gostergeleri
+from gostergeler import hesapla_gostergeler
+from veri import panel_olustur, panel_tickerlari
+from zaman_dilimi import ZAMAN_DILIMLERI, dilim_panelleri, dilim_tablosu, yeniden_ornekle
+
+
+def test_aylik_dilim_trend_kapisini_gecebilir():
+    # 5 yıllık günlük geçmiş (~60 aylık bar): MA200 olsaydı kapı hiç geçilemezdi
+    tarihler = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=260 * 5)
+    kapanis = 100 * np.exp(0.001 * np.arange(len(tarihler)))
+    df = pd.DataFrame({"Open": kapanis, "High": kapanis * 1.01, "Low": kapanis * 0.99,
+                       "Close": kapanis, "Volume": 1e6}, index=tarihler)
+    tablo = dilim_tablosu(dilim_panelleri(panel_olustur({"AAA.IS": df}), None, ["AAA.IS"], ["aylik"]))
+    assert tablo.loc["AAA", "Trend_aylik"]
+    assert tablo.loc["AAA", "Teknik_aylik"] > 0
+
+
+def test_haftalik_ornekleme_hisse_bazli_referansla_ayni():
+    # Kısa geçmişli ve işlem boşluklu hisseler dahil
+    panel, _ = sentetik_veri(40, 260 * 5)
+    kural = ZAMAN_DILIMLERI["haftalik"]["kural"]
+    haftalik = yeniden_ornekle(panel, kural)
+    assert (haftalik.index.dayofweek == 4).all()
+    referans = tekil_dilim_gostergeleri(panel, panel_tickerlari(panel), kural)
+    assert gosterge_esligi(referans, hesapla_gostergeler(haftalik))["uyusmayan"] == 0
@@ -0,0 +1,204 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          veri.py - Fiyat / Temel Veri Sağlayıcıları                          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Tarama kodu veriyi doğrudan yfinance'ten değil bir `VeriSaglayici` üzerinden
+alır. Fiyatlar tek seferde, geniş bir "tarih × ticker" paneli olarak gelir:
+sütunlar (alan, ticker) çok seviyeli indekstir, ör. panel["Close"] doğrudan
+tüm hisselerin kapanış matrisidir.
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ALANLAR = ["Open", "High", "Low", "Close", "Volume"]
+
+TEMEL_ALANLAR = [
+    "priceToBook", "trailingPE", "sector",
+    "earningsQuarterlyGrowth", "earningsGrowth",
+]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PANEL YARDIMCILARI
+# ─────────────────────────────────────────────────────────────────────────────
+
+def bos_panel() -> pd.DataFrame:
+    kolonlar = pd.MultiIndex.from_arrays([[], []], names=["Alan", "Ticker"])
+    return pd.DataFrame(columns=kolonlar, dtype=float)
+
+
+def panel_olustur(hisseler: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Ticker → OHLCV sözlüğünden geniş (tarih × ticker) panel kurar."""
+    if not hisseler:
+        return bos_panel()
+    panel = pd.concat(
+        {t: df[ALANLAR] for t, df in hisseler.items()},
+        axis=1, names=["Ticker", "Alan"],
+    )
+    return panel.swaplevel(axis=1).sort_index(axis=1).sort_index()
+
+
+def hisse_verisi(panel: pd.DataFrame, ticker: str) -> pd.DataFrame | None:
+    """Panelden tek hissenin OHLCV tablosunu, yalnızca işlem gördüğü günlerle döndürür."""
+    if ticker not in panel.columns.get_level_values("Ticker"):
+        return None
+    df = panel.xs(ticker, axis=1, level="Ticker")
+    return df[ALANLAR].dropna(subset=["Close"])
+
+
+def panel_tickerlari(panel: pd.DataFrame) -> list[str]:
+    return list(dict.fromkeys(panel.columns.get_level_values("Ticker")))
+
+
+def panel_kaydet(panel: pd.DataFrame, dizin: str | Path, temel: pd.DataFrame | None = None,
+                 interval: str = "1d"):
+    """Paneli `CSVSaglayici`nın okuyabileceği fixture dizinine yazar."""
+    dizin = Path(dizin) if interval == "1d" else Path(dizin) / interval
+    dizin.mkdir(parents=True, exist_ok=True)
+    for ticker in panel_tickerlari(panel):
+        df = hisse_verisi(panel, ticker)
+        df.to_csv(dizin / f"{ticker}.csv", index_label="Date")
+    if temel is not None:
+        temel.to_csv(dizin / "temel.csv", index_label="Ticker")
+
+
+def period_baslangici(son_tarih: pd.Timestamp, period: str) -> pd.Timestamp | None:
+    if period == "max":
+        return None
+    if period.endswith("mo"):
+        return son_tarih - pd.DateOffset(months=int(period[:-2]))
+    birimler = {"d": "days", "wk": "weeks", "y": "years"}
+    for ek, birim in birimler.items():
+        if period.endswith(ek):
+            return son_tarih - pd.DateOffset(**{birim: int(period[:-len(ek)])})
+    raise ValueError(f"Geçersiz period: {period}")
+
+
+def donem_kes(panel: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Daha uzun dönemli panelden her hissenin kendi son barından geriye
+    `period`ı bırakır; sağlayıcıların `period` kesimiyle aynı paneli verir.
+    """
+    if panel.empty or period == "max":
+        return panel
+    var = panel.notna().T.groupby(level="Ticker", sort=False).any().T
+    son = var.iloc[::-1].idxmax()
+    ilk = son.map({t: period_baslangici(t, period) for t in son.unique()})
+    tutulan = pd.DataFrame(panel.index.to_numpy()[:, None] > ilk.to_numpy()[None, :],
+                           index=panel.index, columns=ilk.index)
+    maske = tutulan.reindex(columns=panel.columns.get_level_values("Ticker")).to_numpy()
+    return panel.where(maske).dropna(how="all")
+
+
+def kaynak_eki(saglayici: "VeriSaglayici") -> str:
+    """Önbellek yollarında kaynağı ayıran kısa ek (`kimlik` özeti)."""
+    return hashlib.sha1(saglayici.kimlik.encode()).hexdigest()[:12]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SAĞLAYICI ARAYÜZÜ
+# ─────────────────────────────────────────────────────────────────────────────
+
+class VeriSaglayici:
+    """Tüm veri kaynaklarının ortak arayüzü."""
+
+    # Ağ üzerinden çalışan sağlayıcılar için True (istek kısıtlaması gerekir)
+    ag_gerektirir = False
+
+    @property
+    def kimlik(self) -> str:
+        """Verinin geldiği kaynak; farklı kaynaklar önbellek paylaşmaz."""
+        return type(self).__name__
+
+    def fiyat_paneli(self, tickers: list[str], period: str = "1y",
+                     interval: str = "1d", baslangic=None) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def temel_veri(self, ticker: str) -> dict:
+        raise NotImplementedError
+
+
+class YahooSaglayici(VeriSaglayici):
+    """Tüm listeyi tek bir `yf.download` çağrısıyla indirir."""
+
+    ag_gerektirir = True
+
+    def fiyat_paneli(self, tickers, period="1y", interval="1d", baslangic=None):
+        if not tickers:
+            return bos_panel()
+        import yfinance as yf  # ağır içe aktarma: yalnızca gerçekten indirilirken
+        ham = yf.download(
+            list(tickers),
+            period=None if baslangic is not None else period,
+            start=baslangic,
+            interval=interval,
+            group_by="column",
+            auto_adjust=True,
+            actions=False,
+            threads=True,
+            progress=False,
+        )
+        if ham is None or ham.empty:
+            return bos_panel()
+        if not isinstance(ham.columns, pd.MultiIndex):
+            ham.columns = pd.MultiIndex.from_product([ham.columns, list(tickers)])
+        ham.columns = ham.columns.set_names(["Alan", "Ticker"])
+        # İndirilemeyen hisseler tamamen boş sütun olarak gelir
+        ham = ham.dropna(axis=1, how="all")
+        return ham[[a for a in ALANLAR if a in ham.columns.get_level_values("Alan")]]
+
+    def temel_veri(self, ticker):
+        import yfinance as yf
+        return yf.Ticker(ticker).info
+
+
+class CSVSaglayici(VeriSaglayici):
+    """
+    Çevrimdışı fixture sağlayıcısı. Dizinde her hisse için `<TICKER>.csv`
+    (Date, Open, High, Low, Close, Volume) ve isteğe bağlı `temel.csv`
+    (Ticker + TEMEL_ALANLAR) beklenir. Günlük dışı barlar `<interval>/`
+    alt dizinindedir (ör. `1h/THYAO.IS.csv`).
+    """
+
+    def __init__(self, dizin: str | Path):
+        self.dizin = Path(dizin)
+        self._temel = None
+
+    @property
+    def kimlik(self) -> str:
+        return f"{type(self).__name__}:{self.dizin.resolve()}"
+
+    def fiyat_paneli(self, tickers, period="1y", interval="1d", baslangic=None):
+        hisseler = {}
+        dizin = self.dizin if interval == "1d" else self.dizin / interval
+        for ticker in tickers:
+            yol = dizin / f"{ticker}.csv"
+            if not yol.exists():
+                continue
+            df = pd.read_csv(yol, index_col="Date", parse_dates=True)
+            if df.empty:
+                continue
+            if baslangic is not None:
+                df = df[df.index >= pd.Timestamp(baslangic)]
+            else:
+                ilk = period_baslangici(df.index[-1], period)
+                if ilk is not None:
+                    df = df[df.index > ilk]
+            hisseler[ticker] = df
+        return panel_olustur(hisseler)
+
+    def temel_veri(self, ticker):
+        if self._temel is None:
+            yol = self.dizin / "temel.csv"
+            self._temel = (pd.read_csv(yol, index_col="Ticker")
+                           if yol.exists() else pd.DataFrame(columns=TEMEL_ALANLAR))
+        if ticker not in self._temel.index:
+            return {}
+        satir = self._temel.loc[ticker]
+        return {k: v for k, v in satir.items() if not (isinstance(v, float) and np.isnan(v))}
@@ -0,0 +1,123 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║          BIST 500 - SWING TRADE TARAMA VE PUANLAMA SİSTEMİ                   ║
+║          zaman_dilimi.py - Çoklu Zaman Dilimi (Yeniden Örnekleme)            ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Haftalık ve aylık barlar zaten indirilmiş günlük panelden yeniden örneklenir;
+saatlik barlar tüm liste için tek bir gün içi istekle gelir. Her dilimde aynı
+gösterge ve puanlama kodu çalışır ve sonuç tablosuna dilim başına üç sütun
+eklenir: teknik puan (`Teknik_<dilim>`), kapılardan geçiş (`Trend_<dilim>`) ve
+günlük kapıyla uyum (`Uyum_<dilim>`). `Uyum` tüm dilimlerde geçişi gösterir.
+
+Yeniden örneklenen dilimler daha uzun günlük geçmiş ister (haftalık MA200 için
+~4 yıl); tarama günlük veriyi bir kez bu uzunlukta çeker, günlük göstergeler
+yine kendi `period`undan (`donem_kes`) hesaplanır. Böylece bir dilim eklemek
+hisse başına yeni bir ağ isteği değil, bellekteki veri üzerinde hesaplamadır.
+
+Trend kapısının uzun ortalaması kadar bar olmayan dilimde kapı geçilemez.
+Aylık barda MA200 ~17 yıl isteyeceği için dilim kendi ortalamalarını (`ma`:
+10 / 40 ay) kullanır; puanlanabilmek için yine en az 50 bar (~4 yıl) gerekir.
+"""
+
+import pandas as pd
+
+from veri import VeriSaglayici, bos_panel, period_baslangici
+from gostergeler import TREND_MA, hesapla_gostergeler
+from puanlama import teknik_tablosu
+from profiller import PuanProfili
+
+# `kural` olan dilimler günlük panelden örneklenir (`period`: gereken günlük
+# geçmiş); olmayanlar kendi `interval`iyle tek istekte çekilir. `ma` trend
+# kapısının (kısa, uzun) ortalamalarıdır (yoksa günlükteki 50 / 200).
+ZAMAN_DILIMLERI = {
+    "saatlik":  {"baslik": "Saatlik",  "interval": "1h", "period": "6mo"},
+    "haftalik": {"baslik": "Haftalık", "kural": "W-FRI", "period": "5y"},
+    "aylik":    {"baslik": "Aylık",    "kural": "ME", "period": "5y", "ma": (10, 40)},
+}
+
+# OHLCV alanlarının bar içindeki toplanışı
+TOPLAMA = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+
+def yeniden_ornekle(panel: pd.DataFrame, kural: str) -> pd.DataFrame:
+    """Günlük paneli `kural` frekanslı barlara toplar; hissenin işlem görmediği barlar boş kalır."""
+    if panel.empty:
+        return panel
+    alanlar = {}
+    for alan, islem in TOPLAMA.items():
+        if alan not in panel.columns.get_level_values("Alan"):
+            continue
+        ornek = panel[alan].resample(kural)
+        # Boş bar hacmi 0 değil NaN olmalı: işlem görmeyen hisse bar almaz
+        alanlar[alan] = ornek.sum(min_count=1) if islem == "sum" else getattr(ornek, islem)()
+    return pd.concat(alanlar, axis=1, names=["Alan", "Ticker"]).dropna(how="all")
+
+
+def gunluk_period(period: str, dilimler) -> str:
+    """Günlük istek için `period` ile örneklenen dilimlerin istediği en uzun dönem."""
+    bugun = pd.Timestamp.today().normalize()
+    adaylar = [period, *(ZAMAN_DILIMLERI[d]["period"] for d in dilimler
+                         if "kural" in ZAMAN_DILIMLERI[d])]
+    return min(adaylar, key=lambda p: period_baslangici(bugun, p) or pd.Timestamp.min)
+
+
+def dilim_panelleri(gunluk: pd.DataFrame, saglayici: VeriSaglayici, tickers: list[str],
+                    dilimler) -> dict[str, pd.DataFrame]:
+    """Her dilimin paneli: örneklenenler bellekten, diğerleri dilim başına tek istekle."""
+    paneller = {}
+    for d in dilimler:
+        tanim = ZAMAN_DILIMLERI[d]
+        if "kural" in tanim:
+            paneller[d] = yeniden_ornekle(gunluk, tanim["kural"])
+        elif tickers:
+            paneller[d] = saglayici.fiyat_paneli(tickers, period=tanim["period"],
+                                                 interval=tanim["interval"])
+        else:
+            paneller[d] = bos_panel()
+    return paneller
+
+
+def dilim_tablosu(paneller: dict[str, pd.DataFrame],
+                  profil: PuanProfili | None = None) -> pd.DataFrame:
+    """
+    Dilim başına teknik puan ve kapı geçişi; indeks sonuç tablosundaki
+    Ticker (".IS" soneki yok). Puanlanamayan hissenin puanı boş (NA) kalır.
+    """
+    tablolar = []
+    for d, panel in paneller.items():
+        # Dilimde hiç veri yoksa (ör. gün içi istek boş döndü) sütunlar yine eklenir
+        ma = ZAMAN_DILIMLERI[d].get("ma", TREND_MA)
+        t = (teknik_tablosu(hesapla_gostergeler(panel, ma=ma), profil) if not panel.empty
+             else pd.DataFrame({"Teknik": [], "Geçti": []}, index=pd.Index([], dtype=str)))
+        tablolar.append(pd.DataFrame({
+            f"Teknik_{d}": pd.array(t["Teknik"], dtype="Int16"),
+            f"Trend_{d}": t["Geçti"].to_numpy(),
+        }, index=t.index.str.replace(".IS", "", regex=False)))
+    return pd.concat(tablolar, axis=1) if tablolar else pd.DataFrame()
+
+
+def dilim_kolonlari_ekle(sonuc: pd.DataFrame, tablo: pd.DataFrame) -> pd.DataFrame:
+    """`puanla` çıktısına dilim sütunlarını ve günlük kapıyla uyum bayraklarını ekler."""
+    if tablo.empty:
+        return sonuc
+    t = tablo.reindex(sonuc["Ticker"].astype(str).to_numpy())
+    gunluk = sonuc["Trend Geçti"].to_numpy(dtype=bool)
+    uyum = gunluk.copy()
+    for k in t.columns:
+        if k.startswith("Teknik_"):
+            sonuc[k] = t[k].array
+        else:
+            gecti = t[k].fillna(False).to_numpy(dtype=bool)
+            d = k.removeprefix("Trend_")
+            sonuc[k] = gecti
+            sonuc[f"Uyum_{d}"] = gunluk & gecti
+            uyum &= gecti
+    sonuc["Uyum"] = uyum
+    return sonuc
+
+
+def dilim_kolonlari(df: pd.DataFrame) -> list[str]:
+    """Tablodaki zaman dilimi sütunları, dilim sırasıyla."""
+    return [k for d in ZAMAN_DILIMLERI for k in (f"Teknik_{d}", f"Trend_{d}", f"Uyum_{d}")
+            if k in df.columns] + (["Uyum"] if "Uyum" in df.columns else [])